@@ -1,5 +1,12 @@
 import inspect
 import logging
+import re
+import threading
+import weakref
+from copy import copy
+from bisect import bisect_left, bisect_right
+from collections import namedtuple, OrderedDict
+from time import monotonic
 from pydoc import locate
 try:
     from collections.abc import Iterable
@@ -8,10 +15,44 @@ except ImportError:
 
 from warnings import warn
 
+import django
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
 logger = logging.getLogger(__name__)
 
+# Django < 3.2 does not pick up the AppConfig on its own
+if django.VERSION < (3, 2):
+    default_app_config = 'django_pluggableappsettings.apps.PluggableAppSettingsConfig'
+
 NOT_SET_VALUE = object()
 
+# re.Pattern is only available from Python 3.7 on
+PATTERN_TYPE = type(re.compile(''))
+
+# All AppSettings classes that have been created so far
+_registry = weakref.WeakSet()
+
+# Guards all changes of the loaded values and of the registry. Reading an already loaded value does not need the lock,
+# so reads stay lock free, also on Python builds without a GIL. The lock is only held briefly and never while user code,
+# e.g. the callable of a CalledOnceSetting, runs. Each setting is loaded under a lock of its own instead.
+_resolution_lock = threading.RLock()
+
+# The AppSettings classes whose fingerprint changed since the global fingerprint was last updated
+_changed_fingerprints = weakref.WeakSet()
+
+# Called with the AppSettings class, the attribute name and the setting instead of loading the value directly, if set.
+# Set by django_pluggableappsettings.tracing.
+_tracer = None
+
+
+def get_registered_appsettings():
+    '''
+    :return: A list of all AppSettings classes that have been created so far
+    '''
+    with _resolution_lock:
+        return list(_registry)
+
 class SettingsMetaClass(type):
     '''
     Metaclass that overwrites default class attribute access to load the functions on demand
@@ -20,7 +61,96 @@ class SettingsMetaClass(type):
     def __init__(self, *args, **kwargs):
         super(SettingsMetaClass, self).__init__(*args, **kwargs)
         self._values = {}
+        # the locks held while loading each setting and the number of times each setting was invalidated or replaced
+        self._load_locks = {}
+        self._generations = {}
+        self._settings = self._collect_settings()
+        for name, setting in self._settings.items():
+            setting.compile(name)
+        self._dependents = {}
+        # the digests of the values that are part of the fingerprint and their combination
+        self._digests = {}
+        self._digest = 0
+        with _resolution_lock:
+            self._register_dependencies()
+            _registry.add(self)
+            _changed_fingerprints.add(self)
+
+    def _collect_settings(self):
+        '''
+        :return: A dict of all settings declared on this class or one of its base classes, keyed by attribute name.
+            Settings inherited from a base class are copied, as each class loads its own value for them.
+        '''
+        settings = {}
+        for klass in reversed(self.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, Setting):
+                    settings[name] = value
+                elif name in settings:
+                    # A subclass replaced the setting by something else
+                    del settings[name]
+        own = vars(self)
+        for name, setting in settings.items():
+            if own.get(name) is not setting:
+                settings[name] = setting.clone()
+        return settings
+
+    def _register_dependencies(self):
+        '''
+        Registers the computed settings of this class as dependents of their inputs, so that they can be invalidated
+        whenever one of their inputs changes.
+        :except: ValueError if an input is not a setting or if the inputs contain a cycle
+        '''
+        for name, setting in self._settings.items():
+            if not isinstance(setting, ComputedSetting):
+                continue
+            for owner, dependency in setting.get_dependencies(self):
+                if dependency not in owner._settings:
+                    raise ValueError('The setting %s depends on %s which is not a setting of %s.' % (
+                        name, dependency, owner.__name__
+                    ))
+
+        cycle = self._find_dependency_cycle()
+        if cycle:
+            raise ValueError('The settings of %s contain a dependency cycle: %s' % (
+                self.__name__, ' -> '.join('%s.%s' % (owner.__name__, name) for owner, name in cycle)
+            ))
 
+        for name, setting in self._settings.items():
+            if isinstance(setting, ComputedSetting):
+                for owner, dependency in setting.get_dependencies(self):
+                    owner._dependents.setdefault(dependency, set()).add((self, name))
+
+    def _find_dependency_cycle(self):
+        '''
+        :return: The first dependency cycle found among the computed settings of this class as list of
+            (AppSettings, name) tuples or None if there is none.
+        '''
+        visiting = []
+        done = set()
+
+        def visit(node):
+            if node in done:
+                return None
+            if node in visiting:
+                return visiting[visiting.index(node):] + [node]
+            visiting.append(node)
+            owner, name = node
+            setting = owner._settings.get(name)
+            if isinstance(setting, ComputedSetting):
+                for dependency in setting.get_dependencies(owner):
+                    cycle = visit(dependency)
+                    if cycle:
+                        return cycle
+            visiting.pop()
+            done.add(node)
+            return None
+
+        for name in self._settings:
+            cycle = visit((self, name))
+            if cycle:
+                return cycle
+        return None
 
     def __getattribute__(self, item_name):
         '''
@@ -47,45 +177,271 @@ class SettingsMetaClass(type):
             return item
 
         # we store all already loaded values in the _values dict, so we only have to load them once
-        _values = super(SettingsMetaClass, self).__getattribute__('_values')
+        entry = super(SettingsMetaClass, self).__getattribute__('_values').get(item_name)
 
-        # If it is not in _values, we need to load it
-        if not item_name in _values:
-            name_in_settings_py = item.get_settings_name() or item_name
+        # If it is not in _values, we need to load it into the setting of this class, as inherited settings are copies
+        if entry is None:
+            entry = self._load(item_name, self._settings.get(item_name, item))
 
-            # load the value or one of its aliases from the settings or none if none exists
-            from django.conf import settings
+        return entry.value()
+
+    def _load(self, item_name, item):
+        '''
+        Loads the value of a setting and stores it in the _values dict. Each setting is loaded under a lock of its own,
+        so that it is only loaded once, even if it is accessed by multiple threads at the same time. The global
+        resolution lock is only held to store the value, so slow callables do not block the loading of other settings
+        and callables can read other settings, also from other threads.
+        :param item_name: The attribute name of the setting
+        :param item: The setting
+        :return: The entry of the _values dict for the setting
+        '''
+        self._prepare_sources()
+        with self._get_load_lock(item_name):
+            with _resolution_lock:
+                # Another thread might have loaded the value while we were waiting for the lock
+                entry = self._values.get(item_name)
+                if entry is not None:
+                    return entry
+                generation = self._generations.get(item_name, 0)
+
+            tracer = _tracer
+            if tracer is not None:
+                tracer(self, item_name, item)
+            else:
+                settings_value = self._lookup(item_name, item)[0]
+                # Pass the setting's value to the setting's class which can perform changes and then safe the value
+                # so that it can be retrieved by the value() method
+                item.get(item_name, settings_value)
+
+            with _resolution_lock:
+                if self._generations.get(item_name, 0) != generation:
+                    # The setting was invalidated or replaced while it was loaded, e.g. because one of the inputs of a
+                    # computed setting changed, so the value is not stored and loaded again on the next access
+                    entry = self._values.get(item_name)
+                    return item if entry is None else entry
+                # Store the value in the dict so we only have to load it once. Only now the value becomes visible to
+                # readers that do not hold the lock.
+                self._values[item_name] = item
+                return item
+
+    def _get_load_lock(self, name):
+        '''
+        :param name: The attribute name of a setting
+        :return: The lock that is held while the setting is loaded. It is reentrant, so that a setting whose loading
+            accesses the setting again fails with a RecursionError as it would without the lock.
+        '''
+        load_lock = self._load_locks.get(name)
+        if load_lock is None:
+            with _resolution_lock:
+                load_lock = self._load_locks.setdefault(name, threading.RLock())
+        return load_lock
+
+    def _prepare_sources(self):
+        '''
+        Calls the prepare() method of the sources of this class that provide one
+        '''
+        for source in self._sources:
+            prepare = getattr(source, 'prepare', None)
+            if prepare is not None:
+                prepare()
+
+    def _lookup(self, item_name, item):
+        '''
+        Looks up the value of a setting in the sources of the class, the settings.py or computes it
+        :param item_name: The attribute name of the setting
+        :param item: The setting
+        :return: A tuple of the value or NOT_SET_VALUE if it was not found, the origin of the value (the source object,
+            'settings' or 'computed') or None if it was not found, and the name it was found by in the settings.py
+        '''
+        # the additional sources of the class take precedence over the settings.py
+        for source in self._sources:
+            settings_value = source.get_value(self, item_name)
+            if settings_value != NOT_SET_VALUE:
+                return settings_value, source, None
+
+        # load the value or one of its aliases from the settings or none if none exists
+        from django.conf import settings
+        for name_in_settings_py in [item.get_settings_name() or item_name] + list(item.get_aliases()):
             settings_value = getattr(settings, name_in_settings_py, NOT_SET_VALUE)
+            if settings_value != NOT_SET_VALUE:
+                return settings_value, 'settings', name_in_settings_py
 
-            for alias in item.get_aliases():
-                if settings_value != NOT_SET_VALUE:
-                    break
-                settings_value = getattr(settings, alias, NOT_SET_VALUE)
+        # Computed settings that are not set explicitly are computed from their inputs
+        if isinstance(item, ComputedSetting):
+            return item.compute_value(self), 'computed', None
+        return NOT_SET_VALUE, None, None
 
-            # Pass the setting's value to the setting's class which can perform changes and then safe the value
-            # so that it can be retrieved by the value() method
-            item.get(item_name, settings_value)
+    def invalidate(self, *names):
+        '''
+        Drops the loaded values of the given settings (or of all settings if no name is given) so that they are loaded
+        again on their next access. The computed settings depending on them are invalidated as well.
+        :param names: The attribute names of the settings to invalidate
+        '''
+        with _resolution_lock:
+            if not names:
+                # settings that are being loaded are invalidated as well
+                names = list(set(self._settings) | set(self._values))
+            for name in names:
+                self._discard(name)
+            self._invalidate_dependents(names)
 
-            # Store the value in the dict so we only have to load it once
-            _values[item_name] = item
+    def _discard(self, name):
+        '''
+        Drops the loaded value of a setting and resets the setting if it is the one declared on this class. A value that
+        is being loaded at the same time is not stored.
+        :param name: The attribute name of the setting
+        '''
+        self._generations[name] = self._generations.get(name, 0) + 1
+        entry = self._values.pop(name, None)
+        self._forget_digest(name)
+        if entry is not None and entry is self._settings.get(name):
+            entry.reset()
 
-        return _values[item_name].value()
+    def _set_entry(self, name, entry):
+        '''
+        Replaces the loaded value of a setting, e.g. to override it
+        :param name: The attribute name of the setting
+        :param entry: The setting to store for the name. Its value has to be loaded already.
+        '''
+        with _resolution_lock:
+            self._generations[name] = self._generations.get(name, 0) + 1
+            self._values[name] = entry
+            self._forget_digest(name)
 
-class AppSettings(object, metaclass=SettingsMetaClass):
+    def fingerprint(self):
+        '''
+        :return: A stable hex digest of the values of all settings of this class. Classes are represented by their
+            dotted path. All settings are loaded on the first call. Afterwards the fingerprint is updated incrementally
+            when values are invalidated or overridden, so calling it is cheap.
+        '''
+        while len(self._digests) != len(self._settings):
+            self._update_fingerprint()
+        return '%064x' % self._digest
+
+    def _update_fingerprint(self):
+        '''
+        Adds the digests of all values that are not part of the fingerprint yet
+        '''
+        from django_pluggableappsettings.fingerprint import digest
+        # the values are loaded without holding the lock, as loading them runs the callables of the settings
+        pending = {}
+        for name, setting in self._settings.items():
+            if name in self._digests:
+                continue
+            entry = self._values.get(name)
+            if entry is None:
+                entry = self._load(name, setting)
+            pending[name] = (entry, digest(name, entry.cached_value()))
+
+        with _resolution_lock:
+            digests = self._digests
+            for name, (entry, value_digest) in pending.items():
+                # values that were invalidated or replaced in the meantime are added on the next call
+                if name in digests or self._values.get(name) is not entry:
+                    continue
+                # update the combination first, so that lock free readers never see a complete but outdated digest
+                self._digest ^= value_digest
+                digests[name] = value_digest
+
+    def _forget_digest(self, name):
+        '''
+        Removes the digest of a value from the fingerprint, e.g. because it has been invalidated
+        :param name: The attribute name of the setting
+        '''
+        value_digest = self._digests.pop(name, None)
+        if value_digest is not None:
+            self._digest ^= value_digest
+            _changed_fingerprints.add(self)
+
+    def _invalidate_dependents(self, names):
+        '''
+        Drops the loaded values of all computed settings that (transitively) depend on the given settings. Settings
+        that have been replaced, e.g. by override_appsettings, are left untouched.
+        :param names: The attribute names of the settings whose dependents should be invalidated
+        '''
+        with _resolution_lock:
+            pending = [(self, name) for name in names]
+            while pending:
+                owner, name = pending.pop()
+                for dependent in owner._dependents.get(name, ()):
+                    dependent_owner, dependent_name = dependent
+                    entry = dependent_owner._values.get(dependent_name)
+                    # dependents that are not loaded are discarded as well, as they might be loaded at the moment
+                    if entry is None or entry is dependent_owner._settings[dependent_name]:
+                        dependent_owner._discard(dependent_name)
+                        pending.append(dependent)
+
+    def _setting_changed(self, setting_name):
+        '''
+        Invalidates all loaded settings that are looked up by the given name in the settings.py
+        :param setting_name: The name of the changed setting in the settings.py
+        '''
+        _values = self._values
+        changed = []
+        for name, setting in self._settings.items():
+            entry = _values.get(name)
+            if entry is not None and entry is not setting:
+                # replaced, e.g. by override_appsettings. Settings that are not loaded are invalidated, as they might
+                # be loaded at the moment.
+                continue
+            if setting_name == (setting.get_settings_name() or name) or setting_name in setting.get_aliases():
+                changed.append(name)
+        if changed:
+            self.invalidate(*changed)
+
+
+@receiver(setting_changed)
+def _invalidate_changed_setting(setting, **kwargs):
+    '''
+    Makes sure that AppSettings do not hold stale values if a setting is changed, e.g. by override_settings
+    '''
+    for appsettings in get_registered_appsettings():
+        appsettings._setting_changed(setting)
+
+
+def _compile_stages(setting_name, stages):
     """
-    Class that has the SettingsMetaClass ass metaclass. This is the base class for AppSettings classes
+    :param setting_name: the name of the setting the stages belong to
+    :param stages: a list of stages, i.e. callables that take the setting's name and a value and return the new value
+    :return: a single function that passes a value through all stages or None if there are no stages
     """
-    pass
+    if not stages:
+        return None
+    if len(stages) == 1:
+        stage = stages[0]
+        return lambda value: stage(setting_name, value)
+    stages = tuple(stages)
+
+    def run(value):
+        for stage in stages:
+            value = stage(setting_name, value)
+        return value
+    return run
+
+
+# The call policies of a setting
+CALLED_ONCE = 'once'
+CALLED_EACH_TIME = 'each_time'
 
 
 class Setting(object):
     """
     Baseclass for all settings types. Takes a default value as argument.
     Returns the settings value if it is not None or the default value instead.
+
+    The value passes a pipeline of stages: source (settings.py or default) -> call policy -> cast -> validate ->
+    post-process. Subclasses customize the stages by overwriting the _load_value, _cast, _validate and _post_process
+    methods. The pipeline is compiled into flat functions once the setting is assigned to an AppSettings class.
     """
     _value = NOT_SET_VALUE
+    _name = None
+    _call_policy = None
+    _force_callable = False
+    _compiled_get = None
+    _compiled_value = None
 
-    def __init__(self, default_value=NOT_SET_VALUE, settings_name=None, aliases=[], ):
+    def __init__(self, default_value=NOT_SET_VALUE, settings_name=None, aliases=[], default_factory=None,
+                 call_policy=NOT_SET_VALUE, validators=(), post_process=None):
         """
         :param default_value: default value for this setting
         :param settings_name: Normally the user defined value for a setting is searched in the settings.py by the
@@ -93,9 +449,23 @@ class Setting(object):
         is looked for instead (optional)
         :param aliases: Additional, optional, names which are looked for in the settings.py if the main setting name can
         not be found. (optional)
+        :param default_factory: A callable without arguments that returns the default value. It is only called if the
+        setting is not defined in the settings.py, so expensive default values are only created if needed. Can not be
+        combined with default_value. (optional)
+        :param call_policy: Whether a callable value is called: None for never, CALLED_ONCE to call it once when the
+        setting is loaded or CALLED_EACH_TIME to call it on each access. Casting and validation are applied to the
+        return value of the call. Defaults to the policy of the setting type. (optional)
+        :param validators: Callables that are called with the value and raise a ValueError if it is invalid. (optional)
+        :param post_process: A callable that is called with the validated value and returns the final value. (optional)
         :return:
         """
+        if default_factory is not None:
+            if default_value != NOT_SET_VALUE:
+                raise ValueError('Only one of default_value and default_factory can be given.')
+            if not hasattr(default_factory, '__call__'):
+                raise ValueError('The default_factory has to be a callable.')
         self.default_value = default_value
+        self._default_factory = default_factory
 
         self._settings_name = settings_name
 
@@ -107,6 +477,16 @@ class Setting(object):
         else:
             self._aliases = []
 
+        if call_policy != NOT_SET_VALUE:
+            if call_policy not in (None, CALLED_ONCE, CALLED_EACH_TIME):
+                raise ValueError('The call_policy has to be None, CALLED_ONCE or CALLED_EACH_TIME.')
+            self._call_policy = call_policy
+
+        self._validators = list(validators)
+        if post_process is not None and not hasattr(post_process, '__call__'):
+            raise ValueError('The post_process argument has to be a callable.')
+        self._post_processor = post_process
+
     def get_settings_name(self):
         return self._settings_name
 
@@ -117,14 +497,17 @@ class Setting(object):
         """
         return self._aliases
 
-    def _get(self, setting_name, setting_value):
+    def _load_value(self, setting_name, setting_value):
         """
+        The source stage
         :param setting_name: the name of this setting. Needed for nice verbose output on errors
-        :param setting_value: The value of the setting in settings.py. Pass None if the parameter is not set
-        :return: setting_value if it is not None, else the default value. If that is also not set, an Attribute error
+        :param setting_value: The value of the setting in settings.py. Pass NOT_SET_VALUE if the parameter is not set
+        :return: setting_value if it is set, else the default value. If that is also not set, an Attribute error
             is raised
         """
         if setting_value == NOT_SET_VALUE:
+            if self._default_factory is not None:
+                return self._default_factory()
             if self.default_value == NOT_SET_VALUE:
                 raise AttributeError(
                     'The setting %s is not defined in your settings.py and no default value is provided.' % (
@@ -134,17 +517,166 @@ class Setting(object):
             return self.default_value
         return setting_value
 
+    def _check_callable(self, setting_name, value):
+        """
+        Verifies that the value is callable. Only part of the pipeline if _force_callable is set.
+        """
+        if not hasattr(value, '__call__'):
+            raise ValueError('The value for the setting %s has to be a callable.' % setting_name)
+        return value
+
+    def _call_value(self, setting_name, value):
+        """
+        The call policy stage
+        :return: the value or the return value of a call to value if the value has the '__call__' attribute
+        """
+        if hasattr(value, '__call__'):
+            return value()
+        return value
+
+    def _cast(self, setting_name, value):
+        """
+        The cast stage. Returns the value unchanged and is meant to be overwritten by subclasses.
+        :return: the casted value
+        :except: ValueError if the value can not be casted
+        """
+        return value
+
+    def _validate(self, setting_name, value):
+        """
+        The validation stage which runs all validators passed to the setting
+        :return: the value
+        :except: ValueError if the value is invalid
+        """
+        for validator in self._validators:
+            validator(value)
+        return value
+
+    def _post_process(self, setting_name, value):
+        """
+        The post-processing stage which applies the post_process function passed to the setting
+        :return: the final value
+        """
+        if self._post_processor is not None:
+            return self._post_processor(value)
+        return value
+
+    def _is_overwritten(self, method_name):
+        """
+        :return: True if the given method is overwritten by the type of this setting
+        """
+        return getattr(type(self), method_name) is not getattr(Setting, method_name)
+
+    def get_pipeline(self):
+        """
+        :return: A tuple of two lists of stages. The stages of the first list are applied once when the setting is
+            loaded, the ones of the second list each time the value is accessed. Each stage is a callable that takes
+            the setting's name and the value and returns the new value. Stages without effect are left out.
+        """
+        load_stages = [self._load_value]
+        if self._force_callable:
+            load_stages.append(self._check_callable)
+
+        stages = []
+        if self._call_policy is not None:
+            stages.append(self._call_value)
+        if self._is_overwritten('_cast'):
+            stages.append(self._cast)
+        if self._validators or self._is_overwritten('_validate'):
+            stages.append(self._validate)
+        if self._post_processor is not None or self._is_overwritten('_post_process'):
+            stages.append(self._post_process)
+
+        if self._call_policy == CALLED_EACH_TIME:
+            return load_stages, stages
+        return load_stages + stages, []
+
+    def compile(self, setting_name):
+        """
+        Compiles the pipeline into one function for loading and one for accessing the value, so that the stages do not
+        have to be looked up again on each access. Called by the AppSettings class the setting is assigned to.
+        Settings that overwrite _get or _get_value keep using these methods.
+        :param setting_name: the name of this setting
+        """
+        self._name = setting_name
+        load_stages, access_stages = self.get_pipeline()
+
+        if not self._is_overwritten('_get'):
+            self._compiled_get = _compile_stages(setting_name, load_stages)
+
+        if not self._is_overwritten('_get_value'):
+            access = _compile_stages(setting_name, access_stages)
+
+            def compiled_value():
+                value = self._value
+                if value is NOT_SET_VALUE:
+                    raise RuntimeError('Called value() method before the value was set by the get() method')
+                if access is None:
+                    return value
+                return access(value)
+            self._compiled_value = compiled_value
+
+    def _get(self, setting_name, setting_value):
+        """
+        Passes the value through all stages that are applied when the setting is loaded
+        :param setting_name: the name of this setting. Needed for nice verbose output on errors
+        :param setting_value: The value of the setting in settings.py. Pass NOT_SET_VALUE if the parameter is not set
+        :return: the value that is stored for this setting
+        """
+        value = setting_value
+        for stage in self.get_pipeline()[0]:
+            value = stage(setting_name, value)
+        return value
+
     def get(self, setting_name, setting_value):
-        value = self._get(setting_name, setting_value)
+        compiled_get = self._compiled_get
+        if compiled_get is None:
+            value = self._get(setting_name, setting_value)
+        else:
+            value = compiled_get(setting_value)
         self._value = value
 
     def _get_value(self):
+        """
+        Passes the stored value through all stages that are applied each time the value is accessed
+        """
         if self._value == NOT_SET_VALUE:
             raise RuntimeError('Called value() method before the value was set by the get() method')
-        return self._value
+        value = self._value
+        for stage in self.get_pipeline()[1]:
+            value = stage(self._name, value)
+        return value
 
     def value(self):
-        return self._get_value()
+        compiled_value = self._compiled_value
+        if compiled_value is None:
+            return self._get_value()
+        return compiled_value()
+
+    def cached_value(self):
+        """
+        :return: The value as it is stored after loading, i.e. before the stages that are applied on each access
+        """
+        if self._value is NOT_SET_VALUE:
+            raise RuntimeError('Called cached_value() method before the value was set by the get() method')
+        return self._value
+
+    def clone(self):
+        """
+        :return: A copy of this setting without a loaded value. Used for the settings a subclass of an AppSettings
+            class inherits, so that a subclass does not overwrite the value loaded for its base class.
+        """
+        setting = copy(self)
+        setting._value = NOT_SET_VALUE
+        setting._compiled_get = setting._compiled_value = None
+        return setting
+
+    def reset(self):
+        """
+        Called when the loaded value of this setting is invalidated. Does nothing by default and is meant to be
+        overwritten by settings that hold state besides their value.
+        """
+        pass
 
 class CalledBaseSetting(Setting):
     """
@@ -160,33 +692,11 @@ class CalledBaseSetting(Setting):
         self._force_callable = kwargs.pop('force_callable', False)
         super(CalledBaseSetting, self).__init__(*args, **kwargs)
 
-    def _get(self, setting_name, setting_value):
-        """
-        uses the superclass to get the setting and verifies that the setting is callable
-        :param setting_name: the name of this setting. Needed for nice verbose output on errors
-        :param setting_value: The value of the setting in settings.py. Pass None if the parameter is not set
-        :return: the settings value
-        """
-        val = super(CalledBaseSetting, self)._get(setting_name, setting_value)
-        if self._force_callable and not hasattr(val, '__call__'):
-            raise ValueError('The value for the setting %s has to be a callable.' % setting_name)
-        return val
-
 class CalledOnceSetting(CalledBaseSetting):
     """
     The setting calls it's callable value on first load.
     """
-    def _get(self, setting_name, setting_value):
-        """
-        Returns the value or the return value of a call to value if the value has the '__call__' attribute
-        :param setting_name: the name of this setting. Needed for nice verbose output on errors
-        :param setting_value: The value of the setting in settings.py. Pass None if the parameter is not set
-        :return: the value or the return value of a call to value if the value has the '__call__' attribute
-        """
-        val = super(CalledOnceSetting, self)._get(setting_name, setting_value)
-        if hasattr(val, '__call__'):
-            return val()
-        return val
+    _call_policy = CALLED_ONCE
 
 
 class CallableSetting(CalledOnceSetting):
@@ -202,28 +712,21 @@ class CalledEachTimeSetting(CalledBaseSetting):
     """
     The setting which calles the callable value each time the setting's value is requested.
     """
-    def _get_value(self):
-        """
-        Returns the value or the return value of a call to value if the value has the '__call__' attribute
-        """
-        val = super(CalledEachTimeSetting, self)._get_value()
-        if hasattr(val, '__call__'):
-            return val()
-        return val
+    _call_policy = CALLED_EACH_TIME
 
 
 class ClassSetting(Setting):
     """
     A Setting which expects a class or a dotted path to a class
     """
-    def _get(self, setting_name, setting_value):
+    def _cast(self, setting_name, value):
         """
         :param setting_name: the name of this setting. Needed for nice verbose output on errors
-        :param setting_value: The value of the setting in settings.py.
-        :return: the settings_value or the default value. This is guaranteed to be a class type
-        :except: ValueError if the setting_value (or the fallback) is not a class and not dotted string to a class
+        :param value: The value of the setting
+        :return: the value as class type
+        :except: ValueError if the value is not a class and not dotted string to a class
         """
-        val = super(ClassSetting, self)._get(setting_name, setting_value)
+        val = value
         if not inspect.isclass(val):
             if not isinstance(val, str):
                 raise ValueError('The value for the setting %s either has to be a class or a string containing the dotted path of a class.' % setting_name)
@@ -247,18 +750,17 @@ class TypedSetting(Setting):
         """
         return self._setting_type(value) if self._cast_value else value
 
-    def _get(self, setting_name, setting_value):
+    def _cast(self, setting_name, value):
         """
         :param setting_name: the name of this setting. Needed for nice verbose output on errors
-        :param setting_value: The value of the setting in settings.py.
-        :return: the settings_value or the default value. This is guaranteed to be a class type
-        :except: ValueError if the setting_value (or the fallback) is not of the provided type
+        :param value: The value of the setting
+        :return: the value, guaranteed to be of the type given in _setting_type
+        :except: ValueError if the value is not of the provided type
         """
         if self._setting_type is None:
             raise AttributeError('The _setting_type attribute of type %(type)s needs to be set for the check to work' % {'type': self.__class__.__name__})
-        val = super(TypedSetting, self)._get(setting_name, setting_value)
         try:
-            val = self.cast_value(val)
+            val = self.cast_value(value)
         except:
             raise ValueError('The value for setting %(setting)s cannot be casted to type %(type)s' % {'setting': setting_name, 'type': self._setting_type.__name__})
         if not isinstance(val, self._setting_type):
@@ -291,4 +793,534 @@ class IterableSetting(TypedSetting):
     An iterable setting
     """
     _setting_type = Iterable
-    _cast_value = False
\ No newline at end of file
+    _cast_value = False
+
+
+class SortedTuple(tuple):
+    """
+    An immutable tuple whose elements are sorted. Membership tests and range queries use a binary search.
+    """
+    def __new__(cls, iterable=()):
+        return super(SortedTuple, cls).__new__(cls, sorted(iterable))
+
+    def __contains__(self, item):
+        try:
+            index = bisect_left(self, item)
+        except TypeError:
+            # the item can not be compared to the elements, so it can not be one of them
+            return False
+        return index != len(self) and self[index] == item
+
+    def between(self, low=None, high=None):
+        """
+        :param low: the lower bound or None for no lower bound
+        :param high: the upper bound or None for no upper bound
+        :return: a tuple of all elements x with low <= x <= high in sorted order
+        """
+        start = 0 if low is None else bisect_left(self, low)
+        end = len(self) if high is None else bisect_right(self, high)
+        return tuple.__getitem__(self, slice(start, end))
+
+
+class CollectionSetting(IterableSetting):
+    """
+    An iterable setting whose elements are checked to be of a certain type. The elements are validated once when the
+    setting is loaded and the value is stored as an immutable collection.
+    """
+    _element_type = None
+    _cast_elements = False
+    _collection_type = tuple
+
+    def __init__(self, *args, **kwargs):
+        '''
+        takes the 'element_type' kwarg to set the type of the elements and the 'cast_elements' kwarg to set whether the
+        elements should be casted to that type
+        :param args:
+        :param kwargs:
+        :return:
+        '''
+        self._element_type = kwargs.pop('element_type', self._element_type)
+        self._cast_elements = kwargs.pop('cast_elements', self._cast_elements)
+        super(CollectionSetting, self).__init__(*args, **kwargs)
+
+    def cast_element(self, element):
+        """
+        :param element: an element of the settings value
+        :return: The casted element if _cast_elements is set to true. Otherwise the element itself
+        """
+        return self._element_type(element) if self._cast_elements else element
+
+    def materialize(self, elements):
+        """
+        :param elements: a list of the validated elements
+        :return: the collection that is stored as the settings value
+        """
+        return self._collection_type(elements)
+
+    def _cast(self, setting_name, value):
+        """
+        :param setting_name: the name of this setting. Needed for nice verbose output on errors
+        :param value: The value of the setting
+        :return: the value as collection of the type given in _collection_type
+        :except: ValueError if the value is a string or one of its elements is not of the provided element type
+        """
+        val = super(CollectionSetting, self)._cast(setting_name, value)
+        if isinstance(val, (str, bytes)):
+            raise ValueError('The value for setting %s has to be a collection and not a string' % setting_name)
+        # iterate only once, so generators can be used as values as well
+        elements = list(val)
+        if self._element_type is not None:
+            for index, element in enumerate(elements):
+                try:
+                    element = self.cast_element(element)
+                except:
+                    raise ValueError('The element %(element)r of setting %(setting)s cannot be casted to type %(type)s' % {
+                        'element': element, 'setting': setting_name, 'type': self._element_type.__name__
+                    })
+                if not isinstance(element, self._element_type):
+                    raise ValueError('The element %(element)r of setting %(setting)s is not of type %(type)s' % {
+                        'element': element, 'setting': setting_name, 'type': self._element_type.__name__
+                    })
+                elements[index] = element
+        try:
+            return self.materialize(elements)
+        except TypeError:
+            raise ValueError('The elements of setting %(setting)s cannot be stored in a %(type)s' % {
+                'setting': setting_name, 'type': self._collection_type.__name__
+            })
+
+class TupleSetting(CollectionSetting):
+    """
+    A collection setting that keeps the order of its elements
+    """
+    _collection_type = tuple
+
+class FrozenSetSetting(CollectionSetting):
+    """
+    A collection setting for fast membership tests
+    """
+    _collection_type = frozenset
+
+class SortedTupleSetting(CollectionSetting):
+    """
+    A collection setting with sorted elements for membership tests and range queries by binary search
+    """
+    _collection_type = SortedTuple
+
+class RegexSetting(Setting):
+    """
+    A Setting which expects a regular expression as string or as compiled pattern. Strings are compiled once when
+    the setting is loaded.
+    """
+    def __init__(self, *args, **kwargs):
+        '''
+        takes the 'flags' kwarg to set the flags the regular expression is compiled with
+        :param args:
+        :param kwargs:
+        :return:
+        '''
+        self._flags = kwargs.pop('flags', 0)
+        super(RegexSetting, self).__init__(*args, **kwargs)
+
+    def _cast(self, setting_name, value):
+        """
+        :param setting_name: the name of this setting. Needed for nice verbose output on errors
+        :param value: The value of the setting
+        :return: the compiled regular expression
+        :except: ValueError if the value is neither a string nor a compiled pattern or if it can not be compiled
+        """
+        val = value
+        if isinstance(val, PATTERN_TYPE):
+            return val
+        if not isinstance(val, (str, bytes)):
+            raise ValueError('The value for the setting %s either has to be a string or a compiled regular expression.' % setting_name)
+        try:
+            return re.compile(val, self._flags)
+        except re.error as e:
+            raise ValueError('The value for the setting %s is not a valid regular expression: %s' % (setting_name, e))
+
+
+PatternMatch = namedtuple('PatternMatch', ['index', 'pattern', 'match'])
+
+# global inline flags at the start of a pattern, e.g. (?i)
+_LEADING_FLAGS = re.compile(r'(?:\(\?[aiLmsux]+\))+')
+_GLOBAL_FLAGS = re.compile(r'\(\?[aiLmsux]+\)')
+
+
+def _refers_to_groups(pattern):
+    """
+    :param pattern: a regular expression without leading inline flags
+    :return: True if the pattern refers to its groups by number or name (back references and conditionals) or contains
+        global inline flags, so it does not keep its meaning as part of an alternation with other patterns
+    """
+    index = 0
+    while index < len(pattern):
+        if pattern[index] == '\\':
+            if '1' <= pattern[index + 1:index + 2] <= '9':
+                return True
+            index += 2
+            continue
+        if pattern.startswith('(?P=', index) or pattern.startswith('(?(', index) or \
+                _GLOBAL_FLAGS.match(pattern, index):
+            return True
+        index += 1
+    return False
+
+
+def _alternative(pattern, regex, flags):
+    """
+    :param pattern: a regular expression
+    :param regex: the compiled pattern
+    :param flags: the flags the patterns are compiled with
+    :return: the pattern as it is written into the alternation of a PatternSet or None if it has to be matched
+        separately. Leading global inline flags are rewritten as scoped flags, e.g. (?i)a as (?i:a).
+    """
+    leading = _LEADING_FLAGS.match(pattern)
+    inline = ''
+    if leading:
+        inline = ''.join(sorted(set(leading.group()) - set('(?)')))
+        pattern = pattern[leading.end():]
+    if _refers_to_groups(pattern):
+        return None
+    if flags & re.VERBOSE or 'x' in inline:
+        # a comment at the end of the pattern must not swallow the rest of the alternation
+        pattern += '\n'
+    if inline:
+        pattern = '(?%s:%s)' % (inline, pattern)
+    try:
+        rewritten = re.compile('(%s)' % pattern, flags)
+    except re.error:
+        # e.g. flags that can not be scoped on older Python versions
+        return None
+    if rewritten.groups != regex.groups + 1 or rewritten.flags != re.compile('', flags).flags:
+        return None
+    return pattern
+
+
+class PatternSet(object):
+    """
+    A set of regular expressions that are matched in a single scan. The patterns are combined into one alternation, so
+    matching costs one call to the regex engine instead of one per pattern. Only patterns that do not keep their meaning
+    as part of the alternation, e.g. because of back references, named groups that are also used by an earlier pattern
+    or global inline flags that are not at their start, are matched separately.
+    """
+    def __init__(self, patterns, flags=0):
+        """
+        :param patterns: the regular expressions as strings
+        :param flags: the flags all patterns are compiled with
+        :except: re.error if one of the patterns is not a valid regular expression
+        """
+        self.patterns = tuple(patterns)
+        self.flags = flags
+        compiled = [re.compile(pattern, flags) for pattern in self.patterns]
+
+        self._separate = []
+        # the index and compiled pattern of each pattern of the alternation by the number of the group wrapping it
+        self._group_indexes = {}
+        alternatives = []
+        names = set()
+        group = 1
+        for index, regex in enumerate(compiled):
+            alternative = _alternative(self.patterns[index], regex, flags)
+            if alternative is None or names.intersection(regex.groupindex):
+                self._separate.append((index, regex))
+                continue
+            names.update(regex.groupindex)
+            alternatives.append('(%s)' % alternative)
+            self._group_indexes[group] = (index, regex)
+            # the wrapping group is followed by the groups of the pattern
+            group += regex.groups + 1
+        self._combined = re.compile('|'.join(alternatives), flags) if alternatives else None
+
+    def _find(self, method, string):
+        """
+        :param method: the name of the matching method of the compiled patterns, e.g. 'search'
+        :param string: the string to match
+        :return: the PatternMatch of the first pattern that matches at the leftmost position or None
+        """
+        best = None
+        if self._combined is not None:
+            match = getattr(self._combined, method)(string)
+            if match is not None:
+                # the wrapping group closes after the groups of the pattern, so it is the last index
+                index, regex = self._group_indexes[match.lastindex]
+                if regex.groups:
+                    # the groups of the combined match are numbered differently, so the pattern is matched again on
+                    # its own to provide a match with its own groups
+                    if method == 'search':
+                        match = regex.match(string, match.start())
+                    else:
+                        match = getattr(regex, method)(string)
+                best = PatternMatch(index, self.patterns[index], match)
+        for index, regex in self._separate:
+            match = getattr(regex, method)(string)
+            if match is not None and (best is None or (match.start(), index) < (best.match.start(), best.index)):
+                best = PatternMatch(index, self.patterns[index], match)
+        return best
+
+    def search(self, string):
+        """
+        :return: a PatternMatch for the pattern that matches at the leftmost position of the string (the first
+            of the patterns if multiple ones match there) or None if no pattern matches
+        """
+        return self._find('search', string)
+
+    def match(self, string):
+        """
+        :return: a PatternMatch for the first pattern that matches at the beginning of the string or None
+        """
+        return self._find('match', string)
+
+    def fullmatch(self, string):
+        """
+        :return: a PatternMatch for the first pattern that matches the whole string or None
+        """
+        return self._find('fullmatch', string)
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def __iter__(self):
+        return iter(self.patterns)
+
+    def __eq__(self, other):
+        if not isinstance(other, PatternSet):
+            return NotImplemented
+        return self.patterns == other.patterns and self.flags == other.flags
+
+    def __hash__(self):
+        return hash((self.patterns, self.flags))
+
+    def __reduce__(self):
+        return self.__class__, (self.patterns, self.flags)
+
+    def __repr__(self):
+        return '%s(%r, flags=%r)' % (self.__class__.__name__, list(self.patterns), self.flags)
+
+
+class PatternSetSetting(Setting):
+    """
+    A Setting which expects an iterable of regular expressions as strings. The patterns are validated and combined
+    into a PatternSet once when the setting is loaded.
+    """
+    def __init__(self, *args, **kwargs):
+        '''
+        takes the 'flags' kwarg to set the flags the regular expressions are compiled with
+        :param args:
+        :param kwargs:
+        :return:
+        '''
+        self._flags = kwargs.pop('flags', 0)
+        super(PatternSetSetting, self).__init__(*args, **kwargs)
+
+    def _cast(self, setting_name, value):
+        """
+        :param setting_name: the name of this setting. Needed for nice verbose output on errors
+        :param value: The value of the setting
+        :return: the PatternSet of all patterns
+        :except: ValueError if the value is no iterable of strings or one of the patterns can not be compiled
+        """
+        val = value
+        if isinstance(val, PatternSet):
+            return val
+        if isinstance(val, (str, bytes)) or not isinstance(val, Iterable):
+            raise ValueError('The value for the setting %s has to be an iterable of regular expressions.' % setting_name)
+        patterns = list(val)
+        for pattern in patterns:
+            if not isinstance(pattern, str):
+                raise ValueError('The pattern %r of the setting %s is not a string.' % (pattern, setting_name))
+            try:
+                re.compile(pattern, self._flags)
+            except re.error as e:
+                raise ValueError('The pattern %r of the setting %s is not a valid regular expression: %s' % (
+                    pattern, setting_name, e
+                ))
+        return PatternSet(patterns, self._flags)
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+# separates the positional from the keyword arguments in the cache keys
+_KWARGS_MARK = object()
+
+
+class MemoizedCallable(object):
+    """
+    Wraps a callable and memoizes its results by their arguments in a bounded LRU cache. Optionally, the results expire
+    after a given time to live.
+    """
+    def __init__(self, function, maxsize=128, ttl=None):
+        """
+        :param function: the callable whose results are memoized
+        :param maxsize: the maximum number of memoized results or None for no limit
+        :param ttl: the number of seconds after which a memoized result expires or None if they do not expire
+        """
+        self.function = function
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        # incremented on each clear, so that results computed before a clear are not stored afterwards
+        self._generation = 0
+
+    def __call__(self, *args, **kwargs):
+        key = args
+        if kwargs:
+            key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                result, expires = entry
+                if expires is None or expires > monotonic():
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return result
+                del self._cache[key]
+            self._misses += 1
+            generation = self._generation
+
+        # call the function without holding the lock, so that slow calls do not block other arguments
+        result = self.function(*args, **kwargs)
+
+        if self.maxsize != 0:
+            expires = None if self.ttl is None else monotonic() + self.ttl
+            with self._lock:
+                if generation == self._generation:
+                    self._cache[key] = (result, expires)
+                    self._cache.move_to_end(key)
+                    if self.maxsize is not None and len(self._cache) > self.maxsize:
+                        self._cache.popitem(last=False)
+        return result
+
+    def cache_info(self):
+        """
+        :return: a CacheInfo tuple with the number of hits and misses, the maximum and the current size of the cache
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        """
+        Drops all memoized results and resets the statistics
+        """
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+            self._generation += 1
+
+    def __reduce__(self):
+        # the memoized results are not pickled, so the unpickled instance starts with an empty cache
+        return self.__class__, (self.function, self.maxsize, self.ttl)
+
+    def __repr__(self):
+        return '%s(%r, maxsize=%r, ttl=%r)' % (self.__class__.__name__, self.function, self.maxsize, self.ttl)
+
+
+class ParametrizedSetting(Setting):
+    """
+    A setting whose value is a callable that takes arguments, e.g. for per-key lookups. The setting returns the callable
+    wrapped in a MemoizedCallable which memoizes its results. The memoized results are dropped when the setting is
+    invalidated, e.g. because it is changed in the settings.
+    """
+    _force_callable = True
+
+    def __init__(self, *args, **kwargs):
+        '''
+        takes the 'maxsize' kwarg to set the maximum number of memoized results (defaults to 128, None for no limit)
+        and the 'ttl' kwarg to set the number of seconds after which the results expire (defaults to None for never)
+        :param args:
+        :param kwargs:
+        :return:
+        '''
+        self._maxsize = kwargs.pop('maxsize', 128)
+        self._ttl = kwargs.pop('ttl', None)
+        super(ParametrizedSetting, self).__init__(*args, **kwargs)
+
+    def _post_process(self, setting_name, value):
+        """
+        :return: the callable value wrapped in a MemoizedCallable
+        """
+        value = super(ParametrizedSetting, self)._post_process(setting_name, value)
+        return MemoizedCallable(value, maxsize=self._maxsize, ttl=self._ttl)
+
+    def reset(self):
+        """
+        Drops the memoized results of the current value
+        """
+        if isinstance(self._value, MemoizedCallable):
+            self._value.cache_clear()
+
+
+class ComputedSetting(Setting):
+    """
+    A setting whose value is computed from the values of other settings. The result is cached and only computed again
+    when one of the inputs is invalidated or overridden.
+    """
+    def __init__(self, compute, depends_on=(), settings_name=None, aliases=[], **kwargs):
+        """
+        :param compute: A callable that is called with the values of the inputs (in the given order) as positional
+        arguments and returns the value of this setting
+        :param depends_on: The inputs of this setting. Each input is either the name of a setting on the same
+        AppSettings class or a tuple of an AppSettings class and the name of one of its settings.
+        :param settings_name: see Setting
+        :param aliases: see Setting
+        :param kwargs: The call_policy, validators and post_process arguments of Setting. They are applied to the
+        computed value as well. (optional)
+        :return:
+        :except: ValueError if a default_value or a default_factory is given, as the computed value is the default
+        """
+        for argument in ('default_value', 'default_factory'):
+            if argument in kwargs:
+                raise ValueError(
+                    'A ComputedSetting does not accept a %s as its value is computed if it is not defined in the '
+                    'settings.py.' % argument
+                )
+        super(ComputedSetting, self).__init__(settings_name=settings_name, aliases=aliases, **kwargs)
+        if not hasattr(compute, '__call__'):
+            raise ValueError('The compute function of a ComputedSetting has to be a callable.')
+        self._compute = compute
+        self._depends_on = []
+        for dependency in depends_on:
+            if isinstance(dependency, str):
+                dependency = (None, dependency)
+            elif not (
+                isinstance(dependency, tuple) and len(dependency) == 2 and
+                isinstance(dependency[0], SettingsMetaClass) and isinstance(dependency[1], str)
+            ):
+                raise ValueError(
+                    'The inputs of a ComputedSetting have to be setting names or tuples of an AppSettings class and '
+                    'a setting name.'
+                )
+            self._depends_on.append(dependency)
+
+    def get_dependencies(self, owner):
+        """
+        :param owner: The AppSettings class this setting is accessed on
+        :return: The inputs of this setting as list of (AppSettings, name) tuples
+        """
+        return [(appsettings or owner, name) for appsettings, name in self._depends_on]
+
+    def compute_value(self, owner):
+        """
+        :param owner: The AppSettings class this setting is accessed on
+        :return: The value computed from the current values of the inputs
+        """
+        return self._compute(*[getattr(appsettings, name) for appsettings, name in self.get_dependencies(owner)])
+
+
+class AppSettings(object, metaclass=SettingsMetaClass):
+    """
+    Class that has the SettingsMetaClass ass metaclass. This is the base class for AppSettings classes
+
+    The _sources attribute lists additional sources of values that are looked up before the settings.py, e.g. the
+    DatabaseSource of django_pluggableappsettings.dynamic. A source provides the method get_value(appsettings, name)
+    that returns the value for the setting with the given attribute name or NOT_SET_VALUE if it does not provide one.
+    Sources have to invalidate the values they provided once these change. A source can provide the method prepare()
+    which is called before a value is loaded and outside of the lock guarding the loading of all values, e.g. to fetch
+    its values from a slow backend.
+    """
+    _sources = ()
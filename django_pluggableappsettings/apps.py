@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import logging
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.core import checks
+
+logger = logging.getLogger(__name__)
+
+
+class PluggableAppSettingsConfig(AppConfig):
+    """
+    Registers the system checks of all AppSettings classes. Add 'django_pluggableappsettings' to the INSTALLED_APPS
+    to enable them.
+    """
+    name = 'django_pluggableappsettings'
+    verbose_name = 'Pluggable App Settings'
+
+    def ready(self):
+        from django_pluggableappsettings.checks import APPSETTINGS_TAG, check_appsettings
+        checks.register(check_appsettings, APPSETTINGS_TAG)
+
+        if getattr(settings, 'PLUGGABLEAPPSETTINGS_TRACING', False):
+            from django_pluggableappsettings import tracing
+            tracing.enable()
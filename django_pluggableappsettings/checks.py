@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+System checks that load all settings of all AppSettings classes at startup, so that missing or invalid values are
+reported by `manage.py check` (and therefore also `manage.py check --deploy`, runserver and migrate) instead of on the
+first request that reads them. The loaded values stay cached, so they are not loaded again on their first access.
+The app_settings module of each installed app is imported before the checks run, so that AppSettings classes which are
+otherwise only imported lazily are checked as well.
+
+Check IDs:
+
+- django_pluggableappsettings.E001: a setting is neither defined in the settings.py nor has a default value
+- django_pluggableappsettings.E002: the value of a setting is invalid, e.g. it can not be casted to its type
+- django_pluggableappsettings.E003: loading a setting raised any other exception
+"""
+from __future__ import absolute_import
+import logging
+
+from django.core import checks
+from django.utils.module_loading import autodiscover_modules
+
+from django_pluggableappsettings import get_registered_appsettings
+
+logger = logging.getLogger(__name__)
+
+APPSETTINGS_TAG = 'appsettings'
+
+# the module of each installed app that is imported to find its AppSettings classes
+APPSETTINGS_MODULE = 'app_settings'
+
+MISSING_VALUE_ID = 'django_pluggableappsettings.E001'
+INVALID_VALUE_ID = 'django_pluggableappsettings.E002'
+LOADING_ERROR_ID = 'django_pluggableappsettings.E003'
+
+
+def _belongs_to(appsettings, app_configs):
+    """
+    :return: True if the AppSettings class is defined in the package of one of the given apps
+    """
+    module = appsettings.__module__
+    return any(module == app_config.name or module.startswith(app_config.name + '.') for app_config in app_configs)
+
+
+def check_appsettings_class(appsettings):
+    """
+    Loads all settings of an AppSettings class that are not loaded yet
+    :param appsettings: the AppSettings class
+    :return: a list with an Error for each setting that could not be loaded
+    """
+    errors = []
+    for name, setting in appsettings._settings.items():
+        if name in appsettings._values:
+            continue
+        try:
+            appsettings._load(name, setting)
+        except Exception as e:
+            if isinstance(e, AttributeError):
+                check_id = MISSING_VALUE_ID
+            elif isinstance(e, (ValueError, TypeError)):
+                check_id = INVALID_VALUE_ID
+            else:
+                check_id = LOADING_ERROR_ID
+            errors.append(checks.Error(
+                '%s: %s' % (type(e).__name__, e),
+                obj='%s.%s.%s' % (appsettings.__module__, appsettings.__qualname__, name),
+                id=check_id,
+            ))
+    return errors
+
+
+def check_appsettings(app_configs=None, **kwargs):
+    """
+    The system check loading all settings of all AppSettings classes. If app_configs are given, only the AppSettings
+    classes defined in these apps are checked.
+    :return: a list with an Error for each setting that could not be loaded
+    """
+    # AppSettings classes are only registered once their module is imported
+    autodiscover_modules(APPSETTINGS_MODULE)
+    errors = []
+    for appsettings in sorted(get_registered_appsettings(), key=lambda cls: (cls.__module__, cls.__qualname__)):
+        if app_configs is not None and not _belongs_to(appsettings, app_configs):
+            continue
+        errors.extend(check_appsettings_class(appsettings))
+    return errors
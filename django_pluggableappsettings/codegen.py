@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+Generation of a python module that holds the values of AppSettings classes as plain module constants, together with a
+.pyi stub with their types, for code where even the access of a loaded value is too slow. The values are loaded when
+the module is generated. At import, the generated module checks that the values of the constants still match the
+values of the settings and raises ImproperlyConfigured otherwise.
+
+Settings whose callable is called on each access are left out as they do not have a constant value.
+"""
+from __future__ import absolute_import
+import inspect
+import logging
+import math
+from pydoc import locate
+
+from django.core.exceptions import ImproperlyConfigured
+
+from django_pluggableappsettings import CALLED_EACH_TIME, PATTERN_TYPE, ClassSetting, CollectionSetting, \
+    FrozenSetSetting, MemoizedCallable, PatternSet, PatternSetSetting, RegexSetting, SortedTuple, \
+    SortedTupleSetting, TupleSetting, TypedSetting
+from django_pluggableappsettings.fingerprint import digest, dotted_path
+
+logger = logging.getLogger(__name__)
+
+# the types that are written by their name
+BUILTIN_TYPES = (bool, int, float, complex, str, bytes)
+
+
+def constants_fingerprint(appsettings, names):
+    """
+    :param appsettings: an AppSettings class
+    :param names: the attribute names of the settings that are written as constants
+    :return: a hex digest of the current values of the given settings
+    """
+    combined = 0
+    for name in names:
+        combined ^= digest(name, getattr(appsettings, name))
+    return '%064x' % combined
+
+
+def check_fingerprint(path, names, expected):
+    """
+    Called by generated modules at import
+    :param path: the dotted path of an AppSettings class
+    :param names: the attribute names of the settings of the class that are written as constants
+    :param expected: the fingerprint of the values of these settings when the module was generated
+    :except: ImproperlyConfigured if one of the values changed
+    """
+    appsettings = locate(path)
+    if appsettings is None:
+        raise ImproperlyConfigured('The AppSettings class %s could not be found.' % path)
+    if constants_fingerprint(appsettings, names) != expected:
+        raise ImproperlyConfigured(
+            'The settings of %s changed since the constants were generated. Generate them again.' % path
+        )
+
+
+class UnrepresentableValue(ValueError):
+    """
+    Raised for values that can not be written as python source
+    """
+
+
+class ModuleWriter(object):
+    """
+    Writes values and types as python source and collects the modules they need to import
+    """
+    def __init__(self):
+        self.imports = set()
+
+    def reference(self, obj):
+        """
+        :return: the source referencing a class or function by its dotted path
+        :except: UnrepresentableValue if the object can not be imported by its path
+        """
+        if getattr(obj, '__module__', None) == 'builtins':
+            return obj.__qualname__
+        path = dotted_path(obj)
+        if locate(path) is not obj:
+            raise UnrepresentableValue('%s can not be imported by its dotted path' % path)
+        self.imports.add(obj.__module__)
+        return path
+
+    def value(self, value):
+        """
+        :return: the python expression creating the value
+        :except: UnrepresentableValue if the value can not be written as python source
+        """
+        value_type = type(value)
+        if value is None or value_type in BUILTIN_TYPES:
+            if value_type in (float, complex) and not all(math.isfinite(part) for part in (value.real, value.imag)):
+                raise UnrepresentableValue('%r has no literal' % value)
+            return repr(value)
+        if value_type is SortedTuple:
+            return '%s(%s)' % (self.reference(SortedTuple), self.value(tuple(value)))
+        if value_type is tuple:
+            items = [self.value(item) for item in value]
+            return '(%s,)' % items[0] if len(items) == 1 else '(%s)' % ', '.join(items)
+        if value_type is list:
+            return '[%s]' % ', '.join(self.value(item) for item in value)
+        if value_type is dict:
+            return '{%s}' % ', '.join('%s: %s' % (self.value(key), self.value(item)) for key, item in value.items())
+        if value_type in (set, frozenset):
+            items = sorted(self.value(item) for item in value)
+            source = '{%s}' % ', '.join(items) if items else 'set()'
+            return source if value_type is set else 'frozenset(%s)' % (source if items else '')
+        if isinstance(value, PATTERN_TYPE):
+            self.imports.add('re')
+            return 're.compile(%r, %d)' % (value.pattern, value.flags)
+        if value_type is PatternSet:
+            return '%s(%s, %d)' % (self.reference(PatternSet), self.value(list(value.patterns)), value.flags)
+        if value_type is MemoizedCallable:
+            return '%s(%s, maxsize=%r, ttl=%r)' % (
+                self.reference(MemoizedCallable), self.reference(value.function), value.maxsize, value.ttl
+            )
+        if inspect.isclass(value) or inspect.isfunction(value) or inspect.isbuiltin(value):
+            return self.reference(value)
+        raise UnrepresentableValue('values of type %s can not be written as python source' % value_type.__name__)
+
+    def typing(self, name):
+        self.imports.add('typing')
+        return 'typing.%s' % name
+
+    def type_of(self, cls):
+        """
+        :return: the annotation of instances of the class
+        """
+        if cls is type(None):
+            return 'None'
+        try:
+            return self.reference(cls)
+        except UnrepresentableValue:
+            return self.typing('Any')
+
+    def annotation(self, setting, value):
+        """
+        :return: the annotation of the value of the setting, taken from the type of the setting if possible
+        """
+        if isinstance(setting, CollectionSetting):
+            element = self.type_of(setting._element_type) if setting._element_type else self.typing('Any')
+            if isinstance(setting, SortedTupleSetting):
+                return self.reference(SortedTuple)
+            if isinstance(setting, TupleSetting):
+                return '%s[%s, ...]' % (self.typing('Tuple'), element)
+            if isinstance(setting, FrozenSetSetting):
+                return '%s[%s]' % (self.typing('FrozenSet'), element)
+        if isinstance(setting, TypedSetting) and setting._setting_type is not None and \
+                not inspect.isabstract(setting._setting_type):
+            return self.type_of(setting._setting_type)
+        if isinstance(setting, ClassSetting):
+            return '%s[%s]' % (self.typing('Type'), self.reference(value))
+        if isinstance(setting, RegexSetting):
+            self.imports.add('re')
+            return 're.Pattern[str]'
+        if isinstance(setting, PatternSetSetting):
+            return self.reference(PatternSet)
+        return self.annotation_of_value(value)
+
+    def annotation_of_value(self, value):
+        """
+        :return: the annotation of a value of a setting without type information
+        """
+        value_type = type(value)
+        if value is None or value_type in BUILTIN_TYPES:
+            return self.type_of(value_type)
+        generics = {list: 'List[%s]', tuple: 'Tuple[%s, ...]', set: 'Set[%s]', frozenset: 'FrozenSet[%s]'}
+        if value_type in generics:
+            return self.typing(generics[value_type] % self.typing('Any'))
+        if value_type is dict:
+            return self.typing('Dict[%s, %s]' % (self.typing('Any'), self.typing('Any')))
+        if isinstance(value, PATTERN_TYPE):
+            self.imports.add('re')
+            return 're.Pattern[str]'
+        if inspect.isclass(value):
+            return '%s[%s]' % (self.typing('Type'), self.reference(value))
+        if hasattr(value, '__call__') and value_type is not MemoizedCallable:
+            return self.typing('Callable[..., %s]' % self.typing('Any'))
+        return self.type_of(value_type)
+
+    def import_lines(self):
+        return ['import %s' % module for module in sorted(self.imports)]
+
+
+def generate(appsettings_classes):
+    """
+    Loads all settings of the given AppSettings classes and generates the module holding their values as constants
+    :param appsettings_classes: the AppSettings classes. They have to be importable by their dotted path.
+    :return: a tuple of the source of the module and the source of its .pyi stub
+    :except: ValueError if two classes have a setting with the same name
+    """
+    writer = ModuleWriter()
+    stub_writer = ModuleWriter()
+    header = ['# -*- coding: utf-8 -*-', '# Generated by django_pluggableappsettings. Do not edit.']
+    guards, constants, annotations = [], [], []
+    names = {}
+
+    for appsettings in appsettings_classes:
+        path = dotted_path(appsettings)
+        if locate(path) is not appsettings:
+            raise ValueError('The AppSettings class %s can not be imported by its dotted path.' % path)
+        emitted = []
+
+        for name, setting in sorted(appsettings._settings.items()):
+            if setting._call_policy == CALLED_EACH_TIME:
+                constants.append('# %s is left out as its value is called on each access' % name)
+                continue
+            if name in names:
+                raise ValueError('The setting %s is defined by %s and %s. Generate separate modules for them.' % (
+                    name, names[name], path
+                ))
+            names[name] = path
+            value = getattr(appsettings, name)
+            try:
+                source = writer.value(value)
+            except UnrepresentableValue as e:
+                constants.append('# %s is left out as its value can not be written as python source: %s' % (name, e))
+                continue
+            constants.append('%s = %s' % (name, source))
+            annotations.append('%s: %s' % (name, stub_writer.annotation(setting, value)))
+            emitted.append(name)
+
+        # only the values that are written as constants are guarded, as the others do not need to be stable
+        if emitted:
+            guards.append('check_fingerprint(%r, %r, %r)' % (
+                path, tuple(emitted), constants_fingerprint(appsettings, emitted)
+            ))
+
+    module = header + [
+        'from django_pluggableappsettings.codegen import check_fingerprint',
+    ] + writer.import_lines() + [''] + guards + [''] + constants
+    stub = header + stub_writer.import_lines() + [''] + annotations
+    return '\n'.join(module) + '\n', '\n'.join(stub) + '\n'
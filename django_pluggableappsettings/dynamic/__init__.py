@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+Settings values stored in the database, so they can be changed at runtime, e.g. in the admin. Add
+'django_pluggableappsettings.dynamic' to the INSTALLED_APPS and database_source to the _sources of the AppSettings
+classes whose values can be changed.
+"""
+from __future__ import absolute_import
+import logging
+
+import django
+
+logger = logging.getLogger(__name__)
+
+# Django < 3.2 does not pick up the AppConfig on its own
+if django.VERSION < (3, 2):
+    default_app_config = 'django_pluggableappsettings.dynamic.apps.DynamicSettingsConfig'
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import logging
+
+from django.contrib import admin
+
+from django_pluggableappsettings.dynamic.models import DynamicSetting
+
+logger = logging.getLogger(__name__)
+
+
+@admin.register(DynamicSetting)
+class DynamicSettingAdmin(admin.ModelAdmin):
+    list_display = ('appsettings', 'name', 'value')
+    list_filter = ('appsettings',)
+    search_fields = ('appsettings', 'name')
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import logging
+
+from django_pluggableappsettings import AppSettings, FloatSetting, Setting, StringSetting
+
+logger = logging.getLogger(__name__)
+
+
+class DynamicAppSettings(AppSettings):
+    # The minimum number of seconds between two checks whether the DynamicSettings changed
+    DYNAMIC_SETTINGS_POLL_INTERVAL = FloatSetting(5.0)
+    # The alias of the cache that holds the version of the DynamicSettings. If None, the version is read from the
+    # database.
+    DYNAMIC_SETTINGS_CACHE = Setting(None)
+    # The key of the version in the cache
+    DYNAMIC_SETTINGS_CACHE_KEY = StringSetting('django_pluggableappsettings.dynamic.version')
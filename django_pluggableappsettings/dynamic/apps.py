@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import logging
+
+from django.apps import AppConfig
+from django.core.signals import request_started
+from django.db.models.signals import post_delete, post_save
+
+logger = logging.getLogger(__name__)
+
+
+class DynamicSettingsConfig(AppConfig):
+    """
+    Polls for changed DynamicSettings at the start of each request and bumps their version whenever one is changed.
+    """
+    name = 'django_pluggableappsettings.dynamic'
+    label = 'pluggableappsettings_dynamic'
+    verbose_name = 'Dynamic Settings'
+    default_auto_field = 'django.db.models.AutoField'
+
+    def ready(self):
+        from django_pluggableappsettings.dynamic.models import DynamicSetting
+        from django_pluggableappsettings.dynamic.source import database_source, setting_saved
+
+        request_started.connect(database_source.poll_on_request, dispatch_uid='pluggableappsettings_dynamic_poll')
+        post_save.connect(setting_saved, sender=DynamicSetting, dispatch_uid='pluggableappsettings_dynamic_save')
+        post_delete.connect(setting_saved, sender=DynamicSetting, dispatch_uid='pluggableappsettings_dynamic_delete')
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-19 15:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DynamicSettingsVersion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DynamicSetting',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('appsettings', models.CharField(help_text='The dotted path of the AppSettings class', max_length=255)),
+                ('name', models.CharField(help_text='The attribute name of the setting in the AppSettings class', max_length=255)),
+                ('value', models.TextField(help_text='The value encoded as JSON')),
+            ],
+            options={
+                'ordering': ('appsettings', 'name'),
+                'unique_together': {('appsettings', 'name')},
+            },
+        ),
+    ]
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import json
+import logging
+
+from django.core.exceptions import ValidationError
+from django.db import models
+
+logger = logging.getLogger(__name__)
+
+
+class DynamicSetting(models.Model):
+    """
+    The value of a setting of an AppSettings class that takes precedence over the settings.py
+    """
+    appsettings = models.CharField(max_length=255, help_text='The dotted path of the AppSettings class')
+    name = models.CharField(max_length=255, help_text='The attribute name of the setting in the AppSettings class')
+    value = models.TextField(help_text='The value encoded as JSON')
+
+    class Meta:
+        unique_together = (('appsettings', 'name'),)
+        ordering = ('appsettings', 'name')
+
+    def __str__(self):
+        return '%s.%s' % (self.appsettings, self.name)
+
+    def get_value(self):
+        """
+        :return: the decoded value
+        :except: ValueError if the value is not valid JSON
+        """
+        return json.loads(self.value)
+
+    def clean(self):
+        try:
+            self.get_value()
+        except ValueError:
+            raise ValidationError({'value': 'The value has to be valid JSON.'})
+
+
+class DynamicSettingsVersion(models.Model):
+    """
+    A single row whose version is incremented on each change of a DynamicSetting, so that the processes only have to
+    load the DynamicSettings again if the version changed
+    """
+    version = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return str(self.version)
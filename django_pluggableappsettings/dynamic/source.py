@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+The source of the values stored as DynamicSettings. All DynamicSettings are loaded in a single query when the first
+value is needed and are kept in memory afterwards, so reading a value never queries the database. At most once per
+DYNAMIC_SETTINGS_POLL_INTERVAL, at the start of a request, the version of the DynamicSettings is read from the database
+or the cache given by DYNAMIC_SETTINGS_CACHE. Only if it changed, the DynamicSettings are loaded again and the loaded
+values of the changed settings are invalidated.
+"""
+from __future__ import absolute_import
+import logging
+import threading
+from time import monotonic
+from uuid import uuid4
+
+from django.db import DatabaseError, transaction
+from django.db.models import F
+
+from django_pluggableappsettings import NOT_SET_VALUE, get_registered_appsettings
+from django_pluggableappsettings.dynamic.app_settings import DynamicAppSettings
+from django_pluggableappsettings.fingerprint import dotted_path
+
+logger = logging.getLogger(__name__)
+
+
+def get_version_cache():
+    """
+    :return: the cache holding the version of the DynamicSettings or None if the version is stored in the database
+    """
+    alias = DynamicAppSettings.DYNAMIC_SETTINGS_CACHE
+    if alias is None:
+        return None
+    from django.core.cache import caches
+    return caches[alias]
+
+
+def bump_version():
+    """
+    Marks the DynamicSettings as changed for all processes
+    """
+    from django_pluggableappsettings.dynamic.models import DynamicSettingsVersion
+    if not DynamicSettingsVersion.objects.filter(pk=1).update(version=F('version') + 1):
+        DynamicSettingsVersion.objects.get_or_create(pk=1, defaults={'version': 1})
+
+    cache = get_version_cache()
+    if cache is not None:
+        # other processes must not load the DynamicSettings before the change is visible to them
+        transaction.on_commit(
+            lambda: cache.set(DynamicAppSettings.DYNAMIC_SETTINGS_CACHE_KEY, uuid4().hex, None)
+        )
+
+
+class DatabaseSource(object):
+    """
+    A source for the _sources of AppSettings classes that provides the values stored as DynamicSettings
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Forgets the loaded DynamicSettings, so they are loaded again when the next value is needed. The values that
+        have already been loaded by the AppSettings classes are not invalidated.
+        """
+        # the values of all DynamicSettings by the dotted path of their AppSettings class and their name
+        self._values = None
+        self._version = None
+        self._last_poll = None
+
+    def prepare(self):
+        """
+        Loads the DynamicSettings if they have not been loaded yet. Called by the AppSettings classes before they
+        acquire the resolution lock, so that the queries do not block the loading of the values of other classes.
+        """
+        if self._values is not None:
+            return
+        # the settings are read before acquiring our lock, as loading them acquires the resolution lock
+        cache, key = get_version_cache(), DynamicAppSettings.DYNAMIC_SETTINGS_CACHE_KEY
+        with self._lock:
+            if self._values is None:
+                version, values = self.get_version(cache, key), self.fetch()
+                if values is None:
+                    # the next poll loads the values again
+                    version, values = None, {}
+                self._version, self._values = version, values
+
+    def get_value(self, appsettings, name):
+        """
+        :param appsettings: the AppSettings class
+        :param name: the attribute name of the setting
+        :return: the value of the DynamicSetting or NOT_SET_VALUE if there is none
+        """
+        values = self._values
+        if values is None:
+            # e.g. if the values were reset after prepare() was called
+            self.prepare()
+            values = self._values or {}
+        return values.get(dotted_path(appsettings), {}).get(name, NOT_SET_VALUE)
+
+    def get_version(self, cache=None, key=None):
+        """
+        :param cache: the cache holding the version or None to read it from the database
+        :param key: the key of the version in the cache
+        :return: the current version of the DynamicSettings or None if it could not be read
+        """
+        if cache is not None:
+            version = cache.get(key)
+            if version is None:
+                # the version expired or was evicted, so we can not tell whether anything changed
+                cache.add(key, uuid4().hex, None)
+                version = cache.get(key)
+            return version
+
+        from django_pluggableappsettings.dynamic.models import DynamicSettingsVersion
+        try:
+            return DynamicSettingsVersion.objects.filter(pk=1).values_list('version', flat=True).first() or 0
+        except DatabaseError as e:
+            logger.warning('The version of the dynamic settings could not be loaded: %s', e)
+            return None
+
+    def fetch(self):
+        """
+        Loads all DynamicSettings in a single query
+        :return: a dict of the dotted paths of AppSettings classes to dicts of setting names to their values or None
+            if the database can not be queried, e.g. because the migrations have not been applied yet
+        """
+        from django_pluggableappsettings.dynamic.models import DynamicSetting
+        try:
+            settings = list(DynamicSetting.objects.all())
+        except DatabaseError as e:
+            logger.warning('The dynamic settings could not be loaded: %s', e)
+            return None
+
+        values = {}
+        for setting in settings:
+            try:
+                value = setting.get_value()
+            except ValueError:
+                logger.warning('Ignoring the dynamic setting %s as its value is not valid JSON.', setting)
+                continue
+            values.setdefault(setting.appsettings, {})[setting.name] = value
+        return values
+
+    def poll(self, force=False):
+        """
+        Loads the DynamicSettings again if their version changed and invalidates the loaded values of all settings
+        whose DynamicSetting changed
+        :param force: check the version even if the poll interval has not passed yet
+        :return: True if the DynamicSettings were loaded again
+        """
+        now = monotonic()
+        if not force and self._last_poll is not None and \
+                now - self._last_poll < DynamicAppSettings.DYNAMIC_SETTINGS_POLL_INTERVAL:
+            return False
+        # the settings are read before acquiring our lock, as loading them acquires the resolution lock
+        cache, key = get_version_cache(), DynamicAppSettings.DYNAMIC_SETTINGS_CACHE_KEY
+        # only one thread polls at a time, the others keep using the current values
+        if not self._lock.acquire(False):
+            return False
+        try:
+            self._last_poll = now
+            if self._values is None:
+                # nothing has been loaded yet
+                return False
+            version = self.get_version(cache, key)
+            if version is None or version == self._version:
+                return False
+            values = self.fetch()
+            if values is None:
+                return False
+            previous, self._values, self._version = self._values, values, version
+        finally:
+            self._lock.release()
+
+        # invalidate without holding our lock, as loading a value acquires it while holding the resolution lock
+        self.invalidate_changed(previous, values)
+        return True
+
+    def invalidate_changed(self, previous, values):
+        """
+        Invalidates the loaded values of all settings whose DynamicSetting differs between previous and values
+        """
+        for appsettings in get_registered_appsettings():
+            if self not in appsettings._sources:
+                continue
+            path = dotted_path(appsettings)
+            old, new = previous.get(path, {}), values.get(path, {})
+            changed = [
+                name for name in set(old) | set(new)
+                if name in appsettings._settings and old.get(name, NOT_SET_VALUE) != new.get(name, NOT_SET_VALUE)
+            ]
+            if changed:
+                appsettings.invalidate(*changed)
+
+    def mark_stale(self):
+        """
+        Makes the next poll check the version regardless of the poll interval
+        """
+        self._last_poll = None
+
+    def poll_on_request(self, **kwargs):
+        """
+        Receiver of the request_started signal
+        """
+        self.poll()
+
+
+database_source = DatabaseSource()
+
+
+def setting_saved(sender, **kwargs):
+    """
+    Receiver of the post_save and post_delete signals of DynamicSettings
+    """
+    bump_version()
+    database_source.mark_stale()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Stable fingerprints of the values of AppSettings, e.g. to version caches by the configuration that produced them.
+The fingerprint of a single class is available by its fingerprint() method, the one of all classes by
+settings_fingerprint().
+"""
+from __future__ import absolute_import
+import hashlib
+import inspect
+import logging
+import weakref
+
+from django_pluggableappsettings import PATTERN_TYPE, MemoizedCallable, PatternSet, _changed_fingerprints, \
+    _resolution_lock, get_registered_appsettings
+
+logger = logging.getLogger(__name__)
+
+# The combined digest of all AppSettings classes and the digest each class contributes to it
+_global_digest = 0
+_contributions = weakref.WeakKeyDictionary()
+
+
+def dotted_path(obj):
+    """
+    :param obj: a class, function or method
+    :return: the dotted path to the object
+    """
+    return '%s.%s' % (obj.__module__, getattr(obj, '__qualname__', obj.__name__))
+
+
+def encode_value(value):
+    """
+    :param value: a settings value
+    :return: a string representing the value that is the same in every process. Classes and functions are represented
+        by their dotted path. Values of unknown types are represented by their type and repr, so they should have a
+        deterministic repr. Values whose type does not define a repr are only represented by their type, as the default
+        repr contains the memory address which differs between processes.
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return '%s:%r' % (type(value).__name__, value)
+    if isinstance(value, (list, tuple)):
+        return '%s[%s]' % (dotted_path(type(value)), ','.join(encode_value(item) for item in value))
+    if isinstance(value, dict):
+        return '%s{%s}' % (dotted_path(type(value)), ','.join(sorted(
+            '%s=%s' % (encode_value(key), encode_value(item)) for key, item in value.items()
+        )))
+    if isinstance(value, (set, frozenset)):
+        return '%s{%s}' % (dotted_path(type(value)), ','.join(sorted(encode_value(item) for item in value)))
+    if inspect.isclass(value) or inspect.isfunction(value) or inspect.isbuiltin(value):
+        return 'path:%s' % dotted_path(value)
+    if inspect.ismethod(value):
+        return 'method:%s(%s)' % (dotted_path(value.__func__), encode_value(value.__self__))
+    if isinstance(value, PATTERN_TYPE):
+        return 'regex:%r,%d' % (value.pattern, value.flags)
+    if isinstance(value, PatternSet):
+        return 'patternset:%s,%d' % (encode_value(value.patterns), value.flags)
+    if isinstance(value, MemoizedCallable):
+        return 'memoized:%s,%r,%r' % (encode_value(value.function), value.maxsize, value.ttl)
+    if type(value).__repr__ is object.__repr__:
+        return '%s:<object>' % dotted_path(type(value))
+    return '%s:%r' % (dotted_path(type(value)), value)
+
+
+def digest(name, value):
+    """
+    :param name: the name the value belongs to
+    :param value: the value
+    :return: the digest of the name and value as integer
+    """
+    encoded = '%s=%s' % (name, encode_value(value))
+    return int(hashlib.sha256(encoded.encode('utf-8')).hexdigest(), 16)
+
+
+def settings_fingerprint():
+    """
+    :return: A stable hex digest of the values of all AppSettings classes. Only the classes whose values changed since
+        the last call are taken into account again, so calling it is cheap.
+    """
+    global _global_digest
+    while _changed_fingerprints:
+        with _resolution_lock:
+            changed = list(_changed_fingerprints)
+            for appsettings in changed:
+                _changed_fingerprints.discard(appsettings)
+        # the fingerprints are computed without holding the lock, as computing them loads the values of the settings
+        fingerprints = [(appsettings, appsettings.fingerprint()) for appsettings in changed]
+        with _resolution_lock:
+            for appsettings, fingerprint in fingerprints:
+                if len(appsettings._digests) != len(appsettings._settings) or \
+                        '%064x' % appsettings._digest != fingerprint:
+                    # the values changed in the meantime, so the class is taken into account again
+                    _changed_fingerprints.add(appsettings)
+                    continue
+                contribution = digest(dotted_path(appsettings), fingerprint)
+                _global_digest ^= _contributions.pop(appsettings, 0) ^ contribution
+                _contributions[appsettings] = contribution
+    return '%064x' % _global_digest
+
+
+def reset_settings_fingerprint():
+    """
+    Computes the global fingerprint from scratch from all registered AppSettings classes on the next call of
+    settings_fingerprint(), e.g. after classes have been removed.
+    """
+    global _global_digest
+    with _resolution_lock:
+        _global_digest = 0
+        _contributions.clear()
+        for appsettings in get_registered_appsettings():
+            _changed_fingerprints.add(appsettings)
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import logging
+
+logger = logging.getLogger(__name__)
\ No newline at end of file
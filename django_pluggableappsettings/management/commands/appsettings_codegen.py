@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import logging
+import os
+from pydoc import locate
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_pluggableappsettings import SettingsMetaClass
+from django_pluggableappsettings.codegen import generate
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Generates a python module with the values of AppSettings classes as constants and a .pyi stub with ' \
+           'their types.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('appsettings', nargs='+', help='The dotted paths of the AppSettings classes.')
+        parser.add_argument('--output', '-o', required=True,
+                            help='The path of the generated module. The stub is written next to it.')
+        parser.add_argument('--check', action='store_true',
+                            help='Only check that the generated files are up to date.')
+
+    def handle(self, *args, **options):
+        classes = []
+        for path in options['appsettings']:
+            appsettings = locate(path)
+            if not isinstance(appsettings, SettingsMetaClass):
+                raise CommandError('%s is not an AppSettings class.' % path)
+            classes.append(appsettings)
+
+        try:
+            module, stub = generate(classes)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        output = options['output']
+        stub_output = os.path.splitext(output)[0] + '.pyi'
+        files = ((output, module), (stub_output, stub))
+
+        if options['check']:
+            for path, content in files:
+                if not os.path.isfile(path):
+                    raise CommandError('%s does not exist.' % path)
+                with open(path) as f:
+                    if f.read() != content:
+                        raise CommandError('%s is out of date.' % path)
+            self.stdout.write('The generated files are up to date.')
+            return
+
+        for path, content in files:
+            with open(path, 'w') as f:
+                f.write(content)
+        self.stdout.write('Wrote %s and %s.' % (output, stub_output))
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import json
+import logging
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_pluggableappsettings.usage import analyze, format_text
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Reports the settings of AppSettings classes that are never accessed and the accesses to undeclared ' \
+           'settings that fall through to django.conf.settings.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', help='The files and directories to scan. Defaults to the current '
+                                                     'directory.')
+        parser.add_argument('--jobs', '-j', type=int, default=None,
+                            help='The number of processes scanning files. Defaults to the number of CPUs.')
+        parser.add_argument('--exclude', action='append', default=[],
+                            help='The name of a directory to skip. Can be given multiple times.')
+        parser.add_argument('--format', choices=('text', 'json'), default='text', help='The output format.')
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or [os.getcwd()]
+        for path in paths:
+            if not os.path.exists(path):
+                raise CommandError('The path %s does not exist.' % path)
+        if options['jobs'] is not None and options['jobs'] < 1:
+            raise CommandError('The number of jobs has to be at least 1.')
+
+        report = analyze(paths, jobs=options['jobs'], exclude=options['exclude'])
+        if options['format'] == 'json':
+            self.stdout.write(json.dumps(report.as_dict(), indent=2, sort_keys=True))
+        else:
+            self.stdout.write(format_text(report))
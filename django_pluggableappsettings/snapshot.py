@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Picklable snapshots of the loaded values of AppSettings classes. A snapshot is taken once in the parent process and
+installed in child processes, e.g. the workers of a ProcessPoolExecutor or of a task queue, so these do not have to
+load the values again, which would e.g. call the callables of CalledOnceSettings again:
+
+    snapshot = take_snapshot(MyAppSettings)
+    with ProcessPoolExecutor(initializer=install_snapshot, initargs=(snapshot,)) as executor:
+        ...
+"""
+from __future__ import absolute_import
+import inspect
+import logging
+from collections import namedtuple
+from pydoc import locate
+
+from django_pluggableappsettings import SortedTuple, _resolution_lock
+from django_pluggableappsettings.fingerprint import dotted_path
+
+logger = logging.getLogger(__name__)
+
+# Stands for a class or function in a snapshot
+DottedPath = namedtuple('DottedPath', ['path'])
+
+# The containers whose items are encoded one by one
+_CONTAINER_TYPES = (list, tuple, set, frozenset, SortedTuple)
+
+
+def encode_value(value):
+    """
+    :param value: a loaded settings value
+    :return: the value with all classes and functions that can be imported by their dotted path replaced by a
+        DottedPath. Other values are kept as they are and have to be picklable themselves.
+    """
+    if type(value) in _CONTAINER_TYPES:
+        return type(value)(encode_value(item) for item in value)
+    if type(value) is dict:
+        return {encode_value(key): encode_value(item) for key, item in value.items()}
+    if inspect.isclass(value) or inspect.isfunction(value) or inspect.isbuiltin(value):
+        path = dotted_path(value)
+        # local classes and functions and lambdas can not be found by their path
+        if locate(path) is value:
+            return DottedPath(path)
+    return value
+
+
+def decode_value(value):
+    """
+    :param value: a value encoded by encode_value
+    :return: the value with all DottedPaths replaced by the object they stand for
+    :except: ValueError if the object of a DottedPath can not be imported
+    """
+    if type(value) in _CONTAINER_TYPES:
+        return type(value)(decode_value(item) for item in value)
+    if type(value) is dict:
+        return {decode_value(key): decode_value(item) for key, item in value.items()}
+    if type(value) is DottedPath:
+        located = locate(value.path)
+        if located is None:
+            raise ValueError('The object "%s" of the snapshot could not be found.' % value.path)
+        return located
+    return value
+
+
+class SettingsSnapshot(object):
+    """
+    The loaded values of one or more AppSettings classes. The values are stored as they are after loading, so the
+    callables of CalledEachTimeSettings are still called on each access after the snapshot has been installed.
+    """
+    def __init__(self, values):
+        """
+        :param values: a dict of the dotted paths of AppSettings classes to dicts of the names of their settings to the
+            encoded values
+        """
+        self.values = values
+
+    def get_appsettings(self, path):
+        """
+        :param path: the dotted path of an AppSettings class
+        :return: the AppSettings class
+        :except: ValueError if the class can not be found
+        """
+        appsettings = locate(path)
+        if appsettings is None or not hasattr(appsettings, '_settings'):
+            raise ValueError('The AppSettings class "%s" of the snapshot could not be found.' % path)
+        return appsettings
+
+    def install(self):
+        """
+        Stores the values of the snapshot as the loaded values of their AppSettings classes. Previously loaded values
+        are replaced and computed settings depending on them are invalidated.
+        """
+        for path, values in self.values.items():
+            appsettings = self.get_appsettings(path)
+            decoded = {}
+            for name, value in values.items():
+                if name not in appsettings._settings:
+                    logger.warning('Skipping the setting %s of the snapshot as %s does not declare it.', name, path)
+                    continue
+                decoded[name] = decode_value(value)
+
+            for name, value in decoded.items():
+                # a load of the setting at the same time must not overwrite the installed value
+                with appsettings._get_load_lock(name), _resolution_lock:
+                    setting = appsettings._settings[name]
+                    setting._value = value
+                    appsettings._set_entry(name, setting)
+            appsettings._invalidate_dependents(decoded)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, sorted(self.values))
+
+
+def take_snapshot(*appsettings_classes):
+    """
+    Loads all settings of the given AppSettings classes and takes a snapshot of their values
+    :param appsettings_classes: the AppSettings classes. They have to be importable by their dotted path.
+    :return: a SettingsSnapshot
+    """
+    values = {}
+    for appsettings in appsettings_classes:
+        class_values = {}
+        for name, setting in appsettings._settings.items():
+            entry = appsettings._values.get(name)
+            if entry is None:
+                entry = appsettings._load(name, setting)
+            class_values[name] = encode_value(entry.cached_value())
+        values[dotted_path(appsettings)] = class_values
+    return SettingsSnapshot(values)
+
+
+def install_snapshot(snapshot):
+    """
+    Installs a snapshot. Can be used as initializer of a ProcessPoolExecutor or multiprocessing Pool.
+    :param snapshot: a SettingsSnapshot
+    """
+    snapshot.install()
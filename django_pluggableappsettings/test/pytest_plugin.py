@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+A pytest plugin that provides fixtures to override values of AppSettings classes. It is registered automatically when
+the package is installed. The fixtures return an AppSettingsOverrider that is called with the AppSettings class and
+the values to override. The overrides are restored when the scope of the fixture ends:
+
+    def test_something(appsettings):
+        appsettings(MyAppSettings, MY_SETTING='new_value')
+        assert MyAppSettings.MY_SETTING == 'new_value'
+
+The fixtures appsettings, class_appsettings and module_appsettings are function, class and module scoped. The time
+spent overriding values is reported at the end of the test run.
+"""
+from __future__ import absolute_import
+import logging
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+# the number of values overridden by all fixtures and the seconds it took to override and restore them
+_totals = {'count': 0, 'seconds': 0.0}
+
+
+def _overrides():
+    from django_pluggableappsettings.test.utils import AppSettingsOverrider
+    overrider = AppSettingsOverrider()
+    try:
+        yield overrider
+    finally:
+        overrider.restore()
+        _totals['count'] += overrider.count
+        _totals['seconds'] += overrider.seconds
+
+
+@pytest.fixture
+def appsettings():
+    """
+    Overrides values of AppSettings classes for a single test
+    """
+    yield from _overrides()
+
+
+@pytest.fixture(scope='class')
+def class_appsettings():
+    """
+    Overrides values of AppSettings classes for all tests of a class
+    """
+    yield from _overrides()
+
+
+@pytest.fixture(scope='module')
+def module_appsettings():
+    """
+    Overrides values of AppSettings classes for all tests of a module
+    """
+    yield from _overrides()
+
+
+def pytest_terminal_summary(terminalreporter):
+    if _totals['count']:
+        terminalreporter.write_line('AppSettings overrides: %d values overridden in %.3fs' % (
+            _totals['count'], _totals['seconds']
+        ))
@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
 import logging
+from time import perf_counter
 
 from django.test.utils import override_settings
 
-from django_pluggableappsettings import Setting
+from django_pluggableappsettings import Setting, _resolution_lock
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,9 @@ class MockSetting(Setting):
     def _get_value(self):
         return self.default_value
 
+    def cached_value(self):
+        return self.default_value
+
 
 class override_appsettings(override_settings):
     def __init__(self, appsetting, **kwargs):
@@ -28,16 +32,79 @@ class override_appsettings(override_settings):
         self.orig_settings = {}
 
     def enable(self):
-        _values = self.appsetting._values
-        for key, new_value in self.options.items():
-            if not isinstance(new_value, Setting):
-                new_value = MockSetting(new_value)
-            #first make sure the setting is loaded
+        #first make sure the settings are loaded. This does not hold the lock, as loading runs the callables of the settings
+        for key in self.options:
             getattr(self.appsetting, key)
-            self.orig_settings[key] = _values[key]
-            _values[key] = new_value
+        with _resolution_lock:
+            _values = self.appsetting._values
+            for key, new_value in self.options.items():
+                if not isinstance(new_value, Setting):
+                    new_value = MockSetting(new_value)
+                # None if the setting has been invalidated in the meantime
+                self.orig_settings[key] = _values.get(key)
+                self.appsetting._set_entry(key, new_value)
+            # computed settings have to be computed again from the overridden values
+            self.appsetting._invalidate_dependents(list(self.options))
 
     def disable(self):
-        _values = self.appsetting._values
-        for key, orig_value in self.orig_settings.items():
-            _values[key] = orig_value
\ No newline at end of file
+        with _resolution_lock:
+            for key, orig_value in self.orig_settings.items():
+                if orig_value is None:
+                    self.appsetting._discard(key)
+                else:
+                    self.appsetting._set_entry(key, orig_value)
+            self.appsetting._invalidate_dependents(list(self.orig_settings))
+
+
+class AppSettingsOverrider(object):
+    """
+    Overrides values of AppSettings classes until restore() is called. Unlike override_appsettings it neither loads
+    the original values nor sends the setting_changed signal, so each override only replaces the loaded value.
+    """
+    def __init__(self):
+        # the replaced entries of the _values dicts as (AppSettings class, name, entry or None) tuples
+        self._replaced = []
+        # the number of overridden values and the seconds spent overriding and restoring them
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, appsetting, **kwargs):
+        """
+        Overrides the given settings of an AppSettings class
+        :param appsetting: the AppSettings class
+        :param kwargs: the names of the settings and their new values
+        :except: AttributeError if a setting is not declared by the AppSettings class
+        """
+        start = perf_counter()
+        try:
+            for key in kwargs:
+                if key not in appsetting._settings:
+                    raise AttributeError('The setting %s is not defined for %s' % (key, appsetting.__name__))
+            with _resolution_lock:
+                _values = appsetting._values
+                for key, new_value in kwargs.items():
+                    if not isinstance(new_value, Setting):
+                        new_value = MockSetting(new_value)
+                    self._replaced.append((appsetting, key, _values.get(key)))
+                    appsetting._set_entry(key, new_value)
+                # computed settings have to be computed again from the overridden values
+                appsetting._invalidate_dependents(list(kwargs))
+            self.count += len(kwargs)
+        finally:
+            self.seconds += perf_counter() - start
+
+    def restore(self):
+        """
+        Restores all overridden values in reverse order. Settings that were not loaded before they were overridden are
+        loaded again on their next access.
+        """
+        start = perf_counter()
+        with _resolution_lock:
+            while self._replaced:
+                appsetting, key, entry = self._replaced.pop()
+                if entry is None:
+                    appsetting._discard(key)
+                else:
+                    appsetting._set_entry(key, entry)
+                appsetting._invalidate_dependents([key])
+        self.seconds += perf_counter() - start
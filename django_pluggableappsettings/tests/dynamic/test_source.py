@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import json
+import logging
+import threading
+
+from django.core.exceptions import ValidationError
+from django.core.signals import request_started
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from mock import patch
+
+from django_pluggableappsettings import AppSettings, ComputedSetting, IntSetting, Setting, _resolution_lock
+from django_pluggableappsettings.dynamic.models import DynamicSetting, DynamicSettingsVersion
+from django_pluggableappsettings.dynamic.source import DatabaseSource, bump_version, database_source
+from django_pluggableappsettings.snapshot import take_snapshot
+from django_pluggableappsettings.test.utils import override_appsettings
+
+logger = logging.getLogger(__name__)
+
+
+class DynamicTestAppSettings(AppSettings):
+    _sources = (database_source,)
+    DYNAMIC_SETTING = Setting('default')
+    DYNAMIC_INTEGER = IntSetting(1)
+    DYNAMIC_OTHER = Setting('other')
+
+
+class DynamicTestSubAppSettings(DynamicTestAppSettings):
+    pass
+
+
+class DynamicTestComputedAppSettings(AppSettings):
+    COMPUTED = ComputedSetting(lambda value: value + '!', depends_on=[(DynamicTestAppSettings, 'DYNAMIC_SETTING')])
+
+
+PATH = '%s.DynamicTestAppSettings' % __name__
+
+CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def create(name, value):
+    return DynamicSetting.objects.create(appsettings=PATH, name=name, value=json.dumps(value))
+
+
+class DatabaseSourceTestCase(TestCase):
+    def setUp(self):
+        database_source.reset()
+        DynamicTestAppSettings.invalidate()
+
+    def tearDown(self):
+        database_source.reset()
+        DynamicTestAppSettings.invalidate()
+        DynamicTestSubAppSettings.invalidate()
+
+    def test_default(self):
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'default')
+
+    @override_settings(DYNAMIC_SETTING='settings.py')
+    def test_precedence(self):
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'settings.py')
+        create('DYNAMIC_SETTING', 'database')
+        DynamicTestAppSettings.invalidate()
+        database_source.reset()
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'database')
+
+    def test_single_query(self):
+        create('DYNAMIC_SETTING', 'database')
+        create('DYNAMIC_INTEGER', '2')
+        DynamicSetting.objects.create(appsettings='other.AppSettings', name='DYNAMIC_SETTING', value='"other"')
+        database_source.reset()
+        # the version and all DynamicSettings
+        with self.assertNumQueries(2):
+            self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'database')
+            self.assertEqual(DynamicTestAppSettings.DYNAMIC_INTEGER, 2)
+            self.assertEqual(DynamicTestAppSettings.DYNAMIC_OTHER, 'other')
+        with self.assertNumQueries(0):
+            self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'database')
+
+    def test_subclass(self):
+        # the DynamicSettings of a class do not apply to its subclasses and vice versa
+        create('DYNAMIC_INTEGER', 5)
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_INTEGER, 5)
+        self.assertEqual(DynamicTestSubAppSettings.DYNAMIC_INTEGER, 1)
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_INTEGER, 5)
+
+    def assertFetchedOutsideResolutionLock(self, load):
+        acquired = []
+
+        def acquire():
+            if _resolution_lock.acquire(timeout=5):
+                acquired.append(True)
+                _resolution_lock.release()
+
+        def fetch():
+            # another thread can load values while the DynamicSettings are fetched
+            thread = threading.Thread(target=acquire)
+            thread.start()
+            thread.join()
+            return {}
+
+        with patch.object(database_source, 'fetch', side_effect=fetch):
+            load()
+        self.assertEqual(acquired, [True])
+
+    def test_fetch_outside_resolution_lock(self):
+        self.assertFetchedOutsideResolutionLock(
+            lambda: self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'default')
+        )
+
+    def test_fetch_outside_resolution_lock_computed_input(self):
+        # the input is loaded while the computed setting of another class is loaded
+        self.assertFetchedOutsideResolutionLock(
+            lambda: self.assertEqual(DynamicTestComputedAppSettings.COMPUTED, 'default!')
+        )
+        DynamicTestComputedAppSettings.invalidate()
+
+    def test_fetch_outside_resolution_lock_snapshot(self):
+        self.assertFetchedOutsideResolutionLock(lambda: take_snapshot(DynamicTestAppSettings))
+
+    def test_fetch_outside_resolution_lock_fingerprint(self):
+        self.assertFetchedOutsideResolutionLock(DynamicTestAppSettings.fingerprint)
+
+    def test_fetch_outside_resolution_lock_override(self):
+        def load():
+            with override_appsettings(DynamicTestAppSettings, DYNAMIC_SETTING='overridden'):
+                self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'overridden')
+
+        self.assertFetchedOutsideResolutionLock(load)
+
+    def test_poll(self):
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'default')
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_OTHER, 'other')
+
+        # the version is unchanged
+        with self.assertNumQueries(1):
+            self.assertFalse(database_source.poll(force=True))
+
+        setting = create('DYNAMIC_SETTING', 'database')
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'default')
+        self.assertTrue(database_source.poll(force=True))
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'database')
+        # settings without changes stay loaded
+        self.assertIn('DYNAMIC_OTHER', DynamicTestAppSettings._values)
+
+        setting.delete()
+        self.assertTrue(database_source.poll(force=True))
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'default')
+
+    def test_poll_interval(self):
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'default')
+        database_source.poll(force=True)
+        DynamicSettingsVersion.objects.update(version=100)
+        with self.assertNumQueries(0):
+            self.assertFalse(database_source.poll())
+
+    def test_poll_before_loading(self):
+        with self.assertNumQueries(0):
+            self.assertFalse(database_source.poll(force=True))
+
+    def test_request_started(self):
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'default')
+        create('DYNAMIC_SETTING', 'database')
+        request_started.send(sender=self.__class__)
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'database')
+
+    def test_bump_version(self):
+        bump_version()
+        self.assertEqual(DynamicSettingsVersion.objects.get().version, 1)
+        bump_version()
+        self.assertEqual(DynamicSettingsVersion.objects.get().version, 2)
+        self.assertEqual(DatabaseSource().get_version(), 2)
+
+    @override_settings(CACHES=CACHES, DYNAMIC_SETTINGS_CACHE='default')
+    def test_cache_version(self):
+        from django.core.cache import caches
+        source = DatabaseSource()
+        cache = caches['default']
+        key = 'django_pluggableappsettings.dynamic.version'
+        version = source.get_version(cache, key)
+        self.assertIsNotNone(version)
+        self.assertEqual(source.get_version(cache, key), version)
+        with patch('django_pluggableappsettings.dynamic.source.transaction.on_commit', side_effect=lambda f: f()):
+            bump_version()
+        self.assertNotEqual(source.get_version(cache, key), version)
+
+    @override_settings(CACHES=CACHES, DYNAMIC_SETTINGS_CACHE='default')
+    def test_cache_poll(self):
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'default')
+        with patch('django_pluggableappsettings.dynamic.source.transaction.on_commit', side_effect=lambda f: f()):
+            create('DYNAMIC_SETTING', 'database')
+        self.assertTrue(database_source.poll(force=True))
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'database')
+
+    def test_database_error(self):
+        with patch('django_pluggableappsettings.dynamic.models.DynamicSetting.objects.all',
+                   side_effect=DatabaseError('no such table')), \
+                patch('django_pluggableappsettings.dynamic.source.logger') as logger:
+            self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'default')
+        self.assertEqual(logger.warning.call_count, 1)
+
+        # the values are loaded on the next poll
+        create('DYNAMIC_SETTING', 'database')
+        self.assertTrue(database_source.poll(force=True))
+        self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'database')
+
+    def test_invalid_json(self):
+        DynamicSetting.objects.create(appsettings=PATH, name='DYNAMIC_SETTING', value='invalid')
+        with patch('django_pluggableappsettings.dynamic.source.logger') as logger:
+            self.assertEqual(DynamicTestAppSettings.DYNAMIC_SETTING, 'default')
+        self.assertEqual(logger.warning.call_count, 1)
+
+
+class DynamicSettingTestCase(TestCase):
+    def test_get_value(self):
+        self.assertEqual(DynamicSetting(value='{"a": [1, 2]}').get_value(), {'a': [1, 2]})
+
+    def test_clean(self):
+        DynamicSetting(appsettings=PATH, name='DYNAMIC_SETTING', value='1').clean()
+        self.assertRaises(ValidationError, DynamicSetting(appsettings=PATH, name='DYNAMIC_SETTING', value='a').clean)
+
+    def test_str(self):
+        self.assertEqual(str(DynamicSetting(appsettings=PATH, name='DYNAMIC_SETTING')), PATH + '.DYNAMIC_SETTING')
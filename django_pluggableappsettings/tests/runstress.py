@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+import argparse
+import os
+import sys
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.abspath(BASE_DIR))
+
+import django
+from django.conf import settings
+
+settings.configure(
+    SECRET_KEY="django_tests_secret_key",
+    INSTALLED_APPS=(),
+)
+django.setup()
+
+from django_pluggableappsettings.tests import stress
+
+parser = argparse.ArgumentParser(description='Runs the concurrency stress test and benchmark of the AppSettings.')
+parser.add_argument(
+    '--threads', type=int, nargs='+',
+    help='The numbers of threads to run each scenario with. Defaults to powers of two up to the number of CPUs.'
+)
+args = parser.parse_args()
+
+thread_counts = args.threads
+if not thread_counts:
+    thread_counts = [1]
+    while thread_counts[-1] * 2 <= (os.cpu_count() or 1):
+        thread_counts.append(thread_counts[-1] * 2)
+
+results = stress.run(thread_counts)
+sys.stdout.write(stress.format_report(results) + '\n')
+sys.exit(1 if any(result.violations for result in results) else 0)
@@ -21,6 +21,8 @@ from django.core.management import execute_from_command_line
 # Unfortunately, apps can not be installed via ``modify_settings``
 # decorator, because it would miss the database setup.
 INSTALLED_APPS = (
+    'django_pluggableappsettings',
+    'django_pluggableappsettings.dynamic',
 )
 
 settings.configure(
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+A multi-threaded stress test and benchmark for the loading of AppSettings values. It runs three scenarios with a
+configurable number of threads and reports the throughput together with all correctness violations:
+
+- cold: all threads access the same settings right after they have been invalidated
+- warm: all threads read already loaded settings
+- override: all but one thread read settings while the remaining thread overrides and invalidates them
+
+Used by test_stress.py for the correctness checks and by runstress.py for the benchmark.
+"""
+from __future__ import absolute_import
+import logging
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from django_pluggableappsettings import AppSettings, CalledOnceSetting, ComputedSetting, IntSetting
+from django_pluggableappsettings.test.utils import override_appsettings
+
+logger = logging.getLogger(__name__)
+
+StressResult = namedtuple('StressResult', ['scenario', 'threads', 'operations', 'seconds', 'violations'])
+
+
+def gil_enabled():
+    """
+    :return: False if running on a free-threaded Python build with the GIL disabled
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+class CallCounter(object):
+    """
+    A callable for CalledOnceSettings that counts how often it is called
+    """
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+        # give other threads the chance to run into the same setting
+        time.sleep(0)
+        return self.value
+
+
+def create_appsettings(count):
+    """
+    Creates an AppSettings class with `count` settings of each of the types ONCE_<i> (CalledOnceSetting returning i),
+    INT_<i> (IntSetting with the default '<i>') and SUM_<i> (ComputedSetting of ONCE_<i> + INT_<i>)
+    :return: the AppSettings class and the CallCounters of the CalledOnceSettings
+    """
+    attributes = {}
+    counters = []
+    for i in range(count):
+        counter = CallCounter(i)
+        counters.append(counter)
+        attributes['ONCE_%d' % i] = CalledOnceSetting(counter)
+        attributes['INT_%d' % i] = IntSetting(str(i))
+        attributes['SUM_%d' % i] = ComputedSetting(
+            lambda once, integer: once + integer, depends_on=['ONCE_%d' % i, 'INT_%d' % i]
+        )
+    return type(AppSettings)('StressAppSettings', (AppSettings,), attributes), counters
+
+
+def _run_threads(threads, target):
+    """
+    Runs target(index, violations) in the given number of threads that are started at the same time
+    :return: the violations reported by the threads and the number of seconds it took until all threads finished
+    """
+    violations = []
+    barrier = threading.Barrier(threads + 1)
+
+    def run(index):
+        barrier.wait()
+        try:
+            target(index, violations)
+        except Exception as e:
+            violations.append('Thread %d raised %r' % (index, e))
+
+    workers = [threading.Thread(target=run, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return violations, time.perf_counter() - start
+
+
+def cold_resolution(threads, count=20, rounds=10):
+    """
+    All threads access all settings right after they have been invalidated. Each CalledOnceSetting has to be called
+    exactly once per round and all threads have to see the correct values.
+    """
+    appsettings, counters = create_appsettings(count)
+    violations = []
+    seconds = 0
+
+    def target(index, round_violations):
+        # start at different settings in each thread
+        for offset in range(count):
+            i = (index + offset) % count
+            value = getattr(appsettings, 'SUM_%d' % i)
+            if value != 2 * i:
+                round_violations.append('SUM_%d was %r instead of %r' % (i, value, 2 * i))
+
+    for _ in range(rounds):
+        appsettings.invalidate()
+        for counter in counters:
+            counter.calls = 0
+        round_violations, round_seconds = _run_threads(threads, target)
+        violations.extend(round_violations)
+        seconds += round_seconds
+        for i, counter in enumerate(counters):
+            if counter.calls != 1:
+                violations.append('ONCE_%d was called %d times instead of once' % (i, counter.calls))
+
+    return StressResult('cold', threads, threads * count * rounds, seconds, violations)
+
+
+def warm_reads(threads, count=20, iterations=20000):
+    """
+    All threads read already loaded settings
+    """
+    appsettings, _ = create_appsettings(count)
+    for i in range(count):
+        getattr(appsettings, 'SUM_%d' % i)
+
+    def target(index, violations):
+        for iteration in range(iterations):
+            i = (index + iteration) % count
+            value = getattr(appsettings, 'SUM_%d' % i)
+            if value != 2 * i:
+                violations.append('SUM_%d was %r instead of %r' % (i, value, 2 * i))
+
+    violations, seconds = _run_threads(threads, target)
+    return StressResult('warm', threads, threads * iterations, seconds, violations)
+
+
+def overrides(threads, iterations=20000):
+    """
+    One thread overrides INT_0 and invalidates ONCE_0 in a loop while all other threads read INT_0 and SUM_0. The
+    readers have to see either the original or the overridden value and the computed SUM_0 has to match one of them.
+    """
+    appsettings, _ = create_appsettings(1)
+    readers = max(threads - 1, 1)
+    done = threading.Event()
+    finished_readers = []
+
+    def target(index, violations):
+        if index == readers:
+            # the writer
+            while not done.is_set():
+                with override_appsettings(appsettings, INT_0=100):
+                    appsettings.invalidate('ONCE_0')
+            return
+        for _ in range(iterations):
+            integer = appsettings.INT_0
+            if integer not in (0, 100):
+                violations.append('INT_0 was %r' % integer)
+            total = appsettings.SUM_0
+            if total not in (0, 100):
+                violations.append('SUM_0 was %r' % total)
+        finished_readers.append(index)
+        if len(finished_readers) == readers:
+            done.set()
+
+    violations, seconds = _run_threads(readers + 1, target)
+    if appsettings.INT_0 != 0 or appsettings.SUM_0 != 0:
+        violations.append('The values were not restored after the overrides')
+    return StressResult('override', threads, readers * iterations * 2, seconds, violations)
+
+
+SCENARIOS = (cold_resolution, warm_reads, overrides)
+
+
+def run(thread_counts, scenarios=SCENARIOS):
+    """
+    :param thread_counts: the numbers of threads to run each scenario with
+    :return: a list of StressResults
+    """
+    return [scenario(threads) for scenario in scenarios for threads in thread_counts]
+
+
+def format_report(results):
+    """
+    :param results: a list of StressResults
+    :return: a table with the throughput of each run, its speedup compared to the run of the same scenario with the
+        fewest threads and all violations
+    """
+    lines = ['GIL enabled: %s' % gil_enabled(), '%-10s %8s %14s %9s %11s' % (
+        'scenario', 'threads', 'operations/s', 'speedup', 'violations'
+    )]
+    baselines = {}
+    for result in results:
+        throughput = result.operations / result.seconds if result.seconds else float('inf')
+        baseline = baselines.setdefault(result.scenario, throughput)
+        lines.append('%-10s %8d %14.0f %8.2fx %11d' % (
+            result.scenario, result.threads, throughput, throughput / baseline, len(result.violations)
+        ))
+    for result in results:
+        for violation in result.violations:
+            lines.append('%s/%d: %s' % (result.scenario, result.threads, violation))
+    return '\n'.join(lines)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import io
+import logging
+import os
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+from unittest import skipUnless
+
+from django.test import SimpleTestCase
+
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+logger = logging.getLogger(__name__)
+
+TEST_MODULE = '''
+from django_pluggableappsettings import AppSettings, Setting
+
+
+class PluginAppSettings(AppSettings):
+    SETTING = Setting('Value')
+    OTHER = Setting('Other')
+
+
+def test_function(appsettings):
+    appsettings(PluginAppSettings, SETTING='Function')
+    assert PluginAppSettings.SETTING == 'Function'
+
+
+def test_restored():
+    assert PluginAppSettings.SETTING == 'Value'
+
+
+def test_module(module_appsettings, appsettings):
+    module_appsettings(PluginAppSettings, OTHER='Module')
+    appsettings(PluginAppSettings, OTHER='Function')
+    assert PluginAppSettings.OTHER == 'Function'
+
+
+def test_module_still_overridden():
+    assert PluginAppSettings.OTHER == 'Module'
+
+
+class TestClass(object):
+    def test_class(self, class_appsettings):
+        class_appsettings(PluginAppSettings, SETTING='Class')
+        assert PluginAppSettings.SETTING == 'Class'
+
+    def test_class_still_overridden(self):
+        assert PluginAppSettings.SETTING == 'Class'
+
+
+def test_class_restored():
+    assert PluginAppSettings.SETTING == 'Value'
+
+
+def test_undeclared(appsettings):
+    try:
+        appsettings(PluginAppSettings, UNKNOWN='value')
+    except AttributeError:
+        pass
+    else:
+        assert False
+'''
+
+
+@skipUnless(pytest, 'pytest is not installed')
+class PytestPluginTestCase(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        with open(os.path.join(self.directory, 'test_plugin.py'), 'w') as f:
+            f.write(TEST_MODULE)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_fixtures(self):
+        from django_pluggableappsettings.test import pytest_plugin
+        pytest_plugin._totals.update(count=0, seconds=0.0)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            # the plugin may already be registered by its entry point
+            result = pytest.main([
+                self.directory, '-p', 'no:cacheprovider', '-p', 'no:django_pluggableappsettings', '-q'
+            ], plugins=[pytest_plugin])
+        self.assertEqual(result, 0, output.getvalue())
+        self.assertIn('AppSettings overrides: 4 values overridden in', output.getvalue())
@@ -3,9 +3,9 @@ from __future__ import absolute_import
 import logging
 from django.test import TestCase
 from django.test.utils import override_settings
-from mock import patch
-from django_pluggableappsettings import AppSettings, Setting
-from django_pluggableappsettings.test.utils import MockSetting, override_appsettings
+from mock import Mock, patch
+from django_pluggableappsettings import AppSettings, ComputedSetting, Setting
+from django_pluggableappsettings.test.utils import AppSettingsOverrider, MockSetting, override_appsettings
 
 
 logger = logging.getLogger(__name__)
@@ -51,3 +51,79 @@ class override_appsettingsTestCase(TestCase):
 
         #value after:
         self.assertEqual(TestAppSettings.SETTING, 'Custom value')
+
+
+class OverriderAppSettings(AppSettings):
+    SETTING = Setting('Value')
+    OTHER = Setting('Other')
+    COMPUTED = ComputedSetting(lambda value: value.upper(), depends_on=['SETTING'])
+
+
+class AppSettingsOverriderTestCase(TestCase):
+    def setUp(self):
+        OverriderAppSettings.invalidate()
+        self.overrider = AppSettingsOverrider()
+
+    def tearDown(self):
+        self.overrider.restore()
+
+    def test_override(self):
+        self.assertEqual(OverriderAppSettings.SETTING, 'Value')
+        self.assertEqual(OverriderAppSettings.COMPUTED, 'VALUE')
+        self.overrider(OverriderAppSettings, SETTING='Overridden')
+        self.assertEqual(OverriderAppSettings.SETTING, 'Overridden')
+        self.assertEqual(OverriderAppSettings.COMPUTED, 'OVERRIDDEN')
+        self.overrider.restore()
+        self.assertEqual(OverriderAppSettings.SETTING, 'Value')
+        self.assertEqual(OverriderAppSettings.COMPUTED, 'VALUE')
+        self.assertEqual(self.overrider.count, 1)
+        self.assertGreater(self.overrider.seconds, 0)
+
+    def test_override_not_loaded(self):
+        factory = Mock(return_value='Default')
+
+        class Settings(AppSettings):
+            SETTING = Setting(default_factory=factory)
+
+        self.overrider(Settings, SETTING='Overridden')
+        self.assertEqual(Settings.SETTING, 'Overridden')
+        # the original value is not loaded
+        factory.assert_not_called()
+        self.overrider.restore()
+        self.assertEqual(Settings.SETTING, 'Default')
+
+    def test_restore_not_loaded(self):
+        self.overrider(OverriderAppSettings, SETTING='Overridden', OTHER='Overridden other')
+        self.assertEqual(OverriderAppSettings.OTHER, 'Overridden other')
+        self.overrider.restore()
+        self.assertNotIn('SETTING', OverriderAppSettings._values)
+        self.assertEqual(OverriderAppSettings.SETTING, 'Value')
+        self.assertEqual(OverriderAppSettings.OTHER, 'Other')
+
+    def test_nested(self):
+        self.overrider(OverriderAppSettings, SETTING='First')
+        self.overrider(OverriderAppSettings, SETTING='Second')
+        self.assertEqual(OverriderAppSettings.SETTING, 'Second')
+        self.overrider.restore()
+        self.assertEqual(OverriderAppSettings.SETTING, 'Value')
+
+    def test_setting_instance(self):
+        setting = MockSetting('Mocked')
+        self.overrider(OverriderAppSettings, SETTING=setting)
+        self.assertIs(OverriderAppSettings._values['SETTING'], setting)
+
+    @patch('django_pluggableappsettings.test.utils.override_settings.enable')
+    def test_no_signal(self, enable):
+        with patch('django.test.signals.setting_changed.send') as send:
+            self.overrider(OverriderAppSettings, SETTING='Overridden')
+            self.overrider.restore()
+        send.assert_not_called()
+        enable.assert_not_called()
+
+    def test_undeclared(self):
+        self.assertRaisesMessage(
+            AttributeError, 'The setting UNKNOWN is not defined for OverriderAppSettings',
+            self.overrider, OverriderAppSettings, SETTING='Overridden', UNKNOWN='value'
+        )
+        # nothing has been overridden
+        self.assertNotIn('SETTING', OverriderAppSettings._values)
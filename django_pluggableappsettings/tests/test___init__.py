@@ -2,6 +2,10 @@
 from __future__ import absolute_import
 
 import logging
+import pickle
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from django.test import TestCase
 
@@ -11,7 +15,10 @@ except ImportError:
     from django.test.utils import override_settings
 from mock import MagicMock, patch
 from django_pluggableappsettings import AppSettings, FloatSetting, IntSetting, IterableSetting, Setting, ClassSetting, NOT_SET_VALUE, StringSetting, TypedSetting, \
-    CalledOnceSetting, CalledBaseSetting, CallableSetting, CalledEachTimeSetting
+    CalledOnceSetting, CalledBaseSetting, CallableSetting, CalledEachTimeSetting, ComputedSetting, CollectionSetting, \
+    TupleSetting, FrozenSetSetting, SortedTupleSetting, SortedTuple, RegexSetting, PatternSet, PatternSetSetting, \
+    CALLED_ONCE, CALLED_EACH_TIME, MemoizedCallable, ParametrizedSetting, CacheInfo, _refers_to_groups
+from django_pluggableappsettings.test.utils import override_appsettings
 
 
 logger = logging.getLogger(__name__)
@@ -138,6 +145,66 @@ class AppSettingsTestCase(TestAppSettingsTestCase):
         self.assertEqual(Settings2.TEST, id_obj2)
         self.assertEqual(Settings2.TEST2, id_obj2)
 
+    def test_slow_load_does_not_block_other_classes(self):
+        started = threading.Event()
+        released = threading.Event()
+
+        def slow():
+            started.set()
+            return released.wait(5)
+
+        class SlowSettings(AppSettings):
+            SLOW = CalledOnceSetting(slow)
+
+        class OtherSettings(AppSettings):
+            OTHER = Setting('other')
+
+        thread = threading.Thread(target=lambda: SlowSettings.SLOW)
+        thread.start()
+        try:
+            self.assertTrue(started.wait(5))
+            # loads while SLOW is still being loaded
+            self.assertEqual(OtherSettings.OTHER, 'other')
+        finally:
+            released.set()
+            thread.join()
+        # slow() did not time out
+        self.assertIs(SlowSettings.SLOW, True)
+
+    def test_load_from_another_thread(self):
+        executor = ThreadPoolExecutor(1)
+
+        def load_in_thread():
+            return executor.submit(lambda: ThreadSettings.INNER).result(timeout=5)
+
+        class ThreadSettings(AppSettings):
+            INNER = Setting('inner')
+            OUTER = CalledOnceSetting(load_in_thread)
+
+        try:
+            self.assertEqual(ThreadSettings.OUTER, 'inner')
+        finally:
+            # does not wait, so a deadlocked worker can not block the tests
+            executor.shutdown(wait=False)
+
+    def test_invalidate_while_loading(self):
+        calls = []
+
+        def load():
+            calls.append(True)
+            if len(calls) == 1:
+                InvalidatedSettings.invalidate('VALUE')
+            return len(calls)
+
+        class InvalidatedSettings(AppSettings):
+            VALUE = CalledOnceSetting(load)
+
+        # the value loaded before the invalidation is returned, but not stored
+        self.assertEqual(InvalidatedSettings.VALUE, 1)
+        self.assertNotIn('VALUE', InvalidatedSettings._values)
+        self.assertEqual(InvalidatedSettings.VALUE, 2)
+        self.assertEqual(InvalidatedSettings.VALUE, 2)
+
 
 
 
@@ -195,6 +262,57 @@ class SettingTestCase(TestCase):
         val = setting._get('SETTING', 'settings_value')
         self.assertEqual(val, 'settings_value')
 
+    def test___init___default_factory(self):
+        factory = MagicMock(return_value='default')
+        setting = Setting(default_factory=factory)
+        self.assertEqual(setting._default_factory, factory)
+        factory.assert_not_called()
+
+        self.assertRaisesMessage(
+            ValueError, 'Only one of default_value and default_factory can be given.', Setting, 'default',
+            default_factory=factory
+        )
+        self.assertRaisesMessage(ValueError, 'The default_factory has to be a callable.', Setting, default_factory=1)
+
+    def test__get_default_factory(self):
+        factory = MagicMock(return_value='default')
+        setting = Setting(default_factory=factory)
+        self.assertEqual(setting._get('SETTING', 'settings_value'), 'settings_value')
+        factory.assert_not_called()
+
+        self.assertEqual(setting._get('SETTING', NOT_SET_VALUE), 'default')
+        factory.assert_called_once_with()
+
+    def test_default_factory_cached(self):
+        factory = MagicMock(return_value='default')
+
+        class Settings(AppSettings):
+            SETTING = Setting(default_factory=factory, aliases=['ALIAS'])
+
+        self.assertEqual(Settings.SETTING, 'default')
+        self.assertEqual(Settings.SETTING, 'default')
+        factory.assert_called_once_with()
+
+        Settings.invalidate()
+        with override_settings(ALIAS='alias'):
+            self.assertEqual(Settings.SETTING, 'alias')
+        factory.assert_called_once_with()
+
+    def test_default_factory_subclasses(self):
+        self.assertEqual(IntSetting(default_factory=lambda: '3')._get('SETTING', NOT_SET_VALUE), 3)
+        self.assertEqual(
+            ClassSetting(default_factory=lambda: 'django_pluggableappsettings.tests.test___init__.TestClass')._get(
+                'SETTING', NOT_SET_VALUE
+            ),
+            TestClass
+        )
+        self.assertEqual(
+            CalledOnceSetting(default_factory=lambda: lambda: 'called')._get('SETTING', NOT_SET_VALUE), 'called'
+        )
+        self.assertEqual(
+            FrozenSetSetting(default_factory=lambda: range(3))._get('SETTING', NOT_SET_VALUE), frozenset([0, 1, 2])
+        )
+
     def test_get(self):
         with patch('django_pluggableappsettings.Setting._get', MagicMock(return_value=42)) as _get:
             setting = Setting('default')
@@ -222,6 +340,115 @@ class SettingTestCase(TestCase):
             _get_value.assert_called_with()
 
 
+class SettingPipelineTestCase(TestCase):
+    def test___init__(self):
+        setting = Setting(call_policy=CALLED_EACH_TIME)
+        self.assertEqual(setting._call_policy, CALLED_EACH_TIME)
+        self.assertEqual(CalledOnceSetting(call_policy=None)._call_policy, None)
+        self.assertEqual(CalledOnceSetting()._call_policy, CALLED_ONCE)
+        self.assertRaisesMessage(
+            ValueError, 'The call_policy has to be None, CALLED_ONCE or CALLED_EACH_TIME.', Setting, call_policy='always'
+        )
+        self.assertRaisesMessage(
+            ValueError, 'The post_process argument has to be a callable.', Setting, post_process='upper'
+        )
+
+    def test_get_pipeline(self):
+        setting = Setting()
+        self.assertEqual(setting.get_pipeline(), ([setting._load_value], []))
+
+        setting = IntSetting(call_policy=CALLED_ONCE, validators=[MagicMock()], post_process=MagicMock())
+        self.assertEqual(setting.get_pipeline(), (
+            [setting._load_value, setting._call_value, setting._cast, setting._validate, setting._post_process], []
+        ))
+
+        setting = IntSetting(call_policy=CALLED_EACH_TIME)
+        self.assertEqual(setting.get_pipeline(), ([setting._load_value], [setting._call_value, setting._cast]))
+
+        setting = CalledEachTimeSetting(force_callable=True)
+        self.assertEqual(setting.get_pipeline(), ([setting._load_value, setting._check_callable], [setting._call_value]))
+
+    def test_validators(self):
+        def positive(value):
+            if value <= 0:
+                raise ValueError('The value has to be positive')
+
+        setting = IntSetting(validators=[positive])
+        self.assertEqual(setting._get('SETTING', '5'), 5)
+        self.assertRaisesMessage(ValueError, 'The value has to be positive', setting._get, 'SETTING', '-5')
+
+    def test_post_process(self):
+        setting = StringSetting(post_process=str.upper)
+        self.assertEqual(setting._get('SETTING', 'value'), 'VALUE')
+
+    def test_typed_called_once(self):
+        function = MagicMock(return_value='5')
+        setting = IntSetting(function, call_policy=CALLED_ONCE)
+        self.assertEqual(setting._get('SETTING', NOT_SET_VALUE), 5)
+        self.assertRaisesMessage(
+            ValueError, 'The value for setting SETTING cannot be casted to type int', setting._get, 'SETTING',
+            lambda: 'a'
+        )
+
+    def test_typed_called_each_time(self):
+        function = MagicMock(side_effect=['1', '2', 'a'])
+
+        class Settings(AppSettings):
+            SETTING = IntSetting(function, call_policy=CALLED_EACH_TIME)
+
+        self.assertEqual(Settings.SETTING, 1)
+        self.assertEqual(Settings.SETTING, 2)
+        self.assertRaisesMessage(
+            ValueError, 'The value for setting SETTING cannot be casted to type int', getattr, Settings, 'SETTING'
+        )
+
+    def test_compile(self):
+        setting = IntSetting(validators=[MagicMock()])
+        setting.compile('SETTING')
+        self.assertEqual(setting._name, 'SETTING')
+        with patch('django_pluggableappsettings.Setting._get') as _get:
+            setting.get('SETTING', '1')
+            _get.assert_not_called()
+        self.assertEqual(setting._value, 1)
+        self.assertEqual(setting.value(), 1)
+
+        setting = CalledEachTimeSetting(call_policy=CALLED_EACH_TIME, validators=[MagicMock()])
+        setting.compile('SETTING')
+        setting.get('SETTING', MagicMock(return_value='called'))
+        self.assertEqual(setting.value(), 'called')
+
+        setting = Setting()
+        setting.compile('SETTING')
+        self.assertRaises(RuntimeError, setting.value)
+
+    def test_compile_on_class_creation(self):
+        setting = IntSetting(1)
+
+        class Settings(AppSettings):
+            SETTING = setting
+
+        self.assertEqual(setting._name, 'SETTING')
+        self.assertIsNotNone(setting._compiled_get)
+        self.assertIsNotNone(setting._compiled_value)
+        self.assertEqual(Settings.SETTING, 1)
+
+    def test_compile_overwritten_get(self):
+        class CustomSetting(Setting):
+            def _get(self, setting_name, setting_value):
+                return 'custom'
+
+            def _get_value(self):
+                return 'custom value'
+
+        class Settings(AppSettings):
+            SETTING = CustomSetting()
+
+        self.assertIsNone(Settings.__dict__['SETTING']._compiled_get)
+        self.assertIsNone(Settings.__dict__['SETTING']._compiled_value)
+        self.assertEqual(Settings.SETTING, 'custom value')
+        self.assertEqual(Settings.__dict__['SETTING']._value, 'custom')
+
+
 class CalledBaseSettingTestCase(TestCase):
     def test___init__(self):
         setting = CalledBaseSetting(force_callable=True)
@@ -268,9 +495,11 @@ class CalledEachTimeSettingTestCase(TestCase):
     def test__get_value_callable(self):
         setting = CalledEachTimeSetting()
         id_object = object()
-        with patch('django_pluggableappsettings.CalledBaseSetting._get_value', MagicMock(return_value=MagicMock(return_value=id_object))) as _get_value:
-            value = setting._get_value()
-            self.assertEqual(value, id_object)
+        setting._value = MagicMock(return_value=id_object)
+        value = setting._get_value()
+        self.assertEqual(value, id_object)
+        value = setting._get_value()
+        self.assertEqual(setting._value.call_count, 2)
 
     def test__get_value_not_callable(self):
         setting = CalledEachTimeSetting(force_callable=False)
@@ -365,4 +594,586 @@ class IterableSettingTestCase(TestCase):
     def test_initialization(self):
         IterableSetting()
 
-        
\ No newline at end of file
+
+class SortedTupleTestCase(TestCase):
+    def test_sorted(self):
+        values = SortedTuple([3, 1, 2])
+        self.assertEqual(values, (1, 2, 3))
+        self.assertEqual(SortedTuple(), ())
+
+    def test_contains(self):
+        values = SortedTuple([5, 1, 3])
+        self.assertIn(1, values)
+        self.assertIn(5, values)
+        self.assertNotIn(0, values)
+        self.assertNotIn(4, values)
+        self.assertNotIn(6, values)
+        self.assertNotIn('a', values)
+
+    def test_between(self):
+        values = SortedTuple([5, 1, 3, 7])
+        self.assertEqual(values.between(3, 5), (3, 5))
+        self.assertEqual(values.between(2, 6), (3, 5))
+        self.assertEqual(values.between(low=4), (5, 7))
+        self.assertEqual(values.between(high=4), (1, 3))
+        self.assertEqual(values.between(8, 9), ())
+
+
+class CollectionSettingTestCase(TestCase):
+    def test___init__(self):
+        setting = CollectionSetting(element_type=int, cast_elements=True)
+        self.assertEqual(setting._element_type, int)
+        self.assertTrue(setting._cast_elements)
+
+        setting = CollectionSetting()
+        self.assertIsNone(setting._element_type)
+        self.assertFalse(setting._cast_elements)
+
+    def test__get(self):
+        setting = CollectionSetting((1, 2))
+        self.assertEqual(setting._get('SETTING', NOT_SET_VALUE), (1, 2))
+        self.assertEqual(setting._get('SETTING', ['a', 1]), ('a', 1))
+
+    def test__get_generator(self):
+        setting = CollectionSetting(element_type=int)
+        self.assertEqual(setting._get('SETTING', (i for i in range(3))), (0, 1, 2))
+
+    def test__get_string(self):
+        setting = CollectionSetting()
+        self.assertRaisesMessage(
+            ValueError, 'The value for setting SETTING has to be a collection and not a string', setting._get, 'SETTING',
+            'abc'
+        )
+
+    def test__get_element_type(self):
+        setting = CollectionSetting(element_type=int)
+        self.assertEqual(setting._get('SETTING', [1, 2]), (1, 2))
+        self.assertRaisesMessage(
+            ValueError, "The element '2' of setting SETTING is not of type int", setting._get, 'SETTING', [1, '2']
+        )
+
+    def test__get_cast_elements(self):
+        setting = CollectionSetting(element_type=int, cast_elements=True)
+        self.assertEqual(setting._get('SETTING', ['1', 2]), (1, 2))
+        self.assertRaisesMessage(
+            ValueError, "The element 'a' of setting SETTING cannot be casted to type int", setting._get, 'SETTING',
+            [1, 'a']
+        )
+
+    def test__get_unhashable_elements(self):
+        setting = FrozenSetSetting()
+        self.assertRaisesMessage(
+            ValueError, 'The elements of setting SETTING cannot be stored in a frozenset', setting._get, 'SETTING',
+            [[1]]
+        )
+
+    def test_collection_types(self):
+        self.assertEqual(TupleSetting()._get('SETTING', [2, 1]), (2, 1))
+
+        value = FrozenSetSetting()._get('SETTING', [2, 1, 1])
+        self.assertIsInstance(value, frozenset)
+        self.assertEqual(value, frozenset([1, 2]))
+
+        value = SortedTupleSetting(element_type=str)._get('SETTING', ['b', 'a'])
+        self.assertIsInstance(value, SortedTuple)
+        self.assertEqual(value, ('a', 'b'))
+
+
+class RegexSettingTestCase(TestCase):
+    def test__get_string(self):
+        setting = RegexSetting(r'^a+$')
+        value = setting._get('SETTING', NOT_SET_VALUE)
+        self.assertEqual(value, re.compile(r'^a+$'))
+
+    def test__get_flags(self):
+        setting = RegexSetting(flags=re.IGNORECASE)
+        value = setting._get('SETTING', 'abc')
+        self.assertTrue(value.match('ABC'))
+
+    def test__get_compiled(self):
+        regex = re.compile('abc')
+        setting = RegexSetting()
+        self.assertIs(setting._get('SETTING', regex), regex)
+
+    def test__get_invalid(self):
+        setting = RegexSetting()
+        self.assertRaisesMessage(
+            ValueError,
+            'The value for the setting SETTING either has to be a string or a compiled regular expression.',
+            setting._get, 'SETTING', 1
+        )
+        self.assertRaisesMessage(
+            ValueError, 'The value for the setting SETTING is not a valid regular expression:', setting._get, 'SETTING',
+            '(a'
+        )
+
+
+class PatternSetTestCase(TestCase):
+    def test_search(self):
+        patterns = PatternSet(['foo', 'ba[rz]', r'\d+'])
+        result = patterns.search('xx baz 12')
+        self.assertEqual(result.index, 1)
+        self.assertEqual(result.pattern, 'ba[rz]')
+        self.assertEqual(result.match.group(), 'baz')
+
+        result = patterns.search('12 foo')
+        self.assertEqual(result.index, 2)
+
+        self.assertIsNone(patterns.search('nothing'))
+
+    def test_search_same_position(self):
+        # the first pattern wins if multiple patterns match at the same position
+        patterns = PatternSet(['ab', 'a', 'abc'])
+        self.assertEqual(patterns.search('xabc').index, 0)
+
+    def test_match(self):
+        patterns = PatternSet(['foo', 'bar'])
+        self.assertEqual(patterns.match('bar foo').index, 1)
+        self.assertIsNone(patterns.match(' foo'))
+
+    def test_fullmatch(self):
+        patterns = PatternSet(['a', 'ab'])
+        self.assertEqual(patterns.fullmatch('ab').index, 1)
+        self.assertIsNone(patterns.fullmatch('abc'))
+
+    def test_groups(self):
+        patterns = PatternSet(['x', r'(a)\1', '(?P<name>b)c', 'y'])
+        self.assertEqual([index for index, _ in patterns._separate], [1])
+        self.assertEqual(patterns.search('--aa').index, 1)
+        self.assertEqual(patterns.search('--a-bc').index, 2)
+        self.assertEqual(patterns.search('bcx').index, 2)
+        self.assertEqual(patterns.search('xbc').index, 0)
+        self.assertIsNone(patterns.search('a-b'))
+
+    def test_groups_combined(self):
+        patterns = PatternSet([r'^/(en|de)/admin/', r'^/static/((\w+)/)+', r'^/(?P<lang>en|de)/api/', '^/health'])
+        self.assertEqual(patterns._separate, [])
+        result = patterns.match('/de/admin/users/')
+        self.assertEqual(result.index, 0)
+        self.assertEqual(result.match.group(1), 'de')
+        result = patterns.search('/static/css/main/x')
+        self.assertEqual(result.index, 1)
+        self.assertEqual(result.match.groups(), ('main/', 'main'))
+        result = patterns.match('/en/api/')
+        self.assertEqual(result.index, 2)
+        self.assertEqual(result.match.group('lang'), 'en')
+        result = patterns.fullmatch('/health')
+        self.assertEqual(result.index, 3)
+        self.assertEqual(result.match.group(), '/health')
+        self.assertIsNone(patterns.match('/fr/admin/'))
+
+    def test_conflicting_groups(self):
+        patterns = PatternSet([r'(?P<name>a)', r'(?P<name>b)', r'(?P<other>c)(?P=other)', r'(x)?(?(1)y|z)'])
+        self.assertEqual([index for index, _ in patterns._separate], [1, 2, 3])
+        self.assertEqual(patterns.search('-b').match.group('name'), 'b')
+        self.assertEqual(patterns.search('-cc').index, 2)
+        self.assertEqual(patterns.search('-xy').index, 3)
+        # escaped backslashes are no back references
+        self.assertEqual(PatternSet([r'(a)\\1'])._separate, [])
+
+    def test_inline_flags(self):
+        patterns = PatternSet(['(?i)abc', 'def', '(?s)(?m)^g.h'])
+        self.assertEqual(patterns._separate, [])
+        self.assertEqual(patterns.search('ABC').index, 0)
+        self.assertEqual(patterns.search('def').index, 1)
+        # the flags only apply to their own pattern
+        self.assertIsNone(patterns.search('DEF'))
+        self.assertEqual(patterns.search('x\ng\nh').index, 2)
+
+    def test_inline_flags_not_at_start(self):
+        # global inline flags that are not at the start are only deprecated on Python < 3.11 and apply to the whole
+        # expression, so such patterns are matched separately
+        self.assertTrue(_refers_to_groups('d(?i)ef'))
+        self.assertFalse(_refers_to_groups('d(?i:e)f'))
+        self.assertFalse(_refers_to_groups(r'd\(?i)'))
+
+    def test_verbose(self):
+        patterns = PatternSet(['(?x) a b  # comment', 'c d'], flags=0)
+        self.assertEqual(patterns._separate, [])
+        self.assertEqual(patterns.search('ab').index, 0)
+        self.assertEqual(patterns.search('c d').index, 1)
+        patterns = PatternSet(['a # comment', 'b'], flags=re.VERBOSE)
+        self.assertEqual(patterns.search('b').index, 1)
+
+    def test_flags(self):
+        patterns = PatternSet(['abc'], flags=re.IGNORECASE)
+        self.assertEqual(patterns.search('ABC').index, 0)
+
+    def test_invalid(self):
+        self.assertRaises(re.error, PatternSet, ['(a'])
+
+    def test_container(self):
+        patterns = PatternSet(['a', 'b'])
+        self.assertEqual(len(patterns), 2)
+        self.assertEqual(list(patterns), ['a', 'b'])
+        self.assertEqual(patterns, PatternSet(['a', 'b']))
+        self.assertNotEqual(patterns, PatternSet(['a', 'b'], flags=re.IGNORECASE))
+        self.assertEqual(pickle.loads(pickle.dumps(patterns)), patterns)
+        self.assertIsNone(PatternSet([]).search('a'))
+
+
+class PatternSetSettingTestCase(TestCase):
+    def test__get(self):
+        setting = PatternSetSetting(['a', 'b'], flags=re.IGNORECASE)
+        value = setting._get('SETTING', NOT_SET_VALUE)
+        self.assertEqual(value, PatternSet(['a', 'b'], flags=re.IGNORECASE))
+
+        patterns = PatternSet(['c'])
+        self.assertIs(setting._get('SETTING', patterns), patterns)
+
+    def test__get_invalid(self):
+        setting = PatternSetSetting()
+        self.assertRaisesMessage(
+            ValueError, 'The value for the setting SETTING has to be an iterable of regular expressions.',
+            setting._get, 'SETTING', 'abc'
+        )
+        self.assertRaisesMessage(
+            ValueError, 'The pattern 1 of the setting SETTING is not a string.', setting._get, 'SETTING', ['a', 1]
+        )
+        self.assertRaisesMessage(
+            ValueError, "The pattern '(a' of the setting SETTING is not a valid regular expression:",
+            setting._get, 'SETTING', ['a', '(a']
+        )
+
+
+class MemoizedCallableTestCase(TestCase):
+    def test_memoize(self):
+        function = MagicMock(side_effect=lambda *args, **kwargs: (args, kwargs))
+        memoized = MemoizedCallable(function)
+
+        self.assertEqual(memoized(1, b=2), ((1,), {'b': 2}))
+        self.assertEqual(memoized(1, b=2), ((1,), {'b': 2}))
+        self.assertEqual(memoized(1), ((1,), {}))
+        self.assertEqual(function.call_count, 2)
+        self.assertEqual(memoized.cache_info(), CacheInfo(hits=1, misses=2, maxsize=128, currsize=2))
+
+    def test_lru(self):
+        function = MagicMock(side_effect=lambda x: x * 2)
+        memoized = MemoizedCallable(function, maxsize=2)
+
+        memoized(1)
+        memoized(2)
+        memoized(1)
+        # evicts 2 as it is the least recently used
+        memoized(3)
+        self.assertEqual(memoized.cache_info().currsize, 2)
+
+        function.reset_mock()
+        memoized(1)
+        memoized(3)
+        function.assert_not_called()
+        memoized(2)
+        function.assert_called_once_with(2)
+
+    def test_no_cache(self):
+        function = MagicMock(return_value='result')
+        memoized = MemoizedCallable(function, maxsize=0)
+        memoized(1)
+        memoized(1)
+        self.assertEqual(function.call_count, 2)
+        self.assertEqual(memoized.cache_info(), CacheInfo(hits=0, misses=2, maxsize=0, currsize=0))
+
+    def test_unbounded(self):
+        memoized = MemoizedCallable(lambda x: x, maxsize=None)
+        for i in range(200):
+            memoized(i)
+        self.assertEqual(memoized.cache_info().currsize, 200)
+
+    @patch('django_pluggableappsettings.monotonic')
+    def test_ttl(self, monotonic):
+        monotonic.return_value = 100
+        function = MagicMock(return_value='result')
+        memoized = MemoizedCallable(function, ttl=10)
+
+        memoized(1)
+        monotonic.return_value = 109
+        memoized(1)
+        self.assertEqual(function.call_count, 1)
+
+        monotonic.return_value = 110
+        memoized(1)
+        self.assertEqual(function.call_count, 2)
+        self.assertEqual(memoized.cache_info(), CacheInfo(hits=1, misses=2, maxsize=128, currsize=1))
+
+    def test_cache_clear(self):
+        function = MagicMock(return_value='result')
+        memoized = MemoizedCallable(function)
+        memoized(1)
+        memoized(1)
+        memoized.cache_clear()
+        self.assertEqual(memoized.cache_info(), CacheInfo(hits=0, misses=0, maxsize=128, currsize=0))
+        memoized(1)
+        self.assertEqual(function.call_count, 2)
+
+    def test_clear_during_call(self):
+        memoized = MemoizedCallable(lambda x: memoized.cache_clear() or x)
+        memoized(1)
+        # the result computed before the clear is not stored
+        self.assertEqual(memoized.cache_info().currsize, 0)
+
+
+def get_limit(country):
+    return {'DE': 10}.get(country, 1)
+
+
+class ParametrizedSettingTestCase(TestCase):
+    def test___init__(self):
+        setting = ParametrizedSetting(maxsize=10, ttl=5)
+        self.assertEqual(setting._maxsize, 10)
+        self.assertEqual(setting._ttl, 5)
+
+    def test__get(self):
+        setting = ParametrizedSetting(get_limit, maxsize=10, ttl=5)
+        value = setting._get('SETTING', NOT_SET_VALUE)
+        self.assertIsInstance(value, MemoizedCallable)
+        self.assertEqual(value.function, get_limit)
+        self.assertEqual(value.maxsize, 10)
+        self.assertEqual(value.ttl, 5)
+        self.assertEqual(value('DE'), 10)
+
+        self.assertRaisesMessage(
+            ValueError, 'The value for the setting SETTING has to be a callable.', setting._get, 'SETTING', 1
+        )
+
+    def test_access(self):
+        class Settings(AppSettings):
+            LIMIT = ParametrizedSetting(get_limit)
+
+        self.assertEqual(Settings.LIMIT('DE'), 10)
+        self.assertEqual(Settings.LIMIT('DE'), 10)
+        self.assertEqual(Settings.LIMIT('FR'), 1)
+        self.assertEqual(Settings.LIMIT.cache_info(), CacheInfo(hits=1, misses=2, maxsize=128, currsize=2))
+
+    def test_cleared_on_setting_change(self):
+        class Settings(AppSettings):
+            LIMIT = ParametrizedSetting(get_limit)
+
+        memoized = Settings.LIMIT
+        memoized('DE')
+        with override_settings(LIMIT=lambda country: 20):
+            self.assertEqual(memoized.cache_info().currsize, 0)
+            self.assertEqual(Settings.LIMIT('DE'), 20)
+        self.assertEqual(Settings.LIMIT('DE'), 10)
+
+        Settings.invalidate('LIMIT')
+        self.assertEqual(Settings.LIMIT.cache_info().currsize, 0)
+
+
+class ComputedSettingTestCase(TestCase):
+    def test___init__(self):
+        setting = ComputedSetting(lambda: None)
+        self.assertEqual(setting.get_dependencies(TestAppSettings), [])
+
+        setting = ComputedSetting(lambda a, b: None, depends_on=['SETTING', (TestAppSettings, 'OTHER')])
+        self.assertEqual(setting.get_dependencies(AppSettings), [(AppSettings, 'SETTING'), (TestAppSettings, 'OTHER')])
+
+        self.assertRaises(ValueError, ComputedSetting, 'not callable')
+        self.assertRaises(ValueError, ComputedSetting, lambda a: None, depends_on=[1])
+        self.assertRaises(ValueError, ComputedSetting, lambda a: None, depends_on=[(object, 'SETTING')])
+
+        self.assertRaisesMessage(ValueError, 'A ComputedSetting does not accept a default_factory',
+                                 ComputedSetting, lambda: None, default_factory=lambda: 1)
+        self.assertRaisesMessage(ValueError, 'A ComputedSetting does not accept a default_value',
+                                 ComputedSetting, lambda: None, default_value=1)
+
+    def test_pipeline_arguments(self):
+        def positive(value):
+            if value <= 0:
+                raise ValueError('%s is not positive' % value)
+
+        class Settings(AppSettings):
+            A = IntSetting(2)
+            A2 = ComputedSetting(lambda a: a * 2, depends_on=['A'], validators=[positive], post_process=str)
+
+        self.assertEqual(Settings.A2, '4')
+        with override_settings(A=-1):
+            self.assertRaisesMessage(ValueError, '-2 is not positive', getattr, Settings, 'A2')
+
+    def test_compute(self):
+        class Settings(AppSettings):
+            HOST = Setting('localhost')
+            PORT = IntSetting(8000)
+            URL = ComputedSetting(lambda host, port: 'http://%s:%d' % (host, port), depends_on=['HOST', 'PORT'])
+
+        self.assertEqual(Settings.URL, 'http://localhost:8000')
+
+    @override_settings(URL='http://example.com')
+    def test_value_from_settings(self):
+        compute = MagicMock(return_value='computed')
+
+        class Settings(AppSettings):
+            URL = ComputedSetting(compute)
+
+        self.assertEqual(Settings.URL, 'http://example.com')
+        compute.assert_not_called()
+
+    def test_other_appsettings(self):
+        class Settings(AppSettings):
+            FACTOR = IntSetting(3)
+
+        class OtherSettings(AppSettings):
+            TIMEOUT = IntSetting(10)
+            SCALED_TIMEOUT = ComputedSetting(lambda timeout, factor: timeout * factor,
+                                             depends_on=['TIMEOUT', (Settings, 'FACTOR')])
+
+        self.assertEqual(OtherSettings.SCALED_TIMEOUT, 30)
+        with override_settings(FACTOR=2):
+            self.assertEqual(OtherSettings.SCALED_TIMEOUT, 20)
+        self.assertEqual(OtherSettings.SCALED_TIMEOUT, 30)
+
+    def test_recompute_affected_only(self):
+        compute_a = MagicMock(side_effect=lambda a: a * 2)
+        compute_b = MagicMock(side_effect=lambda b: b * 3)
+        compute_c = MagicMock(side_effect=lambda a2: a2 + 1)
+
+        class Settings(AppSettings):
+            A = IntSetting(1)
+            B = IntSetting(1)
+            A2 = ComputedSetting(compute_a, depends_on=['A'])
+            B3 = ComputedSetting(compute_b, depends_on=['B'])
+            A2_PLUS_ONE = ComputedSetting(compute_c, depends_on=['A2'])
+
+        self.assertEqual(Settings.A2_PLUS_ONE, 3)
+        self.assertEqual(Settings.B3, 3)
+        self.assertEqual(Settings.A2_PLUS_ONE, 3)
+        self.assertEqual(compute_c.call_count, 1)
+
+        with override_settings(A=5):
+            self.assertEqual(Settings.A2_PLUS_ONE, 11)
+            self.assertEqual(Settings.B3, 3)
+        self.assertEqual(compute_a.call_count, 2)
+        self.assertEqual(compute_c.call_count, 2)
+        self.assertEqual(compute_b.call_count, 1)
+
+        Settings.invalidate('B')
+        self.assertEqual(Settings.B3, 3)
+        self.assertEqual(Settings.A2_PLUS_ONE, 3)
+        self.assertEqual(compute_b.call_count, 2)
+        self.assertEqual(compute_a.call_count, 3)
+        self.assertEqual(compute_c.call_count, 3)
+
+    def test_override_appsettings(self):
+        class Settings(AppSettings):
+            A = IntSetting(1)
+            A2 = ComputedSetting(lambda a: a * 2, depends_on=['A'])
+
+        self.assertEqual(Settings.A2, 2)
+        with override_appsettings(Settings, A=4):
+            self.assertEqual(Settings.A2, 8)
+        self.assertEqual(Settings.A2, 2)
+
+        # overridden computed settings are not touched when an input changes
+        with override_appsettings(Settings, A2='overridden'):
+            Settings.invalidate('A')
+            self.assertEqual(Settings.A2, 'overridden')
+
+    def test_unknown_dependency(self):
+        def create():
+            class Settings(AppSettings):
+                A2 = ComputedSetting(lambda a: a * 2, depends_on=['A'])
+
+        self.assertRaisesMessage(ValueError, 'The setting A2 depends on A which is not a setting of Settings.', create)
+
+    def test_dependency_cycle(self):
+        def create():
+            class Settings(AppSettings):
+                A = ComputedSetting(lambda c: c, depends_on=['C'])
+                B = ComputedSetting(lambda a: a, depends_on=['A'])
+                C = ComputedSetting(lambda b: b, depends_on=['B'])
+
+        self.assertRaisesMessage(ValueError, 'The settings of Settings contain a dependency cycle: ', create)
+
+    def test_inheritance(self):
+        class Settings(AppSettings):
+            A = IntSetting(1)
+            A2 = ComputedSetting(lambda a: a * 2, depends_on=['A'])
+
+        class SubSettings(Settings):
+            A = IntSetting(5)
+
+        self.assertEqual(SubSettings.A2, 10)
+
+    def test_inheritance_keeps_values_per_class(self):
+        class Settings(AppSettings):
+            HOST = StringSetting('a-host')
+            URL = ComputedSetting(lambda host: 'http://' + host, depends_on=['HOST'])
+
+        class SubSettings(Settings):
+            HOST = StringSetting('b-host')
+
+        self.assertEqual(Settings.URL, 'http://a-host')
+        self.assertEqual(SubSettings.URL, 'http://b-host')
+        self.assertEqual(Settings.URL, 'http://a-host')
+        self.assertIsNot(SubSettings._settings['URL'], Settings._settings['URL'])
+
+        # invalidating the input of one class leaves the other one untouched
+        SubSettings.invalidate('HOST')
+        self.assertIs(Settings._values['URL'], Settings._settings['URL'])
+        self.assertNotIn('URL', SubSettings._values)
+        self.assertEqual(SubSettings.URL, 'http://b-host')
+
+
+class FingerprintTestCase(TestCase):
+    def test_fingerprint(self):
+        class Settings(AppSettings):
+            INT = IntSetting(1)
+            CLASS = ClassSetting('django_pluggableappsettings.tests.test___init__.TestClass')
+
+        class SameSettings(AppSettings):
+            INT = IntSetting('1')
+            CLASS = ClassSetting(TestClass)
+
+        fingerprint = Settings.fingerprint()
+        self.assertEqual(len(fingerprint), 64)
+        self.assertEqual(Settings.fingerprint(), fingerprint)
+        self.assertEqual(SameSettings.fingerprint(), fingerprint)
+        self.assertEqual(AppSettings.fingerprint(), '0' * 64)
+
+    def test_incremental(self):
+        class Settings(AppSettings):
+            INT = IntSetting(1)
+            OTHER = IntSetting(2)
+
+        fingerprint = Settings.fingerprint()
+        with patch('django_pluggableappsettings.fingerprint.digest') as digest:
+            self.assertEqual(Settings.fingerprint(), fingerprint)
+            digest.assert_not_called()
+
+        Settings.invalidate('INT')
+        with patch('django_pluggableappsettings.fingerprint.encode_value', wraps=lambda value: repr(value)) as encode:
+            with override_settings(INT=5):
+                changed = Settings.fingerprint()
+            encode.assert_called_once_with(5)
+        self.assertNotEqual(changed, fingerprint)
+        self.assertEqual(Settings.fingerprint(), fingerprint)
+
+    def test_overrides(self):
+        class Settings(AppSettings):
+            A = IntSetting(1)
+            A2 = ComputedSetting(lambda a: a * 2, depends_on=['A'])
+
+        fingerprint = Settings.fingerprint()
+        with override_appsettings(Settings, A=2):
+            overridden = Settings.fingerprint()
+            self.assertNotEqual(overridden, fingerprint)
+        self.assertEqual(Settings.fingerprint(), fingerprint)
+
+        class OverriddenSettings(AppSettings):
+            A = IntSetting(2)
+            A2 = ComputedSetting(lambda a: a * 2, depends_on=['A'])
+        self.assertEqual(OverriddenSettings.fingerprint(), overridden)
+
+    def test_called_each_time(self):
+        function = MagicMock(return_value=1)
+
+        class Settings(AppSettings):
+            SETTING = CalledEachTimeSetting(TestClass)
+            OTHER = CalledEachTimeSetting(function)
+
+        # the stored callables are used, they are not called
+        with patch('django_pluggableappsettings.fingerprint.encode_value', wraps=repr) as encode:
+            Settings.fingerprint()
+            encode.assert_any_call(TestClass)
+            encode.assert_any_call(function)
+        function.assert_not_called()
+
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from types import SimpleNamespace
+
+from django.apps import apps
+from django.core.checks import run_checks
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+from mock import Mock, patch
+
+from django_pluggableappsettings import AppSettings, CalledEachTimeSetting, CalledOnceSetting, ClassSetting, \
+    ComputedSetting, IntSetting, Setting
+from django_pluggableappsettings.checks import APPSETTINGS_TAG, INVALID_VALUE_ID, LOADING_ERROR_ID, MISSING_VALUE_ID, \
+    check_appsettings, check_appsettings_class
+
+logger = logging.getLogger(__name__)
+
+
+def failing():
+    raise RuntimeError('Failed')
+
+
+class ChecksTestCase(SimpleTestCase):
+    def test_valid(self):
+        each_time = Mock(return_value=1)
+
+        class Settings(AppSettings):
+            SETTING = Setting('value')
+            INTEGER = IntSetting('1')
+            CLASS = ClassSetting('django_pluggableappsettings.AppSettings')
+            EACH_TIME = CalledEachTimeSetting(each_time)
+            COMPUTED = ComputedSetting(lambda integer: integer + 1, depends_on=['INTEGER'])
+
+        self.assertEqual(check_appsettings_class(Settings), [])
+        # the values are cached
+        self.assertEqual(set(Settings._values), {'SETTING', 'INTEGER', 'CLASS', 'EACH_TIME', 'COMPUTED'})
+        self.assertEqual(Settings._values['COMPUTED'].value(), 2)
+        # callables that are called on each access are not called by the check
+        each_time.assert_not_called()
+
+    def test_loaded_values_are_not_loaded_again(self):
+        function = Mock(return_value=1)
+
+        class Settings(AppSettings):
+            SETTING = CalledOnceSetting(function)
+
+        self.assertEqual(Settings.SETTING, 1)
+        self.assertEqual(check_appsettings_class(Settings), [])
+        self.assertEqual(Settings.SETTING, 1)
+        function.assert_called_once_with()
+
+    @override_settings(INVALID_INTEGER='a', INVALID_CLASS='does.not.Exist')
+    def test_errors(self):
+        class Settings(AppSettings):
+            VALID = Setting('value')
+            MISSING = Setting()
+            INVALID_INTEGER = IntSetting()
+            INVALID_CLASS = ClassSetting()
+            FAILING = CalledOnceSetting(failing)
+
+        errors = check_appsettings_class(Settings)
+        path = '%s.%s' % (Settings.__module__, Settings.__qualname__)
+        self.assertEqual([(error.obj, error.id) for error in errors], [
+            (path + '.MISSING', MISSING_VALUE_ID),
+            (path + '.INVALID_INTEGER', INVALID_VALUE_ID),
+            (path + '.INVALID_CLASS', INVALID_VALUE_ID),
+            (path + '.FAILING', LOADING_ERROR_ID),
+        ])
+        self.assertEqual(
+            errors[1].msg, 'ValueError: The value for setting INVALID_INTEGER cannot be casted to type int'
+        )
+        self.assertEqual(errors[3].msg, 'RuntimeError: Failed')
+        # only the valid setting is cached
+        self.assertEqual(list(Settings._values), ['VALID'])
+
+    def test_check_appsettings(self):
+        class Settings1(AppSettings):
+            MISSING = Setting()
+
+        class Settings2(AppSettings):
+            MISSING = Setting()
+
+        with patch('django_pluggableappsettings.checks.get_registered_appsettings',
+                   return_value=[Settings2, Settings1]):
+            errors = check_appsettings()
+        self.assertEqual([error.obj.rsplit('.', 2)[1] for error in errors], ['Settings1', 'Settings2'])
+
+    def test_check_appsettings_app_configs(self):
+        class Settings(AppSettings):
+            MISSING = Setting()
+
+        with patch('django_pluggableappsettings.checks.get_registered_appsettings', return_value=[Settings]):
+            self.assertEqual(len(check_appsettings(app_configs=[apps.get_app_config('django_pluggableappsettings')])), 1)
+            self.assertEqual(check_appsettings(app_configs=[SimpleNamespace(name='other_app')]), [])
+
+    def test_registered(self):
+        class Settings(AppSettings):
+            MISSING = Setting()
+
+        with patch('django_pluggableappsettings.checks.get_registered_appsettings', return_value=[Settings]):
+            errors = run_checks(tags=[APPSETTINGS_TAG])
+            self.assertEqual([error.id for error in errors], [MISSING_VALUE_ID])
+            Settings.invalidate()
+            errors = run_checks(tags=[APPSETTINGS_TAG], include_deployment_checks=True)
+            self.assertEqual([error.id for error in errors], [MISSING_VALUE_ID])
+
+
+LAZY_APP_SETTINGS = """
+from django_pluggableappsettings import AppSettings, IntSetting
+
+
+class LazyAppSettings(AppSettings):
+    NUMBER = IntSetting('not a number')
+"""
+
+
+class AppSettingsModulesTestCase(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        package = os.path.join(self.directory, 'lazy_app')
+        os.makedirs(package)
+        with open(os.path.join(package, '__init__.py'), 'w') as f:
+            f.write('')
+        with open(os.path.join(package, 'app_settings.py'), 'w') as f:
+            f.write(LAZY_APP_SETTINGS)
+        sys.path.insert(0, self.directory)
+
+    def tearDown(self):
+        sys.path.remove(self.directory)
+        for name in list(sys.modules):
+            if name == 'lazy_app' or name.startswith('lazy_app.'):
+                del sys.modules[name]
+        shutil.rmtree(self.directory)
+
+    def test_app_settings_modules_are_imported(self):
+        with override_settings(INSTALLED_APPS=list(settings.INSTALLED_APPS) + ['lazy_app']):
+            self.assertNotIn('lazy_app.app_settings', sys.modules)
+            errors = check_appsettings(app_configs=[apps.get_app_config('lazy_app')])
+        self.assertEqual([(error.id, error.obj) for error in errors], [
+            (INVALID_VALUE_ID, 'lazy_app.app_settings.LazyAppSettings.NUMBER')
+        ])
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import importlib
+import io
+import logging
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, override_settings
+
+from django_pluggableappsettings import AppSettings, CalledEachTimeSetting, ClassSetting, ComputedSetting, \
+    FloatSetting, FrozenSetSetting, IntSetting, IterableSetting, MemoizedCallable, ParametrizedSetting, PatternSet, \
+    PatternSetSetting, RegexSetting, Setting, SortedTuple, SortedTupleSetting, StringSetting, TupleSetting
+from django_pluggableappsettings.codegen import ModuleWriter, UnrepresentableValue, check_fingerprint, \
+    constants_fingerprint, generate
+from django_pluggableappsettings.test.utils import override_appsettings
+
+logger = logging.getLogger(__name__)
+
+
+def double(value):
+    return value * 2
+
+
+class CodegenAppSettings(AppSettings):
+    CODEGEN_INT = IntSetting('3')
+    FLOAT = FloatSetting(1.5)
+    STRING = StringSetting('value')
+    ITERABLE = IterableSetting([1, 2])
+    TUPLE = TupleSetting([1, 2], element_type=int)
+    FROZENSET = FrozenSetSetting(['a'], element_type=str)
+    SORTED = SortedTupleSetting([3, 1, 2])
+    CLASS = ClassSetting('django_pluggableappsettings.Setting')
+    REGEX = RegexSetting('^a+$')
+    PATTERNS = PatternSetSetting(['^a', '^b'])
+    DICT = Setting({'a': [1, (2,)], 'b': {1}})
+    NONE = Setting(None)
+    FUNCTION = Setting(double)
+    PARAMETRIZED = ParametrizedSetting(double)
+    COMPUTED = ComputedSetting(lambda value: value * 2, depends_on=['CODEGEN_INT'])
+    EACH_TIME = CalledEachTimeSetting(double, force_callable=True)
+    LAMBDA = Setting(lambda: None)
+
+
+class OtherAppSettings(AppSettings):
+    OTHER = Setting('other')
+
+
+class ConflictingAppSettings(AppSettings):
+    STRING = Setting('conflict')
+
+
+PATH = '%s.CodegenAppSettings' % __name__
+
+
+class ModuleWriterTestCase(SimpleTestCase):
+    def test_value(self):
+        writer = ModuleWriter()
+        self.assertEqual(writer.value(None), 'None')
+        self.assertEqual(writer.value(1), '1')
+        self.assertEqual(writer.value(b'a'), "b'a'")
+        self.assertEqual(writer.value((1,)), '(1,)')
+        self.assertEqual(writer.value(()), '()')
+        self.assertEqual(writer.value(set()), 'set()')
+        self.assertEqual(writer.value(frozenset()), 'frozenset()')
+        self.assertEqual(writer.value(frozenset([2, 1])), 'frozenset({1, 2})')
+        self.assertEqual(writer.value(int), 'int')
+        self.assertEqual(writer.value(double), '%s.double' % __name__)
+        self.assertEqual(writer.value(re.compile('a', re.I)), "re.compile('a', %d)" % re.compile('a', re.I).flags)
+        self.assertEqual(writer.imports, {__name__, 're'})
+        self.assertRaises(UnrepresentableValue, writer.value, float('nan'))
+        self.assertRaises(UnrepresentableValue, writer.value, object())
+        self.assertRaises(UnrepresentableValue, writer.value, lambda: None)
+
+    def test_annotation_of_value(self):
+        writer = ModuleWriter()
+        self.assertEqual(writer.annotation_of_value(1), 'int')
+        self.assertEqual(writer.annotation_of_value(None), 'None')
+        self.assertEqual(writer.annotation_of_value([1]), 'typing.List[typing.Any]')
+        self.assertEqual(writer.annotation_of_value({}), 'typing.Dict[typing.Any, typing.Any]')
+        self.assertEqual(writer.annotation_of_value(double), 'typing.Callable[..., typing.Any]')
+        self.assertEqual(writer.annotation_of_value(int), 'typing.Type[int]')
+        self.assertEqual(writer.annotation_of_value(object()), 'object')
+
+
+class GenerateTestCase(SimpleTestCase):
+    def setUp(self):
+        CodegenAppSettings.invalidate()
+        self.directory = tempfile.mkdtemp()
+        sys.path.insert(0, self.directory)
+
+    def tearDown(self):
+        sys.path.remove(self.directory)
+        sys.modules.pop('generated_constants', None)
+        shutil.rmtree(self.directory)
+        CodegenAppSettings.invalidate()
+
+    def write(self, module):
+        with open(os.path.join(self.directory, 'generated_constants.py'), 'w') as f:
+            f.write(module)
+        sys.modules.pop('generated_constants', None)
+        importlib.invalidate_caches()
+        return importlib.import_module('generated_constants')
+
+    def test_module(self):
+        module, _ = generate([CodegenAppSettings, OtherAppSettings])
+        constants = self.write(module)
+        self.assertEqual(constants.CODEGEN_INT, 3)
+        self.assertEqual(constants.FLOAT, 1.5)
+        self.assertEqual(constants.STRING, 'value')
+        self.assertEqual(constants.ITERABLE, [1, 2])
+        self.assertEqual(constants.TUPLE, (1, 2))
+        self.assertEqual(constants.FROZENSET, frozenset(['a']))
+        self.assertEqual(constants.SORTED, SortedTuple([1, 2, 3]))
+        self.assertIsInstance(constants.SORTED, SortedTuple)
+        self.assertIs(constants.CLASS, Setting)
+        self.assertEqual(constants.REGEX, CodegenAppSettings.REGEX)
+        self.assertEqual(constants.PATTERNS, PatternSet(['^a', '^b']))
+        self.assertEqual(constants.DICT, {'a': [1, (2,)], 'b': {1}})
+        self.assertIsNone(constants.NONE)
+        self.assertIs(constants.FUNCTION, double)
+        self.assertIsInstance(constants.PARAMETRIZED, MemoizedCallable)
+        self.assertEqual(constants.PARAMETRIZED(2), 4)
+        self.assertEqual(constants.COMPUTED, 6)
+        self.assertEqual(constants.OTHER, 'other')
+        self.assertFalse(hasattr(constants, 'EACH_TIME'))
+        self.assertFalse(hasattr(constants, 'LAMBDA'))
+        self.assertIn('# EACH_TIME is left out as its value is called on each access', module)
+        self.assertIn('# LAMBDA is left out as its value can not be written as python source', module)
+
+    def test_stub(self):
+        _, stub = generate([CodegenAppSettings])
+        lines = stub.splitlines()
+        for line in [
+            'import django_pluggableappsettings', 'import re', 'import typing',
+            'CODEGEN_INT: int', 'FLOAT: float', 'STRING: str', 'ITERABLE: typing.List[typing.Any]',
+            'TUPLE: typing.Tuple[int, ...]', 'FROZENSET: typing.FrozenSet[str]',
+            'SORTED: django_pluggableappsettings.SortedTuple',
+            'CLASS: typing.Type[django_pluggableappsettings.Setting]', 'REGEX: re.Pattern[str]',
+            'PATTERNS: django_pluggableappsettings.PatternSet', 'DICT: typing.Dict[typing.Any, typing.Any]',
+            'NONE: None', 'FUNCTION: typing.Callable[..., typing.Any]',
+            'PARAMETRIZED: django_pluggableappsettings.MemoizedCallable', 'COMPUTED: int',
+        ]:
+            self.assertIn(line, lines)
+        self.assertNotIn('EACH_TIME', stub)
+        self.assertNotIn('LAMBDA', stub)
+
+    def test_deterministic(self):
+        self.assertEqual(generate([CodegenAppSettings]), generate([CodegenAppSettings]))
+
+    def test_fingerprint_guard(self):
+        module, _ = generate([CodegenAppSettings])
+        self.write(module)
+        with override_settings(CODEGEN_INT=4):
+            self.assertRaisesMessage(
+                ImproperlyConfigured,
+                'The settings of %s changed since the constants were generated. Generate them again.' % PATH,
+                self.write, module
+            )
+
+    def test_fingerprint_guard_emitted_only(self):
+        module, _ = generate([CodegenAppSettings])
+        self.assertNotIn("'LAMBDA'", module)
+        self.assertNotIn("'EACH_TIME'", module)
+        # the values that are left out do not affect the guard
+        with override_appsettings(CodegenAppSettings, LAMBDA=lambda: 'other'):
+            self.assertEqual(self.write(module).STRING, 'value')
+
+    def test_check_fingerprint(self):
+        names = ('CODEGEN_INT', 'STRING')
+        check_fingerprint(PATH, names, constants_fingerprint(CodegenAppSettings, names))
+        self.assertRaises(ImproperlyConfigured, check_fingerprint, PATH, names, '0' * 64)
+        self.assertRaisesMessage(ImproperlyConfigured, 'The AppSettings class does.not.Exist could not be found.',
+                                 check_fingerprint, 'does.not.Exist', names, '0' * 64)
+
+    def test_conflict(self):
+        self.assertRaisesMessage(
+            ValueError, 'The setting STRING is defined by %s and %s.ConflictingAppSettings.' % (PATH, __name__),
+            generate, [CodegenAppSettings, ConflictingAppSettings]
+        )
+
+    def test_not_importable(self):
+        class Local(AppSettings):
+            SETTING = Setting(1)
+
+        self.assertRaisesMessage(ValueError, 'can not be imported by its dotted path', generate, [Local])
+
+    def test_command(self):
+        output = os.path.join(self.directory, 'generated_constants.py')
+        out = io.StringIO()
+        call_command('appsettings_codegen', PATH, '--output', output, stdout=out)
+        self.assertTrue(os.path.isfile(os.path.join(self.directory, 'generated_constants.pyi')))
+        self.assertEqual(importlib.import_module('generated_constants').CODEGEN_INT, 3)
+
+        call_command('appsettings_codegen', PATH, '--output', output, '--check', stdout=out)
+        self.assertIn('The generated files are up to date.', out.getvalue())
+        with override_settings(CODEGEN_INT=4):
+            self.assertRaisesMessage(CommandError, '%s is out of date.' % output, call_command,
+                                     'appsettings_codegen', PATH, '--output', output, '--check')
+
+    def test_command_errors(self):
+        output = os.path.join(self.directory, 'generated_constants.py')
+        self.assertRaisesMessage(CommandError, 'django_pluggableappsettings.Setting is not an AppSettings class.',
+                                 call_command, 'appsettings_codegen', 'django_pluggableappsettings.Setting',
+                                 '--output', output)
+        self.assertRaisesMessage(CommandError, 'The setting STRING is defined by', call_command,
+                                 'appsettings_codegen', PATH, '%s.ConflictingAppSettings' % __name__,
+                                 '--output', output)
+        self.assertRaisesMessage(CommandError, '%s does not exist.' % output, call_command,
+                                 'appsettings_codegen', PATH, '--output', output, '--check')
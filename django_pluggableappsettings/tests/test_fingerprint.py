@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import gc
+import logging
+import os
+import re
+import subprocess
+import sys
+import weakref
+from collections import OrderedDict
+
+from django.test import TestCase
+from mock import patch
+
+import django_pluggableappsettings
+from django_pluggableappsettings import AppSettings, IntSetting, MemoizedCallable, PatternSet, SortedTuple
+from django_pluggableappsettings.fingerprint import digest, dotted_path, encode_value, reset_settings_fingerprint, \
+    settings_fingerprint
+from django_pluggableappsettings.test.utils import override_appsettings
+
+logger = logging.getLogger(__name__)
+
+
+class TestClass(object):
+    def method(self):
+        pass
+
+
+def function():
+    pass
+
+
+class ReprObject(object):
+    def __repr__(self):
+        return 'ReprObject()'
+
+
+class Sentinel(object):
+    pass
+
+
+# prints the fingerprint of a class with values that have no deterministic repr in a new process
+FINGERPRINT_SCRIPT = '''
+from django.conf import settings
+settings.configure()
+from django_pluggableappsettings import AppSettings, Setting
+
+
+class Sentinel(object):
+    pass
+
+
+class Settings(AppSettings):
+    SENTINEL = Setting(Sentinel())
+    NESTED = Setting([Sentinel(), {'a', 'b', 'c'}])
+
+
+print(Settings.fingerprint())
+'''
+
+
+class DottedPathTestCase(TestCase):
+    def test_dotted_path(self):
+        self.assertEqual(dotted_path(TestClass), 'django_pluggableappsettings.tests.test_fingerprint.TestClass')
+        self.assertEqual(dotted_path(TestClass.method), 'django_pluggableappsettings.tests.test_fingerprint.TestClass.method')
+        self.assertEqual(dotted_path(function), 'django_pluggableappsettings.tests.test_fingerprint.function')
+
+
+class EncodeValueTestCase(TestCase):
+    def test_primitives(self):
+        self.assertEqual(encode_value(None), 'NoneType:None')
+        self.assertEqual(encode_value(True), 'bool:True')
+        self.assertEqual(encode_value(1), 'int:1')
+        self.assertEqual(encode_value(1.5), 'float:1.5')
+        self.assertEqual(encode_value('a'), "str:'a'")
+        self.assertEqual(encode_value(b'a'), "bytes:b'a'")
+        self.assertNotEqual(encode_value(1), encode_value(True))
+        self.assertNotEqual(encode_value(1), encode_value('1'))
+
+    def test_collections(self):
+        self.assertEqual(encode_value([1, 'a']), "builtins.list[int:1,str:'a']")
+        self.assertNotEqual(encode_value([1]), encode_value((1,)))
+        self.assertNotEqual(encode_value((1,)), encode_value(SortedTuple([1])))
+        self.assertEqual(encode_value({'b': 1, 'a': 2}), encode_value({'a': 2, 'b': 1}))
+        self.assertEqual(encode_value(OrderedDict([('b', 1), ('a', 2)])), encode_value(OrderedDict([('a', 2), ('b', 1)])))
+        self.assertEqual(encode_value({3, 1, 2}), encode_value({1, 2, 3}))
+        self.assertNotEqual(encode_value({1}), encode_value(frozenset([1])))
+
+    def test_paths(self):
+        self.assertEqual(encode_value(TestClass), 'path:django_pluggableappsettings.tests.test_fingerprint.TestClass')
+        self.assertEqual(encode_value(function), 'path:django_pluggableappsettings.tests.test_fingerprint.function')
+        self.assertEqual(encode_value(len), 'path:builtins.len')
+        self.assertEqual(
+            encode_value(TestClass.method), 'path:django_pluggableappsettings.tests.test_fingerprint.TestClass.method'
+        )
+        self.assertEqual(
+            encode_value(ReprObject().__repr__),
+            'method:django_pluggableappsettings.tests.test_fingerprint.ReprObject.__repr__('
+            'django_pluggableappsettings.tests.test_fingerprint.ReprObject:ReprObject())'
+        )
+
+    def test_patterns(self):
+        self.assertEqual(encode_value(re.compile('a', re.I)), encode_value(re.compile('a', re.I)))
+        self.assertNotEqual(encode_value(re.compile('a', re.I)), encode_value(re.compile('a')))
+        self.assertEqual(encode_value(PatternSet(['a', 'b'])), encode_value(PatternSet(['a', 'b'])))
+        self.assertNotEqual(encode_value(PatternSet(['a', 'b'])), encode_value(PatternSet(['b', 'a'])))
+
+    def test_memoized(self):
+        self.assertEqual(encode_value(MemoizedCallable(function, 10)), encode_value(MemoizedCallable(function, 10)))
+        self.assertNotEqual(encode_value(MemoizedCallable(function, 10)), encode_value(MemoizedCallable(function, 20)))
+
+    def test_other(self):
+        self.assertEqual(
+            encode_value(ReprObject()), 'django_pluggableappsettings.tests.test_fingerprint.ReprObject:ReprObject()'
+        )
+        self.assertEqual(encode_value(Sentinel()), 'django_pluggableappsettings.tests.test_fingerprint.Sentinel:<object>')
+        self.assertEqual(encode_value(Sentinel()), encode_value(Sentinel()))
+
+    def test_stable_between_processes(self):
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(
+            [os.path.dirname(os.path.dirname(django_pluggableappsettings.__file__))] +
+            ([env['PYTHONPATH']] if env.get('PYTHONPATH') else [])
+        )
+        env.pop('DJANGO_SETTINGS_MODULE', None)
+        fingerprints = [
+            subprocess.check_output([sys.executable, '-c', FINGERPRINT_SCRIPT], env=env).strip() for _ in range(2)
+        ]
+        self.assertEqual(len(fingerprints[0]), 64)
+        self.assertEqual(fingerprints[0], fingerprints[1])
+
+    def test_digest(self):
+        self.assertEqual(digest('NAME', [1, 2]), digest('NAME', [1, 2]))
+        self.assertNotEqual(digest('NAME', [1, 2]), digest('OTHER', [1, 2]))
+        self.assertNotEqual(digest('NAME', [1, 2]), digest('NAME', [2, 1]))
+
+
+class SettingsFingerprintTestCase(TestCase):
+    def setUp(self):
+        changed = weakref.WeakSet()
+        self.patchers = [
+            patch('django_pluggableappsettings._changed_fingerprints', changed),
+            patch('django_pluggableappsettings.fingerprint._changed_fingerprints', changed),
+            patch('django_pluggableappsettings.fingerprint._contributions', weakref.WeakKeyDictionary()),
+            patch('django_pluggableappsettings.fingerprint._global_digest', 0),
+            patch('django_pluggableappsettings.fingerprint.get_registered_appsettings'),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in reversed(self.patchers):
+            patcher.stop()
+
+    def test_settings_fingerprint(self):
+        class Settings(AppSettings):
+            SETTING = IntSetting(1)
+
+        class OtherSettings(AppSettings):
+            SETTING = IntSetting(1)
+
+        fingerprint = settings_fingerprint()
+        self.assertEqual(len(fingerprint), 64)
+        self.assertEqual(settings_fingerprint(), fingerprint)
+
+        with override_appsettings(Settings, SETTING=2):
+            changed = settings_fingerprint()
+            self.assertNotEqual(changed, fingerprint)
+            with override_appsettings(OtherSettings, SETTING=2):
+                self.assertNotEqual(settings_fingerprint(), changed)
+        self.assertEqual(settings_fingerprint(), fingerprint)
+
+    def test_incremental(self):
+        class Settings(AppSettings):
+            SETTING = IntSetting(1)
+
+        fingerprint = settings_fingerprint()
+        with patch.object(Settings, 'fingerprint', wraps=Settings.fingerprint) as fingerprint_method:
+            self.assertEqual(settings_fingerprint(), fingerprint)
+            fingerprint_method.assert_not_called()
+
+            Settings.invalidate('SETTING')
+            self.assertEqual(settings_fingerprint(), fingerprint)
+            fingerprint_method.assert_called_once_with()
+
+    def test_reset_settings_fingerprint(self):
+        class Settings(AppSettings):
+            SETTING = IntSetting(1)
+
+        from django_pluggableappsettings import fingerprint as fingerprint_module
+        fingerprint_module.get_registered_appsettings.return_value = [Settings]
+        fingerprint = settings_fingerprint()
+        reset_settings_fingerprint()
+        self.assertEqual(settings_fingerprint(), fingerprint)
+        self.assertEqual(list(fingerprint_module._contributions), [Settings])
+
+    def test_contributions_do_not_keep_classes_alive(self):
+        class Settings(AppSettings):
+            SETTING = IntSetting(1)
+
+        from django_pluggableappsettings import fingerprint as fingerprint_module
+        settings_fingerprint()
+        reference = weakref.ref(Settings)
+        del Settings
+        gc.collect()
+        self.assertIsNone(reference())
+        self.assertEqual(len(fingerprint_module._contributions), 0)
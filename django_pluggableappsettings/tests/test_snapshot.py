@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import logging
+import multiprocessing
+import os
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from django.test import SimpleTestCase
+from mock import patch
+
+from django_pluggableappsettings import AppSettings, CalledEachTimeSetting, CalledOnceSetting, ClassSetting, \
+    ComputedSetting, MemoizedCallable, ParametrizedSetting, PatternSetSetting, RegexSetting, Setting, SortedTuple, \
+    SortedTupleSetting
+from django_pluggableappsettings.snapshot import DottedPath, SettingsSnapshot, decode_value, encode_value, \
+    install_snapshot, take_snapshot
+from django_pluggableappsettings.test.utils import override_appsettings
+
+logger = logging.getLogger(__name__)
+
+calls = []
+
+
+def expensive():
+    calls.append('expensive')
+    return 'expensive value'
+
+
+def each_time():
+    calls.append('each_time')
+    return len(calls)
+
+
+def double(value):
+    return value * 2
+
+
+class SnapshotAppSettings(AppSettings):
+    SETTING = Setting('value')
+    EXPENSIVE = CalledOnceSetting(expensive)
+    EACH_TIME = CalledEachTimeSetting(each_time)
+    CLASS = ClassSetting('django_pluggableappsettings.Setting')
+    REGEX = RegexSetting('^a+$')
+    PATTERNS = PatternSetSetting(['^a', '^b'])
+    SORTED = SortedTupleSetting([3, 1, 2])
+    PARAMETRIZED = ParametrizedSetting(double)
+    COMPUTED = ComputedSetting(lambda value: value.upper(), depends_on=['SETTING'])
+
+
+def read_in_child():
+    """
+    Reads the values in a worker process
+    """
+    return os.getpid(), SnapshotAppSettings.SETTING, SnapshotAppSettings.EXPENSIVE, SnapshotAppSettings.COMPUTED, \
+        list(calls)
+
+
+class SnapshotTestCase(SimpleTestCase):
+    def setUp(self):
+        del calls[:]
+        SnapshotAppSettings.invalidate()
+
+    def tearDown(self):
+        SnapshotAppSettings.invalidate()
+
+    def test_encode_value(self):
+        self.assertEqual(encode_value(Setting), DottedPath('django_pluggableappsettings.Setting'))
+        self.assertEqual(encode_value(expensive), DottedPath('%s.expensive' % __name__))
+        self.assertEqual(encode_value([Setting, (1, {'a': Setting})]), [
+            DottedPath('django_pluggableappsettings.Setting'),
+            (1, {'a': DottedPath('django_pluggableappsettings.Setting')})
+        ])
+        self.assertEqual(encode_value(SortedTuple([2, 1])), SortedTuple([1, 2]))
+        self.assertIsInstance(encode_value(SortedTuple([2, 1])), SortedTuple)
+        # values that can not be found by their path are kept
+        function = lambda: None
+        self.assertIs(encode_value(function), function)
+        self.assertEqual(encode_value('value'), 'value')
+
+    def test_decode_value(self):
+        self.assertIs(decode_value(DottedPath('django_pluggableappsettings.Setting')), Setting)
+        self.assertEqual(decode_value({DottedPath('django_pluggableappsettings.Setting'): frozenset([1])}),
+                         {Setting: frozenset([1])})
+        self.assertRaisesMessage(
+            ValueError, 'The object "does.not.Exist" of the snapshot could not be found.',
+            decode_value, DottedPath('does.not.Exist')
+        )
+
+    def test_take_snapshot(self):
+        snapshot = take_snapshot(SnapshotAppSettings)
+        values = snapshot.values['%s.SnapshotAppSettings' % __name__]
+        self.assertEqual(values['SETTING'], 'value')
+        self.assertEqual(values['EXPENSIVE'], 'expensive value')
+        # callables that are called on each access are stored and not called
+        self.assertEqual(values['EACH_TIME'], DottedPath('%s.each_time' % __name__))
+        self.assertEqual(values['CLASS'], DottedPath('django_pluggableappsettings.Setting'))
+        self.assertEqual(values['COMPUTED'], 'VALUE')
+        self.assertEqual(calls, ['expensive'])
+        # the values have been loaded
+        self.assertEqual(SnapshotAppSettings.EXPENSIVE, 'expensive value')
+        self.assertEqual(calls, ['expensive'])
+
+    def test_take_snapshot_overridden(self):
+        with override_appsettings(SnapshotAppSettings, SETTING='overridden'):
+            snapshot = take_snapshot(SnapshotAppSettings)
+        self.assertEqual(snapshot.values['%s.SnapshotAppSettings' % __name__]['SETTING'], 'overridden')
+
+    def test_install(self):
+        snapshot = pickle.loads(pickle.dumps(take_snapshot(SnapshotAppSettings)))
+        SnapshotAppSettings.invalidate()
+        del calls[:]
+
+        install_snapshot(snapshot)
+        self.assertEqual(SnapshotAppSettings.SETTING, 'value')
+        self.assertEqual(SnapshotAppSettings.EXPENSIVE, 'expensive value')
+        self.assertIs(SnapshotAppSettings.CLASS, Setting)
+        self.assertEqual(SnapshotAppSettings.REGEX.pattern, '^a+$')
+        self.assertEqual(SnapshotAppSettings.PATTERNS.match('b').index, 1)
+        self.assertEqual(SnapshotAppSettings.SORTED, (1, 2, 3))
+        self.assertIsInstance(SnapshotAppSettings.PARAMETRIZED, MemoizedCallable)
+        self.assertEqual(SnapshotAppSettings.PARAMETRIZED(2), 4)
+        self.assertEqual(SnapshotAppSettings.COMPUTED, 'VALUE')
+        self.assertEqual(calls, [])
+        # callables that are called on each access are still called
+        self.assertEqual(SnapshotAppSettings.EACH_TIME, 1)
+        self.assertEqual(SnapshotAppSettings.EACH_TIME, 2)
+
+    # the test runner is not guarded against being imported again, which spawned worker processes would do
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'requires the fork start method')
+    def test_install_in_child_process(self):
+        snapshot = pickle.loads(pickle.dumps(take_snapshot(SnapshotAppSettings)))
+        # the worker processes start without loaded values
+        SnapshotAppSettings.invalidate()
+        del calls[:]
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('fork'),
+                                 initializer=install_snapshot, initargs=(snapshot,)) as executor:
+            pid, setting, expensive_value, computed, child_calls = executor.submit(read_in_child).result()
+        self.assertNotEqual(pid, os.getpid())
+        self.assertEqual((setting, expensive_value, computed), ('value', 'expensive value', 'VALUE'))
+        # the callable was not called again in the worker process
+        self.assertEqual(child_calls, [])
+        self.assertEqual(SnapshotAppSettings._values, {})
+
+    def test_install_invalidates_dependents(self):
+        self.assertEqual(SnapshotAppSettings.COMPUTED, 'VALUE')
+        SettingsSnapshot({'%s.SnapshotAppSettings' % __name__: {'SETTING': 'other'}}).install()
+        self.assertEqual(SnapshotAppSettings.SETTING, 'other')
+        self.assertEqual(SnapshotAppSettings.COMPUTED, 'OTHER')
+
+    def test_install_updates_fingerprint(self):
+        fingerprint = SnapshotAppSettings.fingerprint()
+        SettingsSnapshot({'%s.SnapshotAppSettings' % __name__: {'SETTING': 'other'}}).install()
+        self.assertNotEqual(SnapshotAppSettings.fingerprint(), fingerprint)
+
+    def test_install_unknown_setting(self):
+        with patch('django_pluggableappsettings.snapshot.logger') as logger:
+            SettingsSnapshot({'%s.SnapshotAppSettings' % __name__: {'UNKNOWN': 'value'}}).install()
+        self.assertEqual(logger.warning.call_count, 1)
+        self.assertNotIn('UNKNOWN', SnapshotAppSettings._values)
+
+    def test_install_unknown_class(self):
+        self.assertRaisesMessage(
+            ValueError, 'The AppSettings class "does.not.Exist" of the snapshot could not be found.',
+            SettingsSnapshot({'does.not.Exist': {}}).install
+        )
+        self.assertRaisesMessage(
+            ValueError, 'The AppSettings class "re.compile" of the snapshot could not be found.',
+            SettingsSnapshot({'re.compile': {}}).install
+        )
+
+    def test_pickle_size(self):
+        snapshot = take_snapshot(SnapshotAppSettings)
+        self.assertEqual(repr(snapshot), "SettingsSnapshot(['%s.SnapshotAppSettings'])" % __name__)
+        self.assertLess(len(pickle.dumps(snapshot)), 2000)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import logging
+
+from django.test import SimpleTestCase
+
+from django_pluggableappsettings.tests import stress
+
+logger = logging.getLogger(__name__)
+
+
+class StressTestCase(SimpleTestCase):
+    def assertNoViolations(self, result):
+        self.assertEqual(result.violations, [], '\n'.join(result.violations))
+
+    def test_cold_resolution(self):
+        self.assertNoViolations(stress.cold_resolution(8, count=10, rounds=5))
+
+    def test_warm_reads(self):
+        self.assertNoViolations(stress.warm_reads(8, count=10, iterations=1000))
+
+    def test_overrides(self):
+        self.assertNoViolations(stress.overrides(8, iterations=1000))
+
+    def test_format_report(self):
+        results = [
+            stress.StressResult('warm', 1, 100, 1.0, []),
+            stress.StressResult('warm', 2, 400, 1.0, ['SUM_0 was 1 instead of 0']),
+        ]
+        report = stress.format_report(results)
+        self.assertIn('4.00x', report)
+        self.assertIn('warm/2: SUM_0 was 1 instead of 0', report)
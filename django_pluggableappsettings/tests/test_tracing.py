@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import json
+import logging
+
+from django.test import SimpleTestCase, override_settings
+from mock import Mock
+
+from django_pluggableappsettings import AppSettings, CalledEachTimeSetting, CalledOnceSetting, ComputedSetting, \
+    IntSetting, NOT_SET_VALUE, Setting
+from django_pluggableappsettings import tracing
+from django_pluggableappsettings.test.utils import MockSetting
+
+logger = logging.getLogger(__name__)
+
+
+class Source(object):
+    def get_value(self, appsettings, name):
+        return 'from source' if name == 'SOURCED' else NOT_SET_VALUE
+
+    def __repr__(self):
+        return 'Source()'
+
+
+class TracingTestCase(SimpleTestCase):
+    def setUp(self):
+        tracing.clear_traces()
+        tracing.enable()
+
+    def tearDown(self):
+        tracing.disable()
+        tracing.clear_traces()
+
+    @override_settings(MAIN='main', OTHER_NAME='other', ALIAS='alias', INTEGER='2')
+    def test_origins(self):
+        class Settings(AppSettings):
+            _sources = (Source(),)
+            MAIN = Setting()
+            RENAMED = Setting(settings_name='OTHER_NAME')
+            ALIASED = Setting(aliases=['MISSING', 'ALIAS'])
+            DEFAULT = Setting('default')
+            SOURCED = Setting()
+            INTEGER = IntSetting()
+            COMPUTED = ComputedSetting(lambda integer: integer * 2, depends_on=['INTEGER'])
+
+        self.assertEqual(Settings.MAIN, 'main')
+        self.assertEqual(Settings.RENAMED, 'other')
+        self.assertEqual(Settings.ALIASED, 'alias')
+        self.assertEqual(Settings.DEFAULT, 'default')
+        self.assertEqual(Settings.SOURCED, 'from source')
+        self.assertEqual(Settings.COMPUTED, 4)
+
+        trace = tracing.get_trace(Settings, 'MAIN')
+        self.assertEqual((trace.origin, trace.matched_name, trace.matched_by, trace.default_used),
+                         ('settings', 'MAIN', 'name', False))
+        trace = tracing.get_trace(Settings, 'RENAMED')
+        self.assertEqual((trace.origin, trace.matched_name, trace.matched_by), ('settings', 'OTHER_NAME', 'settings_name'))
+        trace = tracing.get_trace(Settings, 'ALIASED')
+        self.assertEqual((trace.origin, trace.matched_name, trace.matched_by), ('settings', 'ALIAS', 'alias'))
+        trace = tracing.get_trace(Settings, 'DEFAULT')
+        self.assertEqual((trace.origin, trace.matched_name, trace.default_used), ('default', None, True))
+        trace = tracing.get_trace(Settings, 'SOURCED')
+        self.assertEqual((trace.origin, trace.source, trace.matched_name), ('source', 'Source()', None))
+        trace = tracing.get_trace(Settings, 'INTEGER')
+        self.assertEqual(trace.cast, 'str -> int')
+        self.assertEqual([step for step, _ in trace.timings], ['lookup', 'source', 'cast'])
+        trace = tracing.get_trace(Settings, 'COMPUTED')
+        self.assertEqual(trace.origin, 'computed')
+
+        self.assertEqual([trace.name for trace in tracing.get_traces(Settings)], [
+            'ALIASED', 'COMPUTED', 'DEFAULT', 'INTEGER', 'MAIN', 'RENAMED', 'SOURCED'
+        ])
+        self.assertIsNone(tracing.get_trace(Settings, 'UNKNOWN'))
+
+    def test_callables(self):
+        once = Mock(return_value=1)
+        each_time = Mock(return_value=2)
+
+        class Settings(AppSettings):
+            ONCE = CalledOnceSetting(once)
+            EACH_TIME = CalledEachTimeSetting(each_time)
+
+        self.assertEqual(Settings.ONCE, 1)
+        self.assertEqual(Settings.EACH_TIME, 2)
+        trace = tracing.get_trace(Settings, 'ONCE')
+        self.assertTrue(trace.callable_invoked)
+        self.assertEqual(trace.call_policy, 'once')
+        self.assertEqual([step for step, _ in trace.timings], ['lookup', 'source', 'call'])
+        # callables called on each access are not called when the value is loaded
+        trace = tracing.get_trace(Settings, 'EACH_TIME')
+        self.assertFalse(trace.callable_invoked)
+        self.assertEqual(trace.call_policy, 'each_time')
+        self.assertEqual(Settings.EACH_TIME, 2)
+        self.assertEqual(each_time.call_count, 2)
+
+    def test_custom_get(self):
+        class Settings(AppSettings):
+            SETTING = MockSetting('mocked')
+
+        self.assertEqual(Settings.SETTING, 'mocked')
+        self.assertEqual(tracing.get_trace(Settings, 'SETTING').origin, 'default')
+
+    @override_settings(INTEGER='a')
+    def test_error(self):
+        class Settings(AppSettings):
+            INTEGER = IntSetting()
+
+        self.assertRaises(ValueError, getattr, Settings, 'INTEGER')
+        trace = tracing.get_trace(Settings, 'INTEGER')
+        self.assertEqual(trace.error, 'ValueError: The value for setting INTEGER cannot be casted to type int')
+        self.assertNotIn('INTEGER', Settings._values)
+
+    def test_export(self):
+        class Settings(AppSettings):
+            SETTING = Setting('default')
+
+        Settings.SETTING
+        exported = tracing.export_traces(Settings)
+        self.assertEqual(len(exported), 1)
+        self.assertEqual(exported[0]['appsettings'], '%s.%s' % (__name__, Settings.__qualname__))
+        self.assertEqual(exported[0]['name'], 'SETTING')
+        self.assertEqual(exported[0]['origin'], 'default')
+        self.assertGreaterEqual(exported[0]['seconds'], 0)
+        json.dumps(tracing.export_traces())
+        self.assertIn(exported[0], tracing.export_traces())
+
+    def test_reload(self):
+        class Settings(AppSettings):
+            SETTING = Setting('default')
+
+        Settings.SETTING
+        with override_settings(SETTING='changed'):
+            self.assertEqual(Settings.SETTING, 'changed')
+            self.assertEqual(tracing.get_trace(Settings, 'SETTING').origin, 'settings')
+
+    def test_disabled(self):
+        tracing.disable()
+        self.assertFalse(tracing.is_enabled())
+
+        class Settings(AppSettings):
+            SETTING = Setting('default')
+
+        self.assertEqual(Settings.SETTING, 'default')
+        self.assertIsNone(tracing.get_trace(Settings, 'SETTING'))
+        tracing.enable()
+        self.assertTrue(tracing.is_enabled())
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+import io
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+from django_pluggableappsettings.usage import analyze, find_python_files, format_text, module_name, resolve_class, \
+    scan_file
+
+logger = logging.getLogger(__name__)
+
+PACKAGE = 'usage_sample'
+
+FILES = {
+    '__init__.py': '',
+    'app_settings.py': '''
+from django_pluggableappsettings import AppSettings, ComputedSetting, Setting
+
+
+class SampleAppSettings(AppSettings):
+    USED = Setting('used')
+    UNUSED = Setting('unused')
+    INPUT = Setting(1)
+    COMPUTED = ComputedSetting(lambda value: value, depends_on=['INPUT'])
+
+
+class SubAppSettings(SampleAppSettings):
+    SUB_ONLY = Setting('sub')
+''',
+    'views.py': '''
+from .app_settings import SampleAppSettings as Settings
+from usage_sample import app_settings
+
+
+def view():
+    Settings.USED
+    app_settings.SampleAppSettings.USED
+    getattr(Settings, 'COMPUTED')
+    Settings.DEBUG
+    Settings.DEBUG
+    Settings.NOT_DEFINED_ANYWHERE
+    Settings.invalidate()
+    app_settings.SubAppSettings.SUB_ONLY
+    Settings.USED.upper()
+''',
+    'broken.py': 'def (:\n',
+    'sub/__init__.py': 'from ..app_settings import SampleAppSettings\n',
+    'skipped/__init__.py': '',
+    'skipped/module.py': 'from usage_sample.app_settings import SampleAppSettings\nSampleAppSettings.UNUSED\n',
+}
+
+CLASS = 'usage_sample.app_settings.SampleAppSettings'
+SUBCLASS = 'usage_sample.app_settings.SubAppSettings'
+
+
+class UsageTestCase(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.package = os.path.join(self.directory, PACKAGE)
+        for name, content in FILES.items():
+            path = os.path.join(self.package, name)
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with open(path, 'w') as f:
+                f.write(content)
+        sys.path.insert(0, self.directory)
+
+    def tearDown(self):
+        sys.path.remove(self.directory)
+        for name in list(sys.modules):
+            if name == PACKAGE or name.startswith(PACKAGE + '.'):
+                del sys.modules[name]
+        shutil.rmtree(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.package, name)
+
+    def test_module_name(self):
+        self.assertEqual(module_name(self.path('views.py')), 'usage_sample.views')
+        self.assertEqual(module_name(self.path('sub/__init__.py')), 'usage_sample.sub')
+        self.assertEqual(module_name(os.path.join(self.directory, 'script.py')), 'script')
+
+    def test_find_python_files(self):
+        files = find_python_files([self.directory], exclude=['skipped'])
+        self.assertIn(self.path('views.py'), files)
+        self.assertNotIn(self.path('skipped/module.py'), files)
+        self.assertEqual(find_python_files([self.path('views.py')]), [self.path('views.py')])
+
+    def test_scan_file(self):
+        path, accesses, classes, error = scan_file(self.path('views.py'))
+        self.assertIsNone(error)
+        self.assertEqual(classes, [])
+        self.assertIn((CLASS, 'USED', 7), accesses)
+        self.assertIn((CLASS, 'USED', 8), accesses)
+        self.assertIn((CLASS, 'COMPUTED', 9), accesses)
+        self.assertIn(('usage_sample.app_settings.SubAppSettings', 'SUB_ONLY', 14), accesses)
+
+        _, accesses, classes, _ = scan_file(self.path('app_settings.py'))
+        self.assertEqual(classes, [CLASS, SUBCLASS])
+
+        _, accesses, _, _ = scan_file(self.path('skipped/module.py'))
+        self.assertEqual(accesses, [(CLASS, 'UNUSED', 2)])
+
+        self.assertIsNotNone(scan_file(self.path('broken.py'))[3])
+
+    def test_resolve_class(self):
+        from usage_sample.app_settings import SampleAppSettings
+        self.assertIs(resolve_class(CLASS), SampleAppSettings)
+        self.assertIsNone(resolve_class(CLASS + '.USED'))
+        self.assertIsNone(resolve_class('usage_sample.app_settings.Missing'))
+        self.assertIsNone(resolve_class('does.not.Exist'))
+
+    def check_report(self, report):
+        self.assertEqual(sorted(report.appsettings), [CLASS, SUBCLASS])
+        self.assertEqual(report.get_unused(), [(CLASS, 'UNUSED')])
+        self.assertEqual(report.get_undeclared(), [(CLASS, 'DEBUG'), (CLASS, 'NOT_DEFINED_ANYWHERE')])
+        self.assertEqual(report.counts[(CLASS, 'USED')], 3)
+        self.assertEqual(report.counts[(CLASS, 'DEBUG')], 2)
+        self.assertEqual(list(report.errors), [self.path('broken.py')])
+
+    def test_analyze(self):
+        self.check_report(analyze([self.directory], jobs=1, exclude=['skipped']))
+
+    def test_analyze_parallel(self):
+        self.check_report(analyze([self.directory], jobs=2, exclude=['skipped']))
+
+    def test_analyze_exclude(self):
+        report = analyze([self.directory], jobs=1)
+        self.assertEqual(report.get_unused(), [])
+
+    def test_analyze_subclass_access(self):
+        # accessing an inherited setting through a subclass uses the setting of the base class
+        with open(self.path('skipped/module.py'), 'w') as f:
+            f.write('from usage_sample.app_settings import SubAppSettings\nSubAppSettings.UNUSED\n')
+        report = analyze([self.directory], jobs=1)
+        self.assertEqual(report.get_unused(), [])
+
+    def test_as_dict(self):
+        data = analyze([self.directory], jobs=1, exclude=['skipped']).as_dict()
+        self.assertEqual(data['unused'], [{'appsettings': CLASS, 'name': 'UNUSED'}])
+        self.assertEqual(data['undeclared'], [{
+            'appsettings': CLASS, 'name': 'DEBUG', 'count': 2, 'in_django_settings': True,
+            'locations': [self.path('views.py') + ':10', self.path('views.py') + ':11'],
+        }, {
+            'appsettings': CLASS, 'name': 'NOT_DEFINED_ANYWHERE', 'count': 1, 'in_django_settings': False,
+            'locations': [self.path('views.py') + ':12'],
+        }])
+
+    def test_format_text(self):
+        text = format_text(analyze([self.directory], jobs=1, exclude=['skipped']))
+        self.assertIn('Scanned 5 files and found 2 AppSettings classes.', text)
+        self.assertIn('Unused settings (1):\n  %s.UNUSED' % CLASS, text)
+        self.assertIn('  %s.DEBUG: 2 accesses\n' % CLASS, text)
+        self.assertIn('  %s.NOT_DEFINED_ANYWHERE: 1 accesses, not defined in the settings either' % CLASS, text)
+        self.assertIn('Files that could not be parsed (1):', text)
+
+    def test_command(self):
+        out = io.StringIO()
+        call_command('appsettings_usage', self.directory, '--exclude', 'skipped', '--format', 'json', '-j', '1',
+                     stdout=out)
+        data = json.loads(out.getvalue())
+        self.assertEqual(data['unused'], [{'appsettings': CLASS, 'name': 'UNUSED'}])
+
+        out = io.StringIO()
+        call_command('appsettings_usage', self.directory, '--exclude', 'skipped', stdout=out)
+        self.assertIn('Unused settings (1):', out.getvalue())
+
+    def test_command_errors(self):
+        self.assertRaisesMessage(CommandError, 'The path does-not-exist does not exist.',
+                                 call_command, 'appsettings_usage', 'does-not-exist')
+        self.assertRaisesMessage(CommandError, 'The number of jobs has to be at least 1.',
+                                 call_command, 'appsettings_usage', self.directory, '--jobs', '0')
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Optional tracing of the loading of settings values. While tracing is enabled, each load of a value records where the
+value came from (a source of the class, the name or alias it was found by in the settings.py, a computation or the
+default), whether a callable was called, which cast was performed and how long each step took:
+
+    from django_pluggableappsettings import tracing
+    tracing.enable()
+    MyAppSettings.invalidate()  # values that are already loaded are only traced when they are loaded again
+    MyAppSettings.SETTING
+    tracing.get_trace(MyAppSettings, 'SETTING')
+
+Tracing can also be enabled at startup by setting PLUGGABLEAPPSETTINGS_TRACING = True in the settings.py. Accessing
+loaded values is not affected by tracing.
+"""
+from __future__ import absolute_import
+import logging
+import time
+import weakref
+from time import perf_counter
+
+import django_pluggableappsettings
+from django_pluggableappsettings import _resolution_lock
+from django_pluggableappsettings.fingerprint import dotted_path
+
+logger = logging.getLogger(__name__)
+
+# The names of the pipeline stages in the traces
+STAGE_NAMES = {
+    '_load_value': 'source',
+    '_check_callable': 'check_callable',
+    '_call_value': 'call',
+    '_cast': 'cast',
+    '_validate': 'validate',
+    '_post_process': 'post_process',
+}
+
+# The latest trace of each setting by AppSettings class and attribute name
+_traces = weakref.WeakKeyDictionary()
+
+
+class ResolutionTrace(object):
+    """
+    The record of a single load of a settings value
+    """
+    def __init__(self, appsettings, name):
+        self.appsettings = dotted_path(appsettings)
+        self.name = name
+        # 'source', 'settings', 'computed' or 'default'
+        self.origin = None
+        # the source of the class that provided the value
+        self.source = None
+        # the name the value was found by in the settings.py
+        self.matched_name = None
+        # 'name', 'settings_name' or 'alias'
+        self.matched_by = None
+        self.default_used = False
+        self.callable_invoked = False
+        self.call_policy = None
+        # the types before and after the cast, e.g. 'str -> int'
+        self.cast = None
+        # a list of (step, seconds) tuples
+        self.timings = []
+        self.error = None
+        self.loaded_at = time.time()
+
+    @property
+    def seconds(self):
+        """
+        :return: the number of seconds all steps took together
+        """
+        return sum(seconds for _, seconds in self.timings)
+
+    def as_dict(self):
+        """
+        :return: the trace as dict that can e.g. be dumped as JSON
+        """
+        return {
+            'appsettings': self.appsettings,
+            'name': self.name,
+            'origin': self.origin,
+            'source': self.source,
+            'matched_name': self.matched_name,
+            'matched_by': self.matched_by,
+            'default_used': self.default_used,
+            'callable_invoked': self.callable_invoked,
+            'call_policy': self.call_policy,
+            'cast': self.cast,
+            'timings': [list(timing) for timing in self.timings],
+            'seconds': self.seconds,
+            'error': self.error,
+            'loaded_at': self.loaded_at,
+        }
+
+    def __repr__(self):
+        return '<%s %s.%s: %s>' % (self.__class__.__name__, self.appsettings, self.name, self.origin)
+
+
+def _record_lookup(trace, appsettings, name, setting):
+    """
+    Looks up the value of the setting and records where it was found
+    :return: the value
+    """
+    start = perf_counter()
+    value, origin, matched_name = appsettings._lookup(name, setting)
+    trace.timings.append(('lookup', perf_counter() - start))
+
+    if origin is None:
+        trace.origin = 'default'
+        trace.default_used = True
+    elif origin in ('settings', 'computed'):
+        trace.origin = origin
+    else:
+        trace.origin = 'source'
+        trace.source = repr(origin)
+
+    if matched_name is not None:
+        trace.matched_name = matched_name
+        if matched_name == setting.get_settings_name():
+            trace.matched_by = 'settings_name'
+        elif matched_name == name:
+            trace.matched_by = 'name'
+        else:
+            trace.matched_by = 'alias'
+    return value
+
+
+def _record_stages(trace, name, setting, value):
+    """
+    Passes the value through the stages that are applied when the setting is loaded and records each of them
+    :return: the value that is stored for the setting
+    """
+    for stage in setting.get_pipeline()[0]:
+        stage_name = STAGE_NAMES.get(stage.__name__, stage.__name__)
+        before = value
+        start = perf_counter()
+        value = stage(name, value)
+        trace.timings.append((stage_name, perf_counter() - start))
+        if stage_name == 'call':
+            trace.callable_invoked = hasattr(before, '__call__')
+        elif stage_name == 'cast':
+            trace.cast = '%s -> %s' % (type(before).__name__, type(value).__name__)
+    return value
+
+
+def trace_load(appsettings, name, setting):
+    """
+    Loads the value of a setting like the AppSettings class would and records a ResolutionTrace. Called by the
+    AppSettings class while tracing is enabled.
+    """
+    trace = ResolutionTrace(appsettings, name)
+    trace.call_policy = setting._call_policy
+    try:
+        value = _record_lookup(trace, appsettings, name, setting)
+        if setting._is_overwritten('get') or setting._is_overwritten('_get'):
+            # custom settings that do not use the pipeline can only be traced as a whole
+            start = perf_counter()
+            setting.get(name, value)
+            trace.timings.append(('get', perf_counter() - start))
+        else:
+            setting._value = _record_stages(trace, name, setting, value)
+    except Exception as e:
+        trace.error = '%s: %s' % (type(e).__name__, e)
+        raise
+    finally:
+        with _resolution_lock:
+            _traces.setdefault(appsettings, {})[name] = trace
+
+
+def enable():
+    """
+    Enables tracing. Only values that are loaded afterwards are traced.
+    """
+    django_pluggableappsettings._tracer = trace_load
+
+
+def disable():
+    """
+    Disables tracing. The recorded traces are kept.
+    """
+    django_pluggableappsettings._tracer = None
+
+
+def is_enabled():
+    return django_pluggableappsettings._tracer is not None
+
+
+def get_trace(appsettings, name):
+    """
+    :param appsettings: the AppSettings class
+    :param name: the attribute name of the setting
+    :return: the ResolutionTrace of the latest load of the setting or None if it has not been traced
+    """
+    with _resolution_lock:
+        return _traces.get(appsettings, {}).get(name)
+
+
+def get_traces(appsettings=None):
+    """
+    :param appsettings: an AppSettings class or None for all classes
+    :return: a list of the ResolutionTraces of the latest load of each traced setting
+    """
+    with _resolution_lock:
+        if appsettings is not None:
+            traces = list(_traces.get(appsettings, {}).values())
+        else:
+            traces = [trace for class_traces in _traces.values() for trace in class_traces.values()]
+    return sorted(traces, key=lambda trace: (trace.appsettings, trace.name))
+
+
+def export_traces(appsettings=None):
+    """
+    :param appsettings: an AppSettings class or None for all classes
+    :return: a list of all traces as dicts that can e.g. be dumped as JSON
+    """
+    return [trace.as_dict() for trace in get_traces(appsettings)]
+
+
+def clear_traces():
+    """
+    Drops all recorded traces
+    """
+    with _resolution_lock:
+        _traces.clear()
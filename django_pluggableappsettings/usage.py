@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""
+Static analysis of the accesses to AppSettings classes. The source files are parsed in parallel and all accesses of the
+form SomeAppSettings.NAME or getattr(SomeAppSettings, 'NAME') are collected, with SomeAppSettings resolved through the
+imports of each file. The accesses are then cross-referenced with the AppSettings classes to find declared settings
+that are never accessed and accesses to names that are not declared and therefore fall through to django.conf.settings.
+"""
+from __future__ import absolute_import
+import ast
+import inspect
+import logging
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+
+from django_pluggableappsettings import AppSettings, Setting, SettingsMetaClass
+
+logger = logging.getLogger(__name__)
+
+# directories that are never scanned
+EXCLUDED_DIRECTORIES = ('__pycache__', 'node_modules', 'site-packages')
+
+_MISSING = object()
+
+
+def module_name(path):
+    """
+    :param path: the path of a python file
+    :return: the dotted name the file is imported by, assuming the topmost directory with an __init__.py is a package
+        on the python path
+    """
+    directory, filename = os.path.split(os.path.abspath(path))
+    parts = [] if filename == '__init__.py' else [os.path.splitext(filename)[0]]
+    while os.path.isfile(os.path.join(directory, '__init__.py')):
+        directory, package = os.path.split(directory)
+        parts.insert(0, package)
+    return '.'.join(parts)
+
+
+def find_python_files(paths, exclude=()):
+    """
+    :param paths: files and directories to search
+    :param exclude: names of directories to skip in addition to hidden directories and EXCLUDED_DIRECTORIES
+    :return: a sorted list of the paths of all python files
+    """
+    excluded = set(EXCLUDED_DIRECTORIES) | set(exclude)
+    files = set()
+    for path in paths:
+        if os.path.isfile(path):
+            files.add(os.path.abspath(path))
+            continue
+        for directory, directories, filenames in os.walk(path):
+            directories[:] = [d for d in directories if not d.startswith('.') and d not in excluded]
+            files.update(os.path.abspath(os.path.join(directory, f)) for f in filenames if f.endswith('.py'))
+    return sorted(files)
+
+
+class _AccessCollector(ast.NodeVisitor):
+    """
+    Collects the attribute accesses of names that are resolved to the dotted path of a class through the imports and
+    class definitions of a module
+    """
+    def __init__(self, module, is_package=False):
+        self.module = module
+        self.package = module if is_package else module.rpartition('.')[0]
+        self.names = {}
+        self.accesses = []
+        self.classes = []
+
+    def resolve(self, node):
+        """
+        :return: the dotted path the expression refers to or None
+        """
+        if isinstance(node, ast.Name):
+            return self.names.get(node.id)
+        if isinstance(node, ast.Attribute):
+            base = self.resolve(node.value)
+            return None if base is None else '%s.%s' % (base, node.attr)
+        return None
+
+    def record(self, node, name):
+        path = self.resolve(node)
+        # only paths to classes can be AppSettings classes
+        if path is not None and path.rpartition('.')[2][:1].isupper():
+            self.accesses.append((path, name, node.lineno))
+
+    def visit_Import(self, node):
+        for alias in node.names:
+            if alias.asname:
+                self.names[alias.asname] = alias.name
+            else:
+                name = alias.name.partition('.')[0]
+                self.names[name] = name
+
+    def visit_ImportFrom(self, node):
+        module = node.module or ''
+        if node.level:
+            package = self.package.split('.') if self.package else []
+            if node.level > 1:
+                package = package[:-(node.level - 1)]
+            module = '.'.join(package + ([module] if module else []))
+        for alias in node.names:
+            if alias.name != '*':
+                self.names[alias.asname or alias.name] = '%s.%s' % (module, alias.name) if module else alias.name
+
+    def visit_ClassDef(self, node):
+        if node.col_offset == 0:
+            path = '%s.%s' % (self.module, node.name)
+            self.names[node.name] = path
+            if any('AppSettings' in (self.resolve(base) or '') for base in node.bases):
+                self.classes.append(path)
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node):
+        self.record(node.value, node.attr)
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        # getattr(SomeAppSettings, 'NAME')
+        if isinstance(node.func, ast.Name) and node.func.id == 'getattr' and len(node.args) >= 2:
+            # ast.Str on Python < 3.8
+            name = getattr(node.args[1], 'value', getattr(node.args[1], 's', None))
+            if isinstance(name, str):
+                self.record(node.args[0], name)
+        self.generic_visit(node)
+
+
+def scan_file(path):
+    """
+    Parses a python file. Runs in the worker processes, so it must not depend on Django being set up.
+    :return: a tuple of the path, the accesses as (class path, name, line number) tuples, the paths of the classes
+        defined in the file that derive from a class named like AppSettings and the syntax error or None
+    """
+    try:
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), path)
+    except (SyntaxError, ValueError) as e:
+        return path, [], [], str(e)
+    collector = _AccessCollector(module_name(path), os.path.basename(path) == '__init__.py')
+    collector.visit(tree)
+    return path, collector.accesses, collector.classes, None
+
+
+def resolve_class(path):
+    """
+    Imports the class with the given dotted path without accessing any settings
+    :return: the class or None if the path does not refer to a class
+    """
+    parts = path.split('.')
+    for index in range(len(parts) - 1, 0, -1):
+        try:
+            obj = import_module('.'.join(parts[:index]))
+        except ImportError:
+            continue
+        except Exception as e:
+            logger.warning('Could not import %s: %s', '.'.join(parts[:index]), e)
+            return None
+        for part in parts[index:]:
+            obj = inspect.getattr_static(obj, part, None)
+            if obj is None:
+                return None
+        return obj if inspect.isclass(obj) else None
+    return None
+
+
+def declaring_class(appsettings, name):
+    """
+    :return: the class of the MRO of the AppSettings class that declares the setting with the given name or None. The
+        settings a class inherits are copies, so settings are identified by the class declaring them.
+    """
+    for klass in appsettings.__mro__:
+        if isinstance(vars(klass).get(name), Setting):
+            return klass
+    return None
+
+
+class UsageReport(object):
+    """
+    The result of the analysis
+    """
+    def __init__(self, files):
+        self.files = files
+        # the AppSettings classes found by their dotted path
+        self.appsettings = {}
+        # the number of accesses of each (class path, name) and their locations as 'path:line'
+        self.counts = Counter()
+        self.locations = {}
+        self.errors = {}
+
+    def add_access(self, path, name, location):
+        key = (path, name)
+        self.counts[key] += 1
+        self.locations.setdefault(key, []).append(location)
+
+    def get_unused(self):
+        """
+        :return: a sorted list of (class path, name) tuples of the settings that are declared by a class, but are
+            neither accessed through the class or one of its subclasses nor an input of a computed setting
+        """
+        used = set()
+        for (path, name) in self.counts:
+            used.add((declaring_class(self.appsettings[path], name), name))
+        for appsettings in self.appsettings.values():
+            for name in appsettings._dependents:
+                used.add((declaring_class(appsettings, name), name))
+        unused = []
+        for path, appsettings in self.appsettings.items():
+            for name in appsettings._settings:
+                if name in vars(appsettings) and (appsettings, name) not in used:
+                    unused.append((path, name))
+        return sorted(unused)
+
+    def get_undeclared(self):
+        """
+        :return: a sorted list of (class path, name) tuples of the accessed names that are neither settings nor other
+            attributes of the class and are therefore looked up in django.conf.settings
+        """
+        undeclared = []
+        for path, name in self.counts:
+            appsettings = self.appsettings[path]
+            if name not in appsettings._settings and \
+                    inspect.getattr_static(appsettings, name, _MISSING) is _MISSING and \
+                    inspect.getattr_static(type(appsettings), name, _MISSING) is _MISSING:
+                undeclared.append((path, name))
+        return sorted(undeclared)
+
+    def as_dict(self):
+        """
+        :return: the report as dict that can e.g. be dumped as JSON
+        """
+        from django.conf import settings
+
+        def access(key):
+            return {
+                'appsettings': key[0],
+                'name': key[1],
+                'count': self.counts[key],
+                'locations': self.locations.get(key, []),
+            }
+
+        undeclared = []
+        for key in self.get_undeclared():
+            entry = access(key)
+            entry['in_django_settings'] = hasattr(settings, key[1])
+            undeclared.append(entry)
+        return {
+            'files': len(self.files),
+            'appsettings': sorted(self.appsettings),
+            'unused': [{'appsettings': path, 'name': name} for path, name in self.get_unused()],
+            'undeclared': undeclared,
+            'accesses': [access(key) for key in sorted(self.counts)],
+            'errors': self.errors,
+        }
+
+
+def analyze(paths, jobs=None, exclude=()):
+    """
+    Scans all python files in the given paths for accesses to AppSettings classes
+    :param paths: files and directories to scan
+    :param jobs: the number of worker processes. None for the number of CPUs, 1 to scan in the current process.
+    :param exclude: names of directories to skip
+    :return: a UsageReport
+    """
+    files = find_python_files(paths, exclude)
+    if jobs == 1 or len(files) <= 1:
+        results = [scan_file(path) for path in files]
+    else:
+        chunksize = max(1, len(files) // (4 * (jobs or os.cpu_count() or 1)))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(scan_file, files, chunksize=chunksize))
+
+    report = UsageReport(files)
+    resolved = {}
+
+    def resolve(path):
+        if path not in resolved:
+            cls = resolve_class(path)
+            is_appsettings = isinstance(cls, SettingsMetaClass) and cls is not AppSettings
+            resolved[path] = cls if is_appsettings else None
+            if is_appsettings:
+                report.appsettings[path] = cls
+        return resolved[path]
+
+    for file_path, accesses, classes, error in results:
+        if error is not None:
+            report.errors[file_path] = error
+        for path in classes:
+            resolve(path)
+        for path, name, line in accesses:
+            if resolve(path) is not None:
+                report.add_access(path, name, '%s:%d' % (file_path, line))
+    return report
+
+
+def format_text(report):
+    """
+    :param report: a UsageReport
+    :return: the report as human readable text
+    """
+    data = report.as_dict()
+    lines = ['Scanned %d files and found %d AppSettings classes.' % (data['files'], len(data['appsettings']))]
+    lines.append('')
+    lines.append('Unused settings (%d):' % len(data['unused']))
+    for entry in data['unused']:
+        lines.append('  %s.%s' % (entry['appsettings'], entry['name']))
+    lines.append('')
+    lines.append('Undeclared settings read from django.conf.settings (%d):' % len(data['undeclared']))
+    for entry in data['undeclared']:
+        lines.append('  %s.%s: %d accesses%s' % (
+            entry['appsettings'], entry['name'], entry['count'],
+            '' if entry['in_django_settings'] else ', not defined in the settings either'
+        ))
+        for location in entry['locations']:
+            lines.append('    %s' % location)
+    if data['errors']:
+        lines.append('')
+        lines.append('Files that could not be parsed (%d):' % len(data['errors']))
+        for path, error in sorted(data['errors'].items()):
+            lines.append('  %s: %s' % (path, error))
+    return '\n'.join(lines)
@@ -19,6 +19,9 @@ setup(
     packages=find_packages(exclude=['*.tests',]),
     include_package_data=True,
     install_requires=['Django >=2.2',],
+    entry_points={
+        'pytest11': ['django_pluggableappsettings = django_pluggableappsettings.test.pytest_plugin'],
+    },
     license='MIT License',
     description='A convenience class for providing default values for a django app setting.',
     long_description=long_description,